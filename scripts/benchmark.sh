@@ -377,6 +377,23 @@ benchmark_battery_usage() {
     log "SUCCESS" "Battery usage benchmark completed. Drain: ${battery_drain}%"
 }
 
+# Benchmark the Python tooling (no device needed)
+benchmark_tooling() {
+    log "INFO" "Benchmarking skill validation and asset rendering on synthetic catalogs..."
+    
+    if ! command -v python3 >/dev/null 2>&1; then
+        log "ERROR" "python3 not found"
+        exit 1
+    fi
+    
+    python3 "$PROJECT_ROOT/tools/tooling-bench.py" \
+        --results-dir "$RESULTS_DIR" \
+        --date "$BENCHMARK_DATE" \
+        ${TOOLING_SIZES:+--sizes "$TOOLING_SIZES"}
+    
+    log "SUCCESS" "Tooling benchmark completed"
+}
+
 # Generate comprehensive report
 generate_report() {
     log "INFO" "Generating comprehensive benchmark report..."
@@ -465,6 +482,7 @@ show_usage() {
     echo "  --quick         Run quick benchmark (launch + memory only)"
     echo "  --full          Run full benchmark suite (default)"
     echo "  --component     Run specific component benchmark"
+    echo "  --tooling       Benchmark the Python tooling only (no device needed)"
     echo "  --help          Show this help message"
     echo ""
     echo "Component options:"
@@ -480,6 +498,9 @@ show_usage() {
     echo "  $0                      # Run full benchmark"
     echo "  $0 --quick             # Run quick benchmark"
     echo "  $0 --component audio   # Run only audio benchmark"
+    echo "  $0 --tooling           # Time skill validation and asset rendering"
+    echo ""
+    echo "Set TOOLING_SIZES (e.g. 10,100,1000) to change the synthetic catalog sizes."
 }
 
 # Main benchmark function
@@ -498,6 +519,14 @@ main() {
     
     # Setup
     create_results_dir
+    
+    # The tooling benchmark runs on the host and writes JSON next to the device results
+    if [ "$benchmark_type" = "--tooling" ] || [ "$benchmark_type" = "tooling" ]; then
+        benchmark_tooling
+        log "INFO" "Results available in: $RESULTS_DIR/$BENCHMARK_DATE"
+        exit 0
+    fi
+    
     check_prerequisites
     get_device_info
     
@@ -0,0 +1,128 @@
+"""
+Incremental build cache for generated icons and store graphics
+
+Each output file is recorded with the key it was built from and the size,
+mtime and SHA-256 of the bytes written. A key hashes the render function,
+its params and encoding, the source of the generator modules and the
+Pillow version, so editing a generator or upgrading Pillow rebuilds
+everything it drew.
+
+An output is up to date when its key matches and the file still has the
+recorded size and mtime; that check is a stat call, so a run with nothing
+to do never renders or reads a PNG. When a render does happen, bytes equal
+to what is already on disk are not written again, which keeps file mtimes
+(and Gradle's incremental resource build) untouched.
+"""
+
+import io
+import os
+import sys
+import json
+import hashlib
+import tempfile
+from pathlib import Path
+from typing import Dict, Any, Iterable
+
+import PIL
+
+REPO_ROOT = Path(__file__).resolve().parent.parent.parent
+
+class AssetCache:
+    """Persistent record of which key produced each generated file"""
+
+    DEFAULT_PATH = str(REPO_ROOT / '.asset-build-cache.json')
+
+    def __init__(self, path: str = DEFAULT_PATH):
+        self.path = path
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self._sources: Dict[str, str] = {}
+        self._dirty = False
+        self._load()
+
+    def _load(self) -> None:
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self.entries = json.load(f).get('entries', {})
+        except (OSError, ValueError, AttributeError):
+            self.entries = {}
+
+    def _source_digest(self, source: str) -> str:
+        digest = self._sources.get(source)
+        if digest is None:
+            with open(source, 'rb') as f:
+                digest = self._sources[source] = hashlib.sha256(f.read()).hexdigest()[:16]
+        return digest
+
+    def key_for(self, render: str, params: Dict[str, Any], sources: Iterable[str],
+                encoding: str = 'png-default') -> str:
+        """Key of one render: function, params, encoding, generator sources and Pillow version"""
+        digest = hashlib.sha256()
+        digest.update(json.dumps([render, params, encoding, PIL.__version__], sort_keys=True).encode('utf-8'))
+        for source in sources:
+            digest.update(self._source_digest(os.path.abspath(source)).encode('ascii'))
+        return digest.hexdigest()[:32]
+
+    @staticmethod
+    def _name(output) -> str:
+        return os.path.abspath(output)
+
+    def is_current(self, output, key: str) -> bool:
+        """True if the file exists unchanged since it was built from this key"""
+        entry = self.entries.get(self._name(output))
+        if entry is None or entry['key'] != key:
+            return False
+        try:
+            stat = os.stat(output)
+        except OSError:
+            return False
+        return stat.st_size == entry['size'] and stat.st_mtime_ns == entry['mtime_ns']
+
+    def record(self, output, key: str, data: bytes) -> None:
+        stat = os.stat(output)
+        self.entries[self._name(output)] = {
+            'key': key,
+            'sha256': hashlib.sha256(data).hexdigest(),
+            'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns,
+        }
+        self._dirty = True
+
+    def write(self, output, key: str, data: bytes) -> bool:
+        """Write the bytes unless the file already holds them; returns True if written"""
+        path = Path(output)
+        changed = not same_bytes(path, data)
+        if changed:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            if path.exists():
+                path.unlink()  # never write through a hard link shared with another output
+            path.write_bytes(data)
+        self.record(path, key, data)
+        return changed
+
+    def save(self) -> None:
+        if not self._dirty:
+            return
+        directory = os.path.dirname(os.path.abspath(self.path))
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump({'entries': self.entries}, f)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"⚠️  Could not write asset cache {self.path}: {e}", file=sys.stderr)
+        self._dirty = False
+
+def same_bytes(path: Path, data: bytes) -> bool:
+    """True if the file exists and holds exactly these bytes"""
+    try:
+        if path.stat().st_size != len(data):
+            return False
+        return path.read_bytes() == data
+    except OSError:
+        return False
+
+def png_bytes(image) -> bytes:
+    """Encode a PIL image as PNG in memory"""
+    buffer = io.BytesIO()
+    image.save(buffer, 'PNG')
+    return buffer.getvalue()
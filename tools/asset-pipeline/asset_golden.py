@@ -0,0 +1,166 @@
+"""
+Golden-image regression checks for generated icons and store graphics
+
+Byte comparisons fail on every re-encode (optimizer settings, palette
+quantization, WebP), so each manifest output is recorded by what it looks
+like instead:
+
+- a 64-bit difference hash (dHash) of a 9x8 grayscale reduction
+- a thumbnail no larger than THUMBNAIL_SIZE on its longest side
+
+Both are taken after compositing over mid-grey, so a change in transparency
+counts as much as a change in colour. The index (golden.json) holds the
+hashes and image sizes, and the thumbnails sit next to it as small PNGs.
+
+An output drifts when its size changes, its hash is more than
+`hash_threshold` bits away, its thumbnail's mean channel difference exceeds
+`diff_threshold` (0-255), or more than `changed_threshold` of its thumbnail
+pixels (none by default) differ by more than PIXEL_THRESHOLD. The last one
+catches small local changes, such as an edited subtitle, that barely move
+the mean. The
+hash alone is not enough on the gradients, where a flat row of neighbours
+can flip bits on a 1-level change, so it only catches layout changes.
+Drifted outputs get a side-by-side diff image: golden, new, and the
+difference amplified.
+
+Entries are keyed by the output path without its extension, so a PNG
+golden still applies when the launcher icons are written as WebP. The index
+also notes the environment the goldens were recorded in (Pillow version and
+the font the store graphics resolved), because text drawn with a different
+font is real drift but not a regression in the generator.
+"""
+
+import os
+import json
+from pathlib import Path
+from typing import Dict, Any
+
+from PIL import Image, ImageChops, ImageStat
+
+THUMBNAIL_SIZE = 128
+HASH_WIDTH, HASH_HEIGHT = 9, 8
+
+DEFAULT_HASH_THRESHOLD = 10
+DEFAULT_DIFF_THRESHOLD = 2.0
+DEFAULT_CHANGED_THRESHOLD = 0.0
+
+# A thumbnail pixel counts as changed beyond this channel difference; re-encodes
+# (palette tolerance, WebP) stay within 2, an edited line of small text does not
+PIXEL_THRESHOLD = 8
+
+# Transparent pixels are judged against this backdrop
+BACKDROP = (128, 128, 128, 255)
+
+INDEX_NAME = 'golden.json'
+
+def golden_key(output: str) -> str:
+    return Path(output).with_suffix('').as_posix()
+
+def thumbnail_name(output: str) -> str:
+    return golden_key(output).replace('/', '--') + '.png'
+
+def flatten(image: Image.Image) -> Image.Image:
+    """RGB image with any transparency composited over the grey backdrop"""
+    if image.mode in ('RGBA', 'LA', 'P', 'PA') or 'transparency' in image.info:
+        image = image.convert('RGBA')
+        return Image.alpha_composite(Image.new('RGBA', image.size, BACKDROP), image).convert('RGB')
+    return image.convert('RGB')
+
+def thumbnail(image: Image.Image) -> Image.Image:
+    flat = flatten(image)
+    flat.thumbnail((THUMBNAIL_SIZE, THUMBNAIL_SIZE), Image.BOX)
+    return flat
+
+def dhash(thumb: Image.Image) -> str:
+    """Difference hash: one bit per horizontal neighbour pair of a 9x8 grayscale reduction"""
+    pixels = list(thumb.convert('L').resize((HASH_WIDTH, HASH_HEIGHT), Image.BOX).getdata())
+    bits = 0
+    for row in range(HASH_HEIGHT):
+        for column in range(HASH_WIDTH - 1):
+            left = pixels[row * HASH_WIDTH + column]
+            bits = (bits << 1) | (left > pixels[row * HASH_WIDTH + column + 1])
+    return f"{bits:016x}"
+
+def hash_distance(a: str, b: str) -> int:
+    return bin(int(a, 16) ^ int(b, 16)).count('1')
+
+def fingerprint(image: Image.Image) -> Dict[str, Any]:
+    thumb = thumbnail(image)
+    return {'size': list(image.size), 'dhash': dhash(thumb), 'thumbnail': thumb}
+
+class GoldenSet:
+    """The golden index and thumbnails in one directory"""
+
+    def __init__(self, directory):
+        self.directory = Path(directory)
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self.environment: Dict[str, Any] = {}
+        try:
+            with open(self.directory / INDEX_NAME, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            self.entries = data.get('entries', {})
+            self.environment = data.get('environment', {})
+        except (OSError, ValueError, AttributeError):
+            self.entries = {}
+
+    def record(self, output: str, image: Image.Image) -> None:
+        found = fingerprint(image)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        name = thumbnail_name(output)
+        found['thumbnail'].save(self.directory / name, 'PNG', optimize=True)
+        self.entries[golden_key(output)] = {'size': found['size'], 'dhash': found['dhash'], 'thumbnail': name}
+
+    def save(self) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with open(self.directory / INDEX_NAME, 'w', encoding='utf-8') as f:
+            json.dump({'thumbnail_size': THUMBNAIL_SIZE, 'environment': self.environment,
+                       'entries': dict(sorted(self.entries.items()))}, f, indent=2)
+            f.write('\n')
+
+    def compare(self, output: str, image: Image.Image, hash_threshold: int = DEFAULT_HASH_THRESHOLD,
+                diff_threshold: float = DEFAULT_DIFF_THRESHOLD,
+                changed_threshold: float = DEFAULT_CHANGED_THRESHOLD) -> Dict[str, Any]:
+        """Compare one render with its golden; 'status' is 'ok', 'drift' or 'missing'"""
+        entry = self.entries.get(golden_key(output))
+        result = {'output': output, 'status': 'missing', 'hash_distance': None, 'mean_diff': None,
+                  'changed': None, 'reasons': []}
+        if entry is None:
+            return result
+
+        found = fingerprint(image)
+        golden_thumb = Image.open(self.directory / entry['thumbnail']).convert('RGB')
+        result['hash_distance'] = hash_distance(entry['dhash'], found['dhash'])
+        result['thumbnails'] = (golden_thumb, found['thumbnail'])
+
+        if found['size'] != entry['size']:
+            result['reasons'].append(f"size {entry['size'][0]}x{entry['size'][1]} → {found['size'][0]}x{found['size'][1]}")
+        elif golden_thumb.size != found['thumbnail'].size:
+            result['reasons'].append("thumbnail size changed")
+        else:
+            difference = ImageChops.difference(golden_thumb, found['thumbnail'])
+            result['mean_diff'] = round(sum(ImageStat.Stat(difference).mean) / 3, 3)
+            # Largest channel difference per pixel, then the share above the pixel threshold
+            peak = ImageChops.lighter(ImageChops.lighter(*difference.split()[:2]), difference.getchannel(2))
+            histogram = peak.histogram()
+            result['changed'] = round(sum(histogram[PIXEL_THRESHOLD + 1:]) / max(1, sum(histogram)), 4)
+            if result['mean_diff'] > diff_threshold:
+                result['reasons'].append(f"mean difference {result['mean_diff']:.2f} > {diff_threshold:g}")
+            if result['changed'] > changed_threshold:
+                result['reasons'].append(f"{result['changed']:.2%} of pixels changed > {changed_threshold:.2%}")
+        if result['hash_distance'] > hash_threshold:
+            result['reasons'].append(f"hash distance {result['hash_distance']} > {hash_threshold}")
+        result['status'] = 'drift' if result['reasons'] else 'ok'
+        return result
+
+def write_diff(path, golden_thumb: Image.Image, new_thumb: Image.Image, gain: int = 4) -> None:
+    """Golden, new and the amplified difference side by side"""
+    width = max(golden_thumb.width, new_thumb.width)
+    height = max(golden_thumb.height, new_thumb.height)
+    sheet = Image.new('RGB', (width * 3, height), (0, 0, 0))
+    sheet.paste(golden_thumb, (0, 0))
+    sheet.paste(new_thumb, (width, 0))
+    if golden_thumb.size == new_thumb.size:
+        difference = ImageChops.difference(golden_thumb, new_thumb).point(lambda value: min(255, value * gain))
+        sheet.paste(difference, (width * 2, 0))
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    sheet.save(path, 'PNG')
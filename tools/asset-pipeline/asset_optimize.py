@@ -0,0 +1,125 @@
+"""
+Size optimization for generated icons and store graphics
+
+Pillow's default PNG encoder (compression level 6, no palette) is what the
+generators used to ship. optimize_png() tries the encodings below and keeps
+the smallest one, so the result is never larger than the default:
+
+- truecolor, re-encoded with Pillow's optimizer at maximum compression
+- an indexed palette, only when the image has at most 256 colours and the
+  palette round-trips within `tolerance` of the original; anti-aliased art
+  and gradients have more colours than a palette holds and skip this
+- with exhaustive=True (build_assets.py --release), each of those with the
+  image data re-deflated by every zlib strategy at the highest level and
+  memory setting; the pixels are not touched, but this costs a full deflate
+  of the image per strategy, so everyday builds leave it off
+
+encode_webp() writes lossless WebP at the slowest (smallest) effort, which
+Android loads for mipmap resources from API 18.
+"""
+
+import io
+import zlib
+import struct
+from typing import Dict, List, Any, Tuple
+
+from PIL import Image, ImageChops, features
+
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+# Largest channel difference a quantized palette may introduce
+DEFAULT_TOLERANCE = 2
+
+ZLIB_STRATEGIES = (zlib.Z_DEFAULT_STRATEGY, zlib.Z_FILTERED, zlib.Z_RLE)
+
+def webp_available() -> bool:
+    return features.check('webp')
+
+def default_png(image: Image.Image) -> bytes:
+    """The bytes the generators wrote before optimization (Pillow defaults)"""
+    buffer = io.BytesIO()
+    image.save(buffer, 'PNG')
+    return buffer.getvalue()
+
+def _save_png(image: Image.Image) -> bytes:
+    buffer = io.BytesIO()
+    image.save(buffer, 'PNG', optimize=True)
+    return buffer.getvalue()
+
+def max_difference(a: Image.Image, b: Image.Image) -> int:
+    """Largest per-channel difference between two images of the same size"""
+    if a.mode != b.mode:
+        b = b.convert(a.mode)
+    return max(high for _, high in ImageChops.difference(a, b).getextrema())
+
+def palette_image(image: Image.Image, tolerance: int = DEFAULT_TOLERANCE):
+    """Indexed copy of the image if it stays within tolerance of the original, else None"""
+    if image.mode not in ('RGB', 'RGBA'):
+        return None
+    colors = image.getcolors(256)
+    if colors is None:
+        return None
+    method = Image.Quantize.FASTOCTREE if image.mode == 'RGBA' else Image.Quantize.MEDIANCUT
+    indexed = image.quantize(colors=len(colors), method=method, dither=Image.Dither.NONE)
+    if max_difference(image, indexed.convert(image.mode)) > tolerance:
+        return None
+    return indexed
+
+def _chunks(data: bytes) -> List[Tuple[bytes, bytes]]:
+    chunks = []
+    offset = len(PNG_SIGNATURE)
+    while offset < len(data):
+        length, kind = struct.unpack('>I4s', data[offset:offset + 8])
+        chunks.append((kind, data[offset + 8:offset + 8 + length]))
+        offset += 12 + length
+    return chunks
+
+def _chunk(kind: bytes, body: bytes) -> bytes:
+    return struct.pack('>I', len(body)) + kind + body + struct.pack('>I', zlib.crc32(kind + body) & 0xffffffff)
+
+def recompress_png(data: bytes) -> bytes:
+    """Re-deflate the image data with every zlib strategy and keep the smallest PNG"""
+    chunks = _chunks(data)
+    raw = zlib.decompress(b''.join(body for kind, body in chunks if kind == b'IDAT'))
+    best = None
+    for strategy in ZLIB_STRATEGIES:
+        compressor = zlib.compressobj(9, zlib.DEFLATED, 15, 9, strategy)
+        candidate = compressor.compress(raw) + compressor.flush()
+        if best is None or len(candidate) < len(best):
+            best = candidate
+
+    out = [PNG_SIGNATURE]
+    for kind, body in chunks:
+        if kind == b'IDAT':
+            if best is not None:
+                out.append(_chunk(b'IDAT', best))
+                best = None  # one IDAT replaces all of them
+        else:
+            out.append(_chunk(kind, body))
+    result = b''.join(out)
+    return result if len(result) < len(data) else data
+
+def optimize_png(image: Image.Image, tolerance: int = DEFAULT_TOLERANCE,
+                 exhaustive: bool = False) -> Tuple[bytes, Dict[str, Any]]:
+    """Smallest PNG encoding of the image; info has the method and the default size"""
+    baseline = default_png(image)
+    candidates = [('truecolor', image)]
+    indexed = palette_image(image, tolerance)
+    if indexed is not None:
+        candidates.append(('palette', indexed))
+
+    best, method = baseline, 'default'
+    for name, candidate in candidates:
+        data = _save_png(candidate)
+        if exhaustive:
+            data = recompress_png(data)
+        if len(data) < len(best):
+            best, method = data, name
+    return best, {'method': method, 'default_bytes': len(baseline), 'bytes': len(best)}
+
+def encode_webp(image: Image.Image) -> Tuple[bytes, Dict[str, Any]]:
+    """Lossless WebP at maximum effort; info has the default PNG size for comparison"""
+    buffer = io.BytesIO()
+    image.save(buffer, 'WEBP', lossless=True, quality=100, method=6)
+    data = buffer.getvalue()
+    return data, {'method': 'webp', 'default_bytes': len(default_png(image)), 'bytes': len(data)}
@@ -0,0 +1,460 @@
+#!/usr/bin/env python3
+"""
+VoiceBridge Asset Pipeline (build_assets)
+
+Builds every launcher icon and Play Store graphic listed in assets.yaml in
+one command. Outputs with the same render and params are one target: each
+target is rendered once, targets are spread over a process pool (largest
+first), and the extra outputs of a target are hard-linked to the first one,
+or copied with --copy or where the filesystem cannot link.
+
+Builds are incremental (see asset_cache.py): targets whose outputs are up to
+date are not rendered, and rendered bytes that match the file on disk are
+not written, so a run with nothing to do leaves the tree untouched.
+
+PNGs go through the optimizer stage (see asset_optimize.py) unless
+--no-optimize is given; --release adds the slow exhaustive zlib search for
+the smallest files. .webp outputs are encoded as lossless WebP;
+--webp-mipmaps switches the launcher icons to WebP. Outputs whose bytes
+match another target's are linked as well, and the bytes saved against
+Pillow's default PNG encoding are reported per file and in total.
+
+--check-golden compares every output with the golden thumbnails and
+perceptual hashes in golden/ (see asset_golden.py) and fails on visual
+drift, writing diff images to --diff-dir; --update-golden records them.
+
+Usage:
+    python build_assets.py [--manifest assets.yaml] [--root .] [--jobs N] [--copy]
+    python build_assets.py --force [--cache-file .asset-build-cache.json]
+    python build_assets.py --webp-mipmaps [--tolerance 2] [--release | --no-optimize]
+    python build_assets.py --check-golden [--diff-dir build/golden-diff] | --update-golden
+    python build_assets.py --only 'store/*' --dry-run
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import fnmatch
+import hashlib
+import argparse
+import importlib
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, List, Any, Optional, Tuple
+
+import yaml
+from PIL import Image
+
+import asset_golden
+import asset_optimize
+from asset_cache import AssetCache, same_bytes
+
+PIPELINE_DIR = Path(__file__).resolve().parent
+TOOLS_DIR = PIPELINE_DIR.parent
+REPO_ROOT = TOOLS_DIR.parent
+MANIFEST = PIPELINE_DIR / "assets.yaml"
+GOLDEN_DIR = PIPELINE_DIR / "golden"
+DIFF_DIR = REPO_ROOT / "build" / "golden-diff"
+
+# The generators live in hyphenated directories, so they are imported by path
+GENERATOR_DIRS = (TOOLS_DIR / "icon-generator", TOOLS_DIR / "graphics-generator")
+
+# Manifest render names -> (generator module, function returning a PIL image)
+RENDERERS = {
+    'launcher_icon': ('generate_icons', 'render_voice_bridge_icon'),
+    'store_icon': ('generate_store_graphics', 'generate_high_res_icon'),
+    'feature_graphic': ('generate_store_graphics', 'generate_feature_graphic'),
+    'phone_screenshot': ('generate_store_graphics', 'generate_phone_screenshot'),
+    'tablet_screenshot': ('generate_store_graphics', 'generate_tablet_screenshot'),
+    'tv_banner': ('generate_store_graphics', 'generate_tv_banner'),
+    'tv_screenshot': ('generate_store_graphics', 'generate_tv_screenshot'),
+}
+
+# Sources whose code decides what each generator module draws
+GENERATOR_SOURCES = {
+    'generate_icons': (TOOLS_DIR / "icon-generator" / "generate_icons.py",
+                       TOOLS_DIR / "icon-generator" / "logo_scene.py"),
+    'generate_store_graphics': (TOOLS_DIR / "graphics-generator" / "generate_store_graphics.py",
+                                TOOLS_DIR / "graphics-generator" / "store_render.py",
+                                TOOLS_DIR / "icon-generator" / "logo_scene.py"),
+}
+
+# Output suffixes the pipeline can encode
+OUTPUT_FORMATS = ('.png', '.webp')
+
+def encoding_for(output: str, optimize: bool, release: bool = False) -> str:
+    """How an output is encoded: 'webp', 'png' (optimized), 'png-release' (exhaustive) or 'png-default'"""
+    if Path(output).suffix == '.webp':
+        return 'webp'
+    if not optimize:
+        return 'png-default'
+    return 'png-release' if release else 'png'
+
+def is_mipmap(output: str) -> bool:
+    return Path(output).parent.name.startswith('mipmap-')
+
+def _import_generators() -> None:
+    for directory in GENERATOR_DIRS:
+        if str(directory) not in sys.path:
+            sys.path.insert(0, str(directory))
+
+def load_manifest(path) -> List[Dict[str, Any]]:
+    """Manifest entries as {'output', 'render', 'params'}; raises ValueError on a bad manifest"""
+    with open(path, 'r', encoding='utf-8') as f:
+        data = yaml.safe_load(f)
+    if not isinstance(data, dict) or not isinstance(data.get('assets'), list):
+        raise ValueError(f"{path}: manifest must be a mapping with an 'assets' list")
+
+    assets = []
+    seen = set()
+    for index, entry in enumerate(data['assets']):
+        where = f"{path}: assets[{index}]"
+        if not isinstance(entry, dict):
+            raise ValueError(f"{where} must be a mapping")
+        output = entry.get('output')
+        render = entry.get('render')
+        params = entry.get('params') or {}
+        if not isinstance(output, str) or not output:
+            raise ValueError(f"{where} needs an 'output' path")
+        if os.path.isabs(output) or '..' in Path(output).parts:
+            raise ValueError(f"{where}: output '{output}' must be relative to the repository root")
+        if Path(output).suffix not in OUTPUT_FORMATS:
+            raise ValueError(f"{where}: output '{output}' must end in {' or '.join(OUTPUT_FORMATS)}")
+        if render not in RENDERERS:
+            raise ValueError(f"{where}: unknown render '{render}' (expected one of {', '.join(sorted(RENDERERS))})")
+        if not isinstance(params, dict):
+            raise ValueError(f"{where}: params must be a mapping")
+        if output in seen:
+            raise ValueError(f"{where}: output '{output}' is listed more than once")
+        seen.add(output)
+        assets.append({'output': output, 'render': render, 'params': params})
+    return assets
+
+class Target:
+    """One unique render and every output file it produces"""
+    __slots__ = ('render', 'params', 'encoding', 'outputs', 'key')
+
+    def __init__(self, render: str, params: Dict[str, Any], encoding: str):
+        self.render = render
+        self.params = params
+        self.encoding = encoding
+        self.outputs: List[str] = []
+        self.key = ''
+
+    @property
+    def cost(self) -> int:
+        """Pixel count, to schedule the largest renders first"""
+        if 'size' in self.params:
+            return self.params['size'] ** 2
+        return self.params.get('width', 0) * self.params.get('height', 0)
+
+    def describe(self) -> str:
+        params = ', '.join(f"{key}={value}" for key, value in sorted(self.params.items()))
+        return f"{self.render}({params})"
+
+    def cache_key(self, cache: AssetCache, tolerance: int) -> str:
+        module_name, function = RENDERERS[self.render]
+        sources = GENERATOR_SOURCES[module_name]
+        encoding = self.encoding
+        if encoding != 'png-default':
+            sources += (PIPELINE_DIR / "asset_optimize.py",)
+            encoding += f":{tolerance}" if encoding != 'webp' else ""
+        return cache.key_for(f"{module_name}.{function}", self.params, sources, encoding)
+
+def plan_targets(assets: List[Dict[str, Any]], optimize: bool = True, release: bool = False) -> List[Target]:
+    """Group outputs by identical render, params and encoding, in manifest order"""
+    targets: Dict[str, Target] = {}
+    for asset in assets:
+        encoding = encoding_for(asset['output'], optimize, release)
+        key = json.dumps([asset['render'], asset['params'], encoding], sort_keys=True)
+        target = targets.get(key)
+        if target is None:
+            target = targets[key] = Target(asset['render'], asset['params'], encoding)
+        target.outputs.append(asset['output'])
+    return list(targets.values())
+
+def render_target(render: str, params: Dict[str, Any], encoding: str,
+                  tolerance: int) -> Tuple[bytes, Dict[str, Any]]:
+    """Render and encode one target (runs in the worker processes)"""
+    _import_generators()
+    module_name, function = RENDERERS[render]
+    image = getattr(importlib.import_module(module_name), function)(**params)
+    if encoding == 'webp':
+        return asset_optimize.encode_webp(image)
+    if encoding in ('png', 'png-release'):
+        return asset_optimize.optimize_png(image, tolerance, exhaustive=encoding == 'png-release')
+    data = asset_optimize.default_png(image)
+    return data, {'method': 'default', 'default_bytes': len(data), 'bytes': len(data)}
+
+def timed_render(render: str, params: Dict[str, Any], encoding: str, tolerance: int):
+    """Encoded bytes of a target, their size report and the milliseconds spent"""
+    start = time.perf_counter()
+    data, info = render_target(render, params, encoding, tolerance)
+    return data, info, (time.perf_counter() - start) * 1000
+
+def place_duplicate(source: Path, destination: Path, copy: bool) -> str:
+    """Link (or copy) an identical output; returns 'linked' or 'copied'"""
+    if destination.exists():
+        if not copy and os.path.samefile(source, destination):
+            return 'linked'
+        destination.unlink()
+    if not copy:
+        try:
+            os.link(source, destination)
+            return 'linked'
+        except OSError:
+            pass  # different filesystem, or links not supported
+    shutil.copyfile(source, destination)
+    return 'copied'
+
+def remove_replaced(path: Path) -> Optional[Path]:
+    """Delete the other-format copy of a mipmap resource; aapt rejects ic_launcher.png next to ic_launcher.webp"""
+    for suffix in OUTPUT_FORMATS:
+        sibling = path.with_suffix(suffix)
+        if suffix != path.suffix and sibling.exists():
+            sibling.unlink()
+            return sibling
+    return None
+
+def write_target(target: Target, data: bytes, root: Path, copy: bool, cache: AssetCache,
+                 by_content: Dict[str, Path]) -> Dict[str, int]:
+    """Write a rendered target's outputs, leaving files that already hold these bytes alone
+
+    by_content maps the SHA-256 of every output written so far to its path,
+    so a target whose bytes match an earlier one is linked to it as well.
+    """
+    counts = {'written': 0, 'unchanged': 0, 'linked': 0, 'copied': 0}
+    digest = hashlib.sha256(data).hexdigest()
+    source = by_content.get(digest)
+    for output in target.outputs:
+        destination = root / output
+        if same_bytes(destination, data):
+            counts['unchanged'] += 1
+        elif source is None:
+            cache.write(destination, target.key, data)
+            counts['written'] += 1
+        else:
+            destination.parent.mkdir(parents=True, exist_ok=True)
+            counts[place_duplicate(source, destination, copy)] += 1
+        cache.record(destination, target.key, data)
+        if is_mipmap(output):
+            replaced = remove_replaced(destination)
+            if replaced is not None:
+                print(f"🗑️  Removed {replaced} (replaced by {destination.name})")
+        source = source or destination
+    by_content.setdefault(digest, source)
+    return counts
+
+def build(targets: List[Target], root: Path, jobs: int, copy: bool, cache: AssetCache,
+          force: bool = False, tolerance: int = asset_optimize.DEFAULT_TOLERANCE) -> Dict[str, Any]:
+    """Render every out-of-date target and write its outputs; per-target failures are collected"""
+    stats = {'targets': len(targets), 'outputs': sum(len(t.outputs) for t in targets), 'rendered': 0,
+             'up_to_date': 0, 'written': 0, 'unchanged': 0, 'linked': 0, 'copied': 0,
+             'default_bytes': 0, 'bytes': 0, 'files': [], 'failed': []}
+    start = time.perf_counter()
+    by_content: Dict[str, Path] = {}
+
+    stale = []
+    for target in targets:
+        target.key = target.cache_key(cache, tolerance)
+        if not force and all(cache.is_current(root / output, target.key) for output in target.outputs):
+            stats['up_to_date'] += len(target.outputs)
+        else:
+            stale.append(target)
+
+    def finish(target: Target, result: Optional[Tuple[bytes, Dict[str, Any], float]],
+               error: Optional[Exception]) -> None:
+        if error is not None:
+            stats['failed'].append({'target': target.describe(), 'error': str(error)})
+            print(f"❌ {target.describe()}: {error}")
+            return
+        data, info, elapsed_ms = result
+        stats['rendered'] += 1
+        counts = write_target(target, data, root, copy, cache, by_content)
+        for key, count in counts.items():
+            stats[key] += count
+        # Every output ships as its own file, so savings count once per output
+        for output in target.outputs:
+            stats['files'].append(dict(info, output=output))
+            stats['default_bytes'] += info['default_bytes']
+            stats['bytes'] += info['bytes']
+        extra = f" (+{len(target.outputs) - 1} duplicate)" if len(target.outputs) > 1 else ""
+        state = "" if counts['written'] + counts['linked'] + counts['copied'] else ", unchanged"
+        print(f"✅ {target.outputs[0]}{extra}  {elapsed_ms:.0f} ms{state}  "
+              f"{info['default_bytes']:,} → {info['bytes']:,} bytes "
+              f"({saved_percent(info['default_bytes'], info['bytes'])}, {info['method']})")
+
+    # Largest first, so one big screenshot does not finish alone at the end
+    ordered = sorted(stale, key=lambda target: target.cost, reverse=True)
+    if jobs <= 1 or len(ordered) <= 1:
+        for target in ordered:
+            try:
+                result, error = timed_render(target.render, target.params, target.encoding, tolerance), None
+            except Exception as e:
+                result, error = None, e
+            finish(target, result, error)
+    else:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(ordered)), initializer=_import_generators) as pool:
+            futures = {pool.submit(timed_render, target.render, target.params, target.encoding, tolerance): target
+                       for target in ordered}
+            for future in as_completed(futures):
+                try:
+                    result, error = future.result(), None
+                except Exception as e:
+                    result, error = None, e
+                finish(futures[future], result, error)
+
+    cache.save()
+    stats['elapsed_ms'] = (time.perf_counter() - start) * 1000
+    return stats
+
+def render_environment() -> Dict[str, str]:
+    """What outside the repository affects the pixels: Pillow and the font the store graphics use"""
+    _import_generators()
+    import PIL
+    import generate_store_graphics
+    path = getattr(generate_store_graphics.load_font(48), 'path', None)
+    return {'pillow': PIL.__version__, 'font': os.path.basename(path) if isinstance(path, str) else 'Pillow default'}
+
+def check_golden(targets: List[Target], root: Path, goldens: asset_golden.GoldenSet, diff_dir: Path,
+                 thresholds: Dict[str, float]) -> List[Dict[str, Any]]:
+    """Compare every output on disk with its golden, writing a diff image for each drift"""
+    results = []
+    for target in targets:
+        try:
+            # Duplicate outputs hold the same bytes, so each target is decoded once
+            with Image.open(root / target.outputs[0]) as image:
+                image.load()
+        except OSError as e:
+            results.extend({'output': output, 'status': 'unreadable', 'reasons': [str(e)]} for output in target.outputs)
+            continue
+        for output in target.outputs:
+            result = goldens.compare(output, image, **thresholds)
+            thumbnails = result.pop('thumbnails', None)
+            if result['status'] == 'drift' and thumbnails is not None:
+                result['diff'] = str(diff_dir / asset_golden.thumbnail_name(output))
+                asset_golden.write_diff(result['diff'], *thumbnails)
+            results.append(result)
+    return results
+
+def update_golden(targets: List[Target], root: Path, goldens: asset_golden.GoldenSet) -> int:
+    recorded = 0
+    for target in targets:
+        with Image.open(root / target.outputs[0]) as image:
+            image.load()
+        for output in target.outputs:
+            goldens.record(output, image)
+            recorded += 1
+    goldens.environment = render_environment()
+    goldens.save()
+    return recorded
+
+def saved_percent(before: int, after: int) -> str:
+    return f"-{(before - after) / before:.0%}" if before > after else "0%"
+
+def main():
+    parser = argparse.ArgumentParser(description='Build VoiceBridge icons and Play Store graphics from the asset manifest')
+    parser.add_argument('--manifest', default=str(MANIFEST), help='Asset manifest (default: assets.yaml next to this script)')
+    parser.add_argument('--root', default=str(REPO_ROOT), help='Directory the manifest output paths are relative to')
+    parser.add_argument('--jobs', '-j', type=int, default=os.cpu_count() or 1, help='Worker processes (1 renders serially)')
+    parser.add_argument('--copy', action='store_true', help='Copy duplicate outputs instead of hard-linking them')
+    parser.add_argument('--only', action='append', metavar='PATTERN', help='Only build outputs matching this glob (repeatable)')
+    parser.add_argument('--dry-run', action='store_true', help='Print the build plan without rendering')
+    parser.add_argument('--force', action='store_true', help='Render every target even if its outputs are up to date')
+    parser.add_argument('--cache-file', default=AssetCache.DEFAULT_PATH, help='Location of the incremental build cache')
+    level = parser.add_mutually_exclusive_group()
+    level.add_argument('--no-optimize', action='store_true', help="Write PNGs with Pillow's default encoder")
+    level.add_argument('--release', action='store_true',
+                       help='Also re-deflate optimized PNGs with every zlib strategy (slow; smallest files)')
+    parser.add_argument('--tolerance', type=int, default=asset_optimize.DEFAULT_TOLERANCE,
+                        help='Largest channel difference a palette PNG may introduce (0 keeps only exact palettes)')
+    parser.add_argument('--webp-mipmaps', action='store_true', help='Write the mipmap-* launcher icons as lossless WebP')
+    parser.add_argument('--check-golden', action='store_true', help='Fail if an output drifts visually from its golden')
+    parser.add_argument('--update-golden', action='store_true', help='Record the current outputs as the goldens')
+    parser.add_argument('--golden-dir', default=str(GOLDEN_DIR), help='Golden thumbnails and hashes')
+    parser.add_argument('--diff-dir', default=str(DIFF_DIR), help='Where --check-golden writes diff images')
+    parser.add_argument('--hash-threshold', type=int, default=asset_golden.DEFAULT_HASH_THRESHOLD,
+                        help='Largest perceptual hash distance (bits of 64) before an output drifts')
+    parser.add_argument('--diff-threshold', type=float, default=asset_golden.DEFAULT_DIFF_THRESHOLD,
+                        help='Largest mean thumbnail difference (0-255) before an output drifts')
+    parser.add_argument('--changed-threshold', type=float, default=asset_golden.DEFAULT_CHANGED_THRESHOLD,
+                        help='Largest share of visibly changed thumbnail pixels before an output drifts')
+
+    args = parser.parse_args()
+
+    try:
+        assets = load_manifest(args.manifest)
+    except (OSError, ValueError, yaml.YAMLError) as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+    if args.webp_mipmaps:
+        if not asset_optimize.webp_available():
+            print("❌ This Pillow build has no WebP support")
+            sys.exit(1)
+        for asset in assets:
+            if is_mipmap(asset['output']):
+                asset['output'] = str(Path(asset['output']).with_suffix('.webp'))
+
+    if args.only:
+        assets = [asset for asset in assets
+                  if any(fnmatch.fnmatch(asset['output'], pattern) for pattern in args.only)]
+    targets = plan_targets(assets, not args.no_optimize, args.release)
+    root = Path(args.root)
+
+    print(f"🎨 {len(assets)} outputs from {len(targets)} unique renders → {root}")
+    print(f"━" * 50)
+
+    if args.dry_run:
+        for target in targets:
+            print(f"{target.describe()}")
+            for output in target.outputs:
+                print(f"   → {output}")
+        return
+
+    stats = build(targets, root, max(1, args.jobs), args.copy, AssetCache(args.cache_file), args.force, args.tolerance)
+
+    if stats['rendered']:
+        print()
+    print(f"📦 {stats['rendered']} rendered, {stats['up_to_date']} up to date; {stats['written']} written, "
+          f"{stats['unchanged']} unchanged, {stats['linked']} linked, {stats['copied']} copied "
+          f"in {stats['elapsed_ms']:.0f} ms ({args.jobs} jobs)")
+    if stats['files']:
+        print(f"💾 {len(stats['files'])} files: {stats['bytes']:,} bytes vs {stats['default_bytes']:,} with default PNG "
+              f"encoding, {stats['default_bytes'] - stats['bytes']:,} bytes saved "
+              f"({saved_percent(stats['default_bytes'], stats['bytes'])})")
+    if stats['failed']:
+        print(f"❌ {len(stats['failed'])} renders failed")
+        sys.exit(1)
+
+    goldens = asset_golden.GoldenSet(args.golden_dir)
+    if args.update_golden:
+        recorded = update_golden(targets, root, goldens)
+        print(f"📸 Recorded {recorded} goldens in {args.golden_dir}")
+
+    if args.check_golden:
+        start = time.perf_counter()
+        thresholds = {'hash_threshold': args.hash_threshold, 'diff_threshold': args.diff_threshold,
+                      'changed_threshold': args.changed_threshold}
+        results = check_golden(targets, root, goldens, Path(args.diff_dir), thresholds)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        failed = [result for result in results if result['status'] != 'ok']
+        environment = render_environment()
+        print()
+        if goldens.environment and goldens.environment != environment:
+            recorded = ', '.join(f"{key} {value}" for key, value in sorted(goldens.environment.items()))
+            current = ', '.join(f"{key} {value}" for key, value in sorted(environment.items()))
+            print(f"⚠️  Goldens were recorded with {recorded}; this machine has {current}")
+        print(f"🔍 Golden check: {len(results) - len(failed)} of {len(results)} outputs match ({elapsed_ms:.0f} ms)")
+        for result in failed:
+            reasons = '; '.join(result['reasons']) or 'no golden recorded'
+            print(f"❌ {result['output']}: {result['status']} ({reasons})")
+            if result.get('diff'):
+                print(f"   diff: {result['diff']}")
+        if failed:
+            sys.exit(1)
+
+if __name__ == '__main__':
+    main()
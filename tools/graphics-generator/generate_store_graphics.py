@@ -2,13 +2,41 @@
 """
 VoiceBridge Play Store Graphics Generator
 Generates all required graphics for Google Play Store submission
+
+Usage:
+    python generate_store_graphics.py [--backend numpy|pil] [--force]
+    python generate_store_graphics.py --benchmark [--repeat 5]
 """
 
 import os
 import sys
+import time
+import statistics
 from PIL import Image, ImageDraw, ImageFont
 import argparse
 
+# Incremental build cache shared with tools/asset-pipeline, and the logo scene
+TOOLS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir)
+sys.path.insert(0, os.path.join(TOOLS_DIR, "asset-pipeline"))
+sys.path.insert(0, os.path.join(TOOLS_DIR, "icon-generator"))
+from asset_cache import AssetCache, png_bytes
+import logo_scene
+
+try:
+    import store_render
+except ImportError:  # NumPy not installed: draw everything with Pillow
+    store_render = None
+
+# 'numpy' builds gradients and layers as arrays, 'pil' draws them row by row
+BACKEND = 'numpy' if store_render is not None else 'pil'
+
+# Sources whose code decides what the graphics look like (both backends draw the same pixels)
+RENDER_SOURCES = (__file__, os.path.join(os.path.dirname(os.path.abspath(__file__)), "store_render.py"),
+                  logo_scene.__file__)
+
+# Largest channel difference allowed between the two backends (text anti-aliasing)
+BACKEND_TOLERANCE = 2
+
 # Play Store graphic requirements
 STORE_GRAPHICS = {
     'icon': (512, 512),  # High-res icon
@@ -19,8 +47,33 @@ STORE_GRAPHICS = {
     'tv_screenshot': (1920, 1080)  # Android TV screenshot
 }
 
+# Vertical gradient from blue to light blue: top colour and change over the height
+GRADIENT_TOP = (33, 150, 243)
+GRADIENT_DELTA = (13, 104, 12)
+
+def load_font(size, candidates=None):
+    """TrueType font at size, falling back to Pillow's default font"""
+    if store_render is not None:
+        return store_render.FONTS.get(size, candidates)
+    for path in candidates or ("/System/Library/Fonts/Arial.ttf", "arial.ttf"):
+        try:
+            return ImageFont.truetype(path, size)
+        except OSError:
+            continue
+    return ImageFont.load_default()
+
+def text_width(draw, text, font):
+    if store_render is not None:
+        bbox = store_render.text_box(font, text)
+    else:
+        bbox = draw.textbbox((0, 0), text, font=font)
+    return bbox[2] - bbox[0]
+
 def create_background_gradient(width, height):
     """Create a modern gradient background"""
+    if BACKEND == 'numpy':
+        return store_render.gradient_image(width, height, GRADIENT_TOP, GRADIENT_DELTA)
+    
     img = Image.new('RGB', (width, height))
     draw = ImageDraw.Draw(img)
     
@@ -36,20 +89,10 @@ def create_background_gradient(width, height):
 
 def add_logo_and_text(img, title, subtitle="", logo_size=None):
     """Add VoiceBridge logo and text to an image"""
-    draw = ImageDraw.Draw(img)
     width, height = img.size
     
-    # Try to load a font, fallback to default
-    try:
-        title_font = ImageFont.truetype("/System/Library/Fonts/Arial.ttf", 48)
-        subtitle_font = ImageFont.truetype("/System/Library/Fonts/Arial.ttf", 32)
-    except:
-        try:
-            title_font = ImageFont.truetype("arial.ttf", 48)
-            subtitle_font = ImageFont.truetype("arial.ttf", 32)
-        except:
-            title_font = ImageFont.load_default()
-            subtitle_font = ImageFont.load_default()
+    title_font = load_font(48)
+    subtitle_font = load_font(32)
     
     # Calculate logo position
     if logo_size is None:
@@ -57,132 +100,47 @@ def add_logo_and_text(img, title, subtitle="", logo_size=None):
     
     logo_x = (width - logo_size) // 2
     logo_y = height // 3 - logo_size // 2
+    title_y = logo_y + logo_size + 40
+    subtitle_y = title_y + 60
+    
+    # The numpy backend draws onto a transparent layer and composites it once;
+    # the layer only reaches down to the last line of text
+    if BACKEND == 'numpy':
+        canvas = img
+        last_font, last_text, last_y = (subtitle_font, subtitle, subtitle_y) if subtitle else (title_font, title, title_y)
+        layer_bottom = min(height, max(last_y + store_render.text_box(last_font, last_text)[3], logo_y + logo_size) + 1)
+        img = store_render.new_layer((width, layer_bottom))
+        ink = lambda color: store_render.layer_ink(color, canvas.mode)
+    else:
+        ink = lambda color: color
+    draw = ImageDraw.Draw(img)
     
-    # Draw microphone icon
-    mic_color = (255, 255, 255, 255)
-    mic_center_x = logo_x + logo_size // 2
-    mic_center_y = logo_y + logo_size // 2
-    mic_size = logo_size // 2
-    
-    # Microphone body
-    mic_body_width = mic_size // 3
-    mic_body_height = mic_size // 2
-    mic_body_x = mic_center_x - mic_body_width // 2
-    mic_body_y = mic_center_y - mic_body_height // 2
-    
-    draw.rounded_rectangle([
-        (mic_body_x, mic_body_y),
-        (mic_body_x + mic_body_width, mic_body_y + mic_body_height)
-    ], mic_body_width // 4, fill=mic_color)
-    
-    # Microphone stand
-    stand_width = 3
-    stand_height = logo_size // 8
-    stand_x = mic_center_x - stand_width // 2
-    stand_y = mic_center_y + mic_body_height // 4
-    
-    draw.rectangle([
-        (stand_x, stand_y),
-        (stand_x + stand_width, stand_y + stand_height)
-    ], fill=mic_color)
-    
-    # Sound waves
-    for i in range(2):
-        wave_radius = mic_size // 3 + (i + 1) * logo_size // 12
-        wave_box = [
-            (mic_center_x - wave_radius, mic_center_y - wave_radius),
-            (mic_center_x + wave_radius, mic_center_y + wave_radius)
-        ]
-        draw.arc(wave_box, start=-30, end=30, fill=mic_color, width=3)
-        draw.arc(wave_box, start=150, end=210, fill=mic_color, width=3)
+    # Logo mark from the shared supersampled logo render
+    mark = logo_scene.render_mark(logo_size)
+    if BACKEND == 'numpy':
+        img.paste(mark, (logo_x, logo_y))
+    else:
+        img.paste(mark, (logo_x, logo_y), mark)
     
     # Add title text
-    title_bbox = draw.textbbox((0, 0), title, font=title_font)
-    title_width = title_bbox[2] - title_bbox[0]
+    title_width = text_width(draw, title, title_font)
     title_x = (width - title_width) // 2
-    title_y = logo_y + logo_size + 40
     
-    draw.text((title_x, title_y), title, fill=(255, 255, 255), font=title_font)
+    draw.text((title_x, title_y), title, fill=ink((255, 255, 255)), font=title_font)
     
     # Add subtitle if provided
     if subtitle:
-        subtitle_bbox = draw.textbbox((0, 0), subtitle, font=subtitle_font)
-        subtitle_width = subtitle_bbox[2] - subtitle_bbox[0]
+        subtitle_width = text_width(draw, subtitle, subtitle_font)
         subtitle_x = (width - subtitle_width) // 2
-        subtitle_y = title_y + 60
         
-        draw.text((subtitle_x, subtitle_y), subtitle, fill=(255, 255, 255, 200), font=subtitle_font)
+        draw.text((subtitle_x, subtitle_y), subtitle, fill=ink((255, 255, 255, 200)), font=subtitle_font)
+    
+    if BACKEND == 'numpy':
+        store_render.composite_over(canvas, img)
 
 def generate_high_res_icon():
     """Generate 512x512 high-resolution icon"""
-    size = 512
-    img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(img)
-    
-    # Background color
-    bg_color = (33, 150, 243, 255)
-    corner_radius = size // 8
-    draw.rounded_rectangle([(0, 0), (size, size)], corner_radius, fill=bg_color)
-    
-    # Microphone icon (larger and more detailed)
-    mic_center_x = size // 2
-    mic_center_y = size // 2
-    mic_size = size // 2
-    
-    # Microphone body
-    mic_body_width = mic_size // 2
-    mic_body_height = mic_size // 1.5
-    mic_body_x = mic_center_x - mic_body_width // 2
-    mic_body_y = mic_center_y - mic_body_height // 2
-    
-    draw.rounded_rectangle([
-        (mic_body_x, mic_body_y),
-        (mic_body_x + mic_body_width, mic_body_y + mic_body_height)
-    ], mic_body_width // 3, fill=(255, 255, 255, 255))
-    
-    # Microphone details
-    detail_size = mic_body_width // 8
-    for i in range(3):
-        detail_y = mic_body_y + mic_body_height // 4 + i * (mic_body_height // 6)
-        draw.ellipse([
-            (mic_center_x - detail_size, detail_y),
-            (mic_center_x + detail_size, detail_y + detail_size)
-        ], fill=(33, 150, 243, 255))
-    
-    # Microphone stand
-    stand_width = 6
-    stand_height = size // 8
-    stand_x = mic_center_x - stand_width // 2
-    stand_y = mic_center_y + mic_body_height // 2
-    
-    draw.rectangle([
-        (stand_x, stand_y),
-        (stand_x + stand_width, stand_y + stand_height)
-    ], fill=(255, 255, 255, 255))
-    
-    # Microphone base
-    base_width = size // 4
-    base_height = 8
-    base_x = mic_center_x - base_width // 2
-    base_y = stand_y + stand_height
-    
-    draw.rounded_rectangle([
-        (base_x, base_y),
-        (base_x + base_width, base_y + base_height)
-    ], base_height // 2, fill=(255, 255, 255, 255))
-    
-    # Sound waves
-    wave_color = (255, 255, 255, 200)
-    for i in range(4):
-        wave_radius = mic_size // 2 + (i + 1) * size // 16
-        wave_box = [
-            (mic_center_x - wave_radius, mic_center_y - wave_radius),
-            (mic_center_x + wave_radius, mic_center_y + wave_radius)
-        ]
-        draw.arc(wave_box, start=-45, end=45, fill=wave_color, width=4)
-        draw.arc(wave_box, start=135, end=225, fill=wave_color, width=4)
-    
-    return img
+    return logo_scene.render_logo(STORE_GRAPHICS['icon'][0])
 
 def generate_feature_graphic():
     """Generate 1024x500 feature graphic"""
@@ -198,9 +156,8 @@ def generate_feature_graphic():
     
     return img
 
-def generate_phone_screenshot():
+def generate_phone_screenshot(width=1080, height=1920):
     """Generate phone screenshot mockup"""
-    width, height = 1080, 1920
     img = create_background_gradient(width, height)
     
     # Add phone UI mockup
@@ -214,12 +171,8 @@ def generate_phone_screenshot():
     content_y = 200
     
     # App title
-    try:
-        title_font = ImageFont.truetype("arial.ttf", 40)
-        text_font = ImageFont.truetype("arial.ttf", 28)
-    except:
-        title_font = ImageFont.load_default()
-        text_font = ImageFont.load_default()
+    title_font = load_font(40, ("arial.ttf",))
+    text_font = load_font(28, ("arial.ttf",))
     
     draw.text((content_margin, content_y), "VoiceBridge", fill=(255, 255, 255), font=title_font)
     
@@ -259,9 +212,8 @@ def generate_phone_screenshot():
     
     return img
 
-def generate_tablet_screenshot():
+def generate_tablet_screenshot(width=1200, height=1920):
     """Generate tablet screenshot mockup"""
-    width, height = 1200, 1920
     img = create_background_gradient(width, height)
     
     # Similar to phone but with more content
@@ -274,33 +226,130 @@ def generate_tablet_screenshot():
     
     return img
 
+def generate_tv_banner(width=1280, height=720):
+    """Generate Android TV banner"""
+    img = create_background_gradient(width, height)
+    
+    add_logo_and_text(
+        img,
+        "VoiceBridge",
+        "Voice Form Filling for Android TV",
+        logo_size=height // 4
+    )
+    
+    return img
+
+def generate_tv_screenshot(width=1920, height=1080):
+    """Generate Android TV screenshot mockup"""
+    img = create_background_gradient(width, height)
+    
+    add_logo_and_text(
+        img,
+        "VoiceBridge on Android TV",
+        "Fill forms from the couch with your voice",
+        logo_size=height // 5
+    )
+    
+    return img
+
+def _size(width_height):
+    return {'width': width_height[0], 'height': width_height[1]}
+
+# Renders covered by the output files and by --benchmark: (file, function, params)
+GRAPHICS = [
+    ("ic_launcher_512.png", generate_high_res_icon, {}),
+    ("feature_graphic.png", generate_feature_graphic, {}),
+    ("phone_screenshot_1.png", generate_phone_screenshot, _size(STORE_GRAPHICS['phone_screenshots'][0])),
+    ("phone_screenshot_2.png", generate_phone_screenshot, _size(STORE_GRAPHICS['phone_screenshots'][1])),
+    ("tablet_screenshot_1.png", generate_tablet_screenshot, _size(STORE_GRAPHICS['tablet_screenshots'][0])),
+    ("tablet_screenshot_2.png", generate_tablet_screenshot, _size(STORE_GRAPHICS['tablet_screenshots'][1])),
+    ("tv_banner.png", generate_tv_banner, _size(STORE_GRAPHICS['tv_banner'])),
+    ("tv_screenshot.png", generate_tv_screenshot, _size(STORE_GRAPHICS['tv_screenshot'])),
+]
+
+def render_with(backend, render):
+    """Render with a backend; 'pil' also starts from cold font lookups, as the generator used to"""
+    global BACKEND
+    previous, BACKEND = BACKEND, backend
+    try:
+        if backend == 'pil' and store_render is not None:
+            store_render.FONTS.clear()
+        return render()
+    finally:
+        BACKEND = previous
+
+def benchmark(repeat):
+    """Per-image render time with both backends and the pixel difference between them"""
+    if store_render is None:
+        print("❌ NumPy is not installed; only the pil backend is available")
+        return False
+    
+    renders = [(name, lambda function=function, params=params: function(**params))
+               for name, function, params in GRAPHICS]
+    for name, size in STORE_GRAPHICS.items():
+        for width, height in (size if isinstance(size, list) else [size]):
+            renders.append((f"gradient {name} {width}x{height}",
+                            lambda width=width, height=height: create_background_gradient(width, height)))
+    
+    print(f"⏱️  Render time per image, median of {repeat} (pil → numpy)")
+    print(f"━" * 50)
+    within = True
+    for name, render in renders:
+        times = {}
+        images = {}
+        for backend in ('pil', 'numpy'):
+            samples = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                images[backend] = render_with(backend, render)
+                samples.append(time.perf_counter() - start)
+            times[backend] = statistics.median(samples) * 1000
+        difference = store_render.pixel_difference(images['pil'], images['numpy'])
+        ok = difference['max'] <= BACKEND_TOLERANCE
+        within = within and ok
+        status = "✅" if ok else "❌"
+        print(f"{status} {name:<36} {times['pil']:8.2f} ms → {times['numpy']:8.2f} ms "
+              f"({times['pil'] / times['numpy']:.1f}x)  max diff {difference['max']:.0f}, "
+              f"{difference['differing']:.2%} pixels differ")
+    return within
+
 def main():
     """Generate all Play Store graphics"""
+    global BACKEND
+    parser = argparse.ArgumentParser(description='Generate VoiceBridge Play Store graphics')
+    parser.add_argument('--backend', choices=['numpy', 'pil'], default=BACKEND, help='Rendering backend')
+    parser.add_argument('--benchmark', action='store_true', help='Compare render time and pixels of both backends')
+    parser.add_argument('--repeat', type=int, default=5, help='Renders per image for --benchmark')
+    parser.add_argument('--force', action='store_true', help='Render every graphic even if it is up to date')
+    
+    args = parser.parse_args()
+    
+    if args.benchmark:
+        sys.exit(0 if benchmark(args.repeat) else 1)
+    
+    if args.backend == 'numpy' and store_render is None:
+        print("NumPy is not installed; falling back to the pil backend")
+        args.backend = 'pil'
+    BACKEND = args.backend
+    
     print("Generating Play Store graphics for VoiceBridge...")
     
     # Create output directory
     output_dir = "store/graphics/generated"
     os.makedirs(output_dir, exist_ok=True)
     
-    # Generate high-res icon
-    print("Generating high-resolution icon...")
-    icon = generate_high_res_icon()
-    icon.save(os.path.join(output_dir, "ic_launcher_512.png"), 'PNG')
-    
-    # Generate feature graphic
-    print("Generating feature graphic...")
-    feature_graphic = generate_feature_graphic()
-    feature_graphic.save(os.path.join(output_dir, "feature_graphic.png"), 'PNG')
-    
-    # Generate phone screenshots
-    print("Generating phone screenshots...")
-    phone_screenshot = generate_phone_screenshot()
-    phone_screenshot.save(os.path.join(output_dir, "phone_screenshot_1.png"), 'PNG')
-    
-    # Generate tablet screenshot
-    print("Generating tablet screenshot...")
-    tablet_screenshot = generate_tablet_screenshot()
-    tablet_screenshot.save(os.path.join(output_dir, "tablet_screenshot_1.png"), 'PNG')
+    # Skip graphics that are up to date and never rewrite identical bytes
+    cache = AssetCache()
+    for filename, function, params in GRAPHICS:
+        output_path = os.path.join(output_dir, filename)
+        key = cache.key_for(f"generate_store_graphics.{function.__name__}", params, RENDER_SOURCES)
+        if not args.force and cache.is_current(output_path, key):
+            print(f"Up to date: {filename}")
+            continue
+        print(f"Generating {filename}...")
+        if not cache.write(output_path, key, png_bytes(function(**params))):
+            print(f"Unchanged: {filename}")
+    cache.save()
     
     print("All Play Store graphics generated successfully!")
     print(f"Graphics saved to: {output_dir}")
@@ -0,0 +1,138 @@
+"""
+Resolution-independent VoiceBridge logo
+
+The logo is described once, in units of the icon's side (0.0 - 1.0), as a
+list of shapes. Every size is derived from a single master render:
+
+- the scene is drawn once at MASTER_SIZE (4x the largest store icon)
+- a mip chain premultiplies alpha once and halves it with a 2x2 box filter
+- each requested size is area-averaged (box filter) from the smallest level
+  that is still at least as large, then un-premultiplied; unlike Lanczos
+  this adds no ringing around the edges, which also keeps the PNGs smaller
+
+so the launcher densities, the 512px store icon and the logo on the store
+graphics all share one draw and the same anti-aliasing, and no shape ends up
+with a fixed pixel width that looks different at each density.
+"""
+
+from functools import lru_cache
+from typing import Dict, List, Any, Tuple
+
+from PIL import Image, ImageDraw
+
+# Largest size derived from the master (the Play Store icon) and the supersampling factor
+LARGEST_SIZE = 512
+SUPERSAMPLE = 4
+MASTER_SIZE = LARGEST_SIZE * SUPERSAMPLE
+
+BLUE = (33, 150, 243, 255)  # Material Blue 500
+WHITE = (255, 255, 255, 255)
+WAVE = (255, 255, 255, 180)  # Semi-transparent white
+
+def _logo_scene() -> List[Dict[str, Any]]:
+    # Microphone body centred on the icon, a third of its height
+    body_w, body_h = 1 / 6, 1 / 3
+    body = (0.5 - body_w / 2, 0.5 - body_h / 2, 0.5 + body_w / 2, 0.5 + body_h / 2)
+    stand_w, stand_h = 1 / 48, 1 / 6
+    base_w, base_h = 1 / 6, 1 / 32
+    grille = body_w / 8
+
+    scene = [
+        {'shape': 'rounded_rectangle', 'box': (0, 0, 1, 1), 'radius': 1 / 8, 'fill': BLUE, 'layer': 'background'},
+        {'shape': 'rounded_rectangle', 'box': body, 'radius': body_w / 4, 'fill': WHITE},
+        {'shape': 'rectangle', 'box': (0.5 - stand_w / 2, body[3], 0.5 + stand_w / 2, body[3] + stand_h), 'fill': WHITE},
+        {'shape': 'rounded_rectangle', 'box': (0.5 - base_w / 2, body[3] + stand_h, 0.5 + base_w / 2, body[3] + stand_h + base_h),
+         'radius': base_h / 2, 'fill': WHITE},
+    ]
+    # Grille slots on the microphone body
+    for i in range(3):
+        y = body[1] + body_h / 4 + i * body_h / 6
+        scene.append({'shape': 'ellipse', 'box': (0.5 - grille, y, 0.5 + grille, y + grille), 'fill': BLUE})
+    # Sound waves on both sides
+    for i in range(3):
+        radius = body_h / 2 + (i + 1) / 12
+        box = (0.5 - radius, 0.5 - radius, 0.5 + radius, 0.5 + radius)
+        for start, end in ((-45, 45), (135, 225)):
+            scene.append({'shape': 'arc', 'box': box, 'start': start, 'end': end, 'width': 1 / 48, 'fill': WAVE})
+    return scene
+
+# Full launcher icon, and the mark alone (no background) for the store graphics
+LOGO_SCENE = _logo_scene()
+MARK_SCENE = [shape for shape in LOGO_SCENE if shape.get('layer') != 'background']
+
+SCENES = {'logo': LOGO_SCENE, 'mark': MARK_SCENE}
+
+def draw_scene(scene: List[Dict[str, Any]], size: int) -> Image.Image:
+    """Draw a scene directly at one size (used for the master render)"""
+    img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(img)
+    scale = lambda box: [coordinate * size for coordinate in box]
+    for shape in scene:
+        kind = shape['shape']
+        if kind == 'rounded_rectangle':
+            draw.rounded_rectangle(scale(shape['box']), shape['radius'] * size, fill=shape['fill'])
+        elif kind == 'rectangle':
+            draw.rectangle(scale(shape['box']), fill=shape['fill'])
+        elif kind == 'ellipse':
+            draw.ellipse(scale(shape['box']), fill=shape['fill'])
+        elif kind == 'arc':
+            draw.arc(scale(shape['box']), start=shape['start'], end=shape['end'], fill=shape['fill'],
+                     width=max(1, round(shape['width'] * size)))
+        else:
+            raise ValueError(f"Unknown scene shape '{kind}'")
+    return img
+
+# Premultiplied modes, so filtering does not bleed colour out of transparent pixels
+PREMULTIPLIED = {'RGBA': 'RGBa', 'LA': 'La'}
+
+class MipChain:
+    """A master render and its successive halvings, resampled to any size on request"""
+
+    def __init__(self, master: Image.Image):
+        self.mode = master.mode
+        # Converting once here saves Pillow doing it again for every resize
+        self.levels = [master.convert(PREMULTIPLIED[master.mode]) if master.mode in PREMULTIPLIED else master]
+        self.sizes: Dict[Tuple[int, int], Image.Image] = {}
+
+    def _level_for(self, width: int, height: int) -> Image.Image:
+        # Halve until the next level would be smaller than the request
+        while True:
+            level = self.levels[-1]
+            half = (level.width // 2, level.height // 2)
+            if half[0] < width or half[1] < height or min(half) < 1:
+                break
+            self.levels.append(level.reduce(2))
+        for level in self.levels:
+            if level.width // 2 < width or level.height // 2 < height:
+                return level
+        return self.levels[-1]
+
+    def get(self, width: int, height: int) -> Image.Image:
+        """The image at this size (a copy callers may draw on)"""
+        image = self.sizes.get((width, height))
+        if image is None:
+            level = self._level_for(width, height)
+            if level.size != (width, height):
+                level = level.resize((width, height), Image.BOX)
+            image = level.convert(self.mode) if level.mode != self.mode else level
+            self.sizes[(width, height)] = image
+        return image.copy()
+
+@lru_cache(maxsize=None)
+def chain(name: str) -> MipChain:
+    """Mip chain of a named scene, drawn once per process"""
+    return MipChain(draw_scene(SCENES[name], MASTER_SIZE))
+
+def render(name: str, size: int) -> Image.Image:
+    if size > LARGEST_SIZE:
+        # Beyond the shared master: supersample this size on its own
+        return MipChain(draw_scene(SCENES[name], size * SUPERSAMPLE)).get(size, size)
+    return chain(name).get(size, size)
+
+def render_logo(size: int) -> Image.Image:
+    """Launcher icon at size x size"""
+    return render('logo', size)
+
+def render_mark(size: int) -> Image.Image:
+    """Logo mark without its background, for placing on other artwork"""
+    return render('mark', size)
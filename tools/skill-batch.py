@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+VoiceBridge Batch Skill Executor (skill-batch)
+
+Runs a skill's validation and postprocess actions over a CSV or JSON-Lines
+file of records, the way SkillEngine.executeSkill handles a single map, and
+writes one JSON result per input row. Input is streamed in chunks, so memory
+stays flat regardless of file size.
+
+CSV cells that are empty are treated as missing fields, like a key that is
+absent from the map handed to executeSkill.
+
+Usage:
+    python skill-batch.py skills/forms/medical_intake.yaml records.csv [-o results.jsonl]
+    python skill-batch.py skills/forms/tax_preparation.yaml records.jsonl --chunk-size 20000
+"""
+
+import os
+import sys
+import csv
+import json
+import time
+import argparse
+from itertools import islice, zip_longest
+from typing import Dict, List, Any, Iterator, Optional, Tuple
+
+from skill_executor import ColumnResult, SkillExecutor
+
+DEFAULT_CHUNK_SIZE = 10000
+
+# field -> column, row count, and input errors by row offset within the chunk
+Chunk = Tuple[Dict[str, List[Optional[str]]], int, Dict[int, str]]
+
+def _cell(value: Any) -> Optional[str]:
+    if value is None:
+        return None
+    return value if isinstance(value, str) else str(value)
+
+def read_csv_chunks(f, fields: List[str], chunk_size: int) -> Iterator[Chunk]:
+    """Yield field -> column chunks from a CSV file with a header row"""
+    reader = csv.reader(f)
+    header = next(reader, [])
+    positions = {name: index for index, name in enumerate(header) if name in fields}
+
+    while True:
+        rows = list(islice(reader, chunk_size))
+        if not rows:
+            return
+        # Short rows are padded with empty cells, which read as missing fields
+        transposed = list(zip_longest(*rows, fillvalue=''))
+        columns = {name: transposed[index] for name, index in positions.items() if index < len(transposed)}
+        yield columns, len(rows), {}
+
+def read_jsonl_chunks(f, fields: List[str], chunk_size: int) -> Iterator[Chunk]:
+    """Yield field -> column chunks from a JSON-Lines file of objects
+
+    A line that is not a JSON object stays a row with every field missing
+    and an error naming the line, so one bad line does not end the batch.
+    """
+    lines = ((number, line) for number, line in enumerate(f, 1) if line.strip())
+    while True:
+        records = []
+        row_errors = {}
+        for number, line in islice(lines, chunk_size):
+            try:
+                record = json.loads(line)
+            except ValueError as e:
+                record = None
+                row_errors[len(records)] = f"Line {number}: invalid JSON ({e.msg})"
+            else:
+                if not isinstance(record, dict):
+                    row_errors[len(records)] = f"Line {number}: expected a JSON object, got {type(record).__name__}"
+            records.append(record if isinstance(record, dict) else {})
+        if not records:
+            return
+        columns = {name: [_cell(record.get(name)) for record in records] for name in fields}
+        yield columns, len(records), row_errors
+
+def encode_jsonl(processed: List[ColumnResult], row_count: int, first_row: int,
+                 row_errors: Optional[Dict[int, str]] = None) -> List[str]:
+    """Encode column results as JSON lines without building per-row dicts
+
+    Each distinct value is JSON-encoded once per column and rows are stitched
+    together with zip/filter/join, which keeps the per-row work in C.
+    """
+    value_columns = []
+    error_columns = []
+    for field, values, errors in processed:
+        key = json.dumps(field, ensure_ascii=False) + ':'
+        encoded: Dict[str, str] = {}
+        column = []
+        for value in values:
+            if value is None:
+                column.append(None)
+                continue
+            item = encoded.get(value)
+            if item is None:
+                item = encoded[value] = key + json.dumps(value, ensure_ascii=False)
+            column.append(item)
+        value_columns.append(column)
+        error_strings = {error: json.dumps(error, ensure_ascii=False) for error in set(errors) if error is not None}
+        error_columns.append([error_strings.get(error) if error is not None else None for error in errors])
+
+    if row_errors:
+        # Input errors come first in their row's error list
+        error_columns.insert(0, [None] * row_count)
+        for offset, error in row_errors.items():
+            error_columns[0][offset] = json.dumps(error, ensure_ascii=False)
+
+    lines = []
+    row_numbers = range(first_row, first_row + row_count)
+    for row, data, errors in zip(row_numbers, zip(*value_columns), zip(*error_columns)):
+        error_text = ','.join(filter(None, errors))
+        success = 'false' if error_text else 'true'
+        lines.append(f'{{"row":{row},"success":{success},"data":{{{",".join(filter(None, data))}}},"errors":[{error_text}]}}')
+    return lines
+
+def main():
+    parser = argparse.ArgumentParser(description='VoiceBridge Batch Skill Executor')
+    parser.add_argument('skill', help='Skill template to execute')
+    parser.add_argument('records', help='CSV or JSON-Lines file of records')
+    parser.add_argument('--output', '-o', help='Write JSON-Lines results here instead of stdout')
+    parser.add_argument('--format', choices=['csv', 'jsonl'], help='Input format (default: from file extension)')
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE, help='Records processed per column chunk')
+
+    args = parser.parse_args()
+
+    executor = SkillExecutor.from_file(args.skill)
+    input_format = args.format or ('csv' if args.records.lower().endswith('.csv') else 'jsonl')
+    read_chunks = read_csv_chunks if input_format == 'csv' else read_jsonl_chunks
+
+    out = open(args.output, 'w', encoding='utf-8') if args.output else sys.stdout
+    rows = 0
+    failed = 0
+    start = time.perf_counter()
+
+    try:
+        with open(args.records, 'r', encoding='utf-8', newline='') as f:
+            for columns, count, input_errors in read_chunks(f, executor.fields, args.chunk_size):
+                processed = executor.execute_columns(columns, count, empty_is_missing=input_format == 'csv')
+                failed += sum(1 for offset, row_errors in enumerate(zip(*(errors for _, _, errors in processed)))
+                              if any(row_errors) or offset in input_errors)
+                out.write('\n'.join(encode_jsonl(processed, count, rows + 1, input_errors)))
+                out.write('\n')
+                rows += count
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    elapsed = time.perf_counter() - start
+    rate = rows / elapsed if elapsed > 0 else 0.0
+    print(f"Processed {rows:,} rows ({failed:,} with errors) in {elapsed:.2f}s, {rate:,.0f} rows/s",
+          file=sys.stderr)
+    sys.exit(0 if failed == 0 else 1)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""
+VoiceBridge Skill Bundle Compiler (skill-compile)
+
+Validates every skill template and writes one compact, versioned JSON bundle
+the app can load at startup instead of parsing each YAML file with SnakeYAML.
+The bundle holds normalized prompts, a deduplicated regex table (prompts and
+postprocess actions refer to regexes by index, so each pattern is compiled
+once), postprocess actions and a command table sorted by normalized trigger.
+
+Usage:
+    python skill-compile.py [paths ...] [-o build/skills.bundle.json] [--strict]
+    python skill-compile.py skills/ android/app/src/main/assets/skills/
+"""
+
+import os
+import sys
+import json
+import re
+import time
+import hashlib
+import argparse
+import statistics
+from typing import Dict, List, Any, Tuple
+
+import yaml
+
+from skill_catalog import (
+    SKILLS_DIR, find_skill_files, load_skill_lint,
+    normalize_skill, normalize_trigger
+)
+from skill_fragments import FragmentError, find_library, resolve_fragments
+
+BUNDLE_FORMAT = 'voicebridge-skill-bundle'
+BUNDLE_VERSION = 1
+
+DEFAULT_OUTPUT = os.path.join('build', 'skills.bundle.json')
+
+# Normalized prompt keys copied into the bundle when they carry a value
+PROMPT_KEYS = ('field', 'ask', 'hint', 'type', 'required', 'format', 'options', 'min', 'max',
+               'default', 'depends_on', 'show_when', 'group', 'aliases', 'patterns')
+
+class RegexTable:
+    """Deduplicated table of regex sources referenced by index"""
+
+    def __init__(self):
+        self.patterns: List[str] = []
+        self._index: Dict[str, int] = {}
+
+    def add(self, pattern: str) -> int:
+        if pattern not in self._index:
+            self._index[pattern] = len(self.patterns)
+            self.patterns.append(pattern)
+        return self._index[pattern]
+
+def validate_sources(files: List[str], strict: bool) -> Tuple[List[Dict[str, Any]], Dict[str, List[str]]]:
+    """Validate and normalize every file; returns skills and per-file errors"""
+    validator = load_skill_lint().SkillValidator(strict)
+    skills = []
+    failures = {}
+
+    for file_path in files:
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                data = yaml.safe_load(f)
+        except (OSError, yaml.YAMLError) as e:
+            failures[file_path] = [f"YAML parsing error: {e}"]
+            continue
+
+        if not isinstance(data, dict):
+            failures[file_path] = ["Root element must be a dictionary/object"]
+            continue
+
+        try:
+            data = resolve_fragments(data, file_path)
+        except (OSError, FragmentError) as e:
+            failures[file_path] = [f"Fragment error: {e}"]
+            continue
+
+        # Only a template that passed the schema is normalized and compiled
+        _, errors, _ = validator.validate_data(data)
+        if errors:
+            failures[file_path] = list(errors)
+            continue
+        skills.append(normalize_skill(data, file_path))
+
+    return skills, failures
+
+def _compact(entry: Dict[str, Any]) -> Dict[str, Any]:
+    """Drop keys without a value to keep the bundle small"""
+    return {key: value for key, value in entry.items() if value not in (None, [], {}, '')}
+
+def build_bundle(skills: List[Dict[str, Any]], source_hash: str) -> Dict[str, Any]:
+    """Lay out normalized skills as a bundle"""
+    regexes = RegexTable()
+    bundle_skills = []
+    commands = []
+
+    for skill_index, skill in enumerate(skills):
+        prompts = []
+        for prompt in skill['prompts']:
+            entry = {key: prompt[key] for key in PROMPT_KEYS}
+            if prompt['validation'] is not None:
+                entry['validation'] = regexes.add(prompt['validation'])
+            prompts.append(_compact(entry))
+
+        postprocess = []
+        for action in skill['postprocess']:
+            entry = {'action': action['action'], 'field': action['field'], 'format': action['format']}
+            if action['pattern'] is not None:
+                entry['pattern'] = regexes.add(action['pattern'])
+            postprocess.append(_compact(entry))
+
+        bundle_skills.append(_compact({
+            'id': skill['id'],
+            'schema': skill['schema'],
+            'language': skill['language'],
+            'languages': skill['languages'] if len(skill['languages']) > 1 else None,
+            'name': skill['name'],
+            'description': skill['description'],
+            'version': skill['version'],
+            'category': skill['category'],
+            'prompts': prompts,
+            'postprocess': postprocess,
+            'selectors': skill['selectors'],
+            'submit_button': skill['submit_button'],
+            'target_app': skill['target_app'],
+        }))
+
+        for command in skill['commands']:
+            row = [normalize_trigger(command['trigger']), skill_index, command['action']]
+            if command['fields']:
+                row.append(command['fields'])
+            commands.append(row)
+
+    commands.sort(key=lambda row: (row[0], row[1]))
+
+    return {
+        'format': BUNDLE_FORMAT,
+        'version': BUNDLE_VERSION,
+        'source_hash': source_hash,
+        'regexes': regexes.patterns,
+        'skills': bundle_skills,
+        'commands': commands,
+    }
+
+def serialize_bundle(bundle: Dict[str, Any]) -> bytes:
+    return json.dumps(bundle, ensure_ascii=False, separators=(',', ':'), sort_keys=True).encode('utf-8')
+
+def hash_sources(files: List[str]) -> str:
+    digest = hashlib.sha256()
+    libraries = sorted({library for library in map(find_library, files) if library})
+    for file_path in files + libraries:
+        digest.update(file_path.encode('utf-8'))
+        with open(file_path, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()[:16]
+
+def measure_load_times(files: List[str], payload: bytes, repeats: int = 5) -> Tuple[float, float]:
+    """Median seconds to load the raw YAML sources versus the bundle"""
+    sources = []
+    for file_path in files:
+        with open(file_path, 'rb') as f:
+            sources.append(f.read())
+
+    yaml_times = []
+    bundle_times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for source in sources:
+            yaml.safe_load(source)
+        yaml_times.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        bundle = json.loads(payload)
+        for pattern in bundle['regexes']:
+            re.compile(pattern)
+        bundle_times.append(time.perf_counter() - start)
+
+    return statistics.median(yaml_times), statistics.median(bundle_times)
+
+def main():
+    parser = argparse.ArgumentParser(description='VoiceBridge Skill Bundle Compiler')
+    parser.add_argument('paths', nargs='*', default=[str(SKILLS_DIR)], help='Skill files or directories to compile')
+    parser.add_argument('--output', '-o', default=DEFAULT_OUTPUT, help='Bundle file to write')
+    parser.add_argument('--strict', action='store_true', help='Enable strict validation mode')
+    parser.add_argument('--no-report', action='store_true', help='Skip the size and load-time report')
+
+    args = parser.parse_args()
+
+    files = find_skill_files(args.paths)
+    if not files:
+        print(f"❌ No skill files found in {', '.join(args.paths)}")
+        sys.exit(1)
+
+    skills, failures = validate_sources(files, args.strict)
+
+    if failures:
+        print("❌ Skill templates have errors, bundle not written:")
+        for file_path, errors in failures.items():
+            print(f"   {file_path}")
+            for error in errors:
+                print(f"      • {error}")
+        sys.exit(1)
+
+    ids = [skill['id'] for skill in skills]
+    duplicates = sorted({skill_id for skill_id in ids if ids.count(skill_id) > 1})
+    if duplicates:
+        print(f"❌ Duplicate skill ids across files: {', '.join(duplicates)}")
+        sys.exit(1)
+
+    bundle = build_bundle(skills, hash_sources(files))
+    payload = serialize_bundle(bundle)
+
+    output_dir = os.path.dirname(args.output)
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+    with open(args.output, 'wb') as f:
+        f.write(payload)
+
+    print(f"📦 Compiled {len(skills)} skills into {args.output}")
+    print(f"━" * 50)
+    print(f"Regexes: {len(bundle['regexes'])} unique")
+    print(f"Commands: {len(bundle['commands'])}")
+
+    if not args.no_report:
+        yaml_bytes = sum(os.path.getsize(file_path) for file_path in files)
+        yaml_time, bundle_time = measure_load_times(files, payload)
+        print(f"Size: {len(payload):,} bytes bundle vs {yaml_bytes:,} bytes YAML "
+              f"({len(payload) / yaml_bytes:.0%})")
+        print(f"Load: {bundle_time * 1000:.2f} ms bundle vs {yaml_time * 1000:.2f} ms YAML "
+              f"({yaml_time / bundle_time:.1f}x faster)")
+
+if __name__ == '__main__':
+    main()
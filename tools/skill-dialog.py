@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+VoiceBridge Dialog Path Analyzer (skill-dialog)
+
+Builds the conditional prompt graph (`depends_on` / `show_when`) of every
+skill and reports how many questions the voice dialog asks: the number of
+distinct answer paths, the fewest, average, expected and most questions, and
+the answers behind the best and worst case (see skill_dialog.py). It flags
+prompts that can never be asked, dependency cycles and `show_when` values
+missing from the parent's options.
+
+Usage:
+    python skill-dialog.py
+    python skill-dialog.py skills/forms/tax_preparation.yaml --paths 10
+    python skill-dialog.py skills/ --max-questions 20 --output json
+"""
+
+import sys
+import json
+import argparse
+from typing import Dict, Any
+
+from skill_catalog import SKILLS_DIR, find_skill_files, load_skill
+from skill_dialog import OTHER, analyze_skill, describe_answers
+
+def _count(paths: int) -> str:
+    text = str(paths)
+    return f"{paths:,}" if len(text) <= 15 else f"~10^{len(text) - 1}"
+
+def print_report(report: Dict[str, Any], max_questions) -> None:
+    over = max_questions is not None and report['max_questions'] > max_questions
+    status = "❌" if report['issues'] or over else "✅"
+    print(f"\n{status} {report['skill']} ({report['source']})")
+    print(f"   {report['prompts']} prompts, {report['conditional']} conditional, "
+          f"{report['prompts'] - report['reachable']} never asked; {_count(report['paths'])} answer paths")
+    print(f"   questions: min {report['min_questions']}, mean {report['mean_questions']:g}, "
+          f"expected {report['expected_questions']:g}, max {report['max_questions']}")
+    if report['paths'] > 1:
+        print(f"   fewest with {describe_answers(report['best_case'])}")
+        print(f"   most with {describe_answers(report['worst_case'])}")
+    if over:
+        print(f"   ❌ Worst case asks {report['max_questions']} questions, over the limit of {max_questions}")
+    for issue in report['issues']:
+        print(f"   ⚠️  {issue['message']}")
+    for path in report.get('listed_paths', []):
+        print(f"   • {path['questions']:>3} questions: {describe_answers(path['answers'])}")
+
+def main():
+    parser = argparse.ArgumentParser(description='VoiceBridge Dialog Path Analyzer')
+    parser.add_argument('paths', nargs='*', default=[str(SKILLS_DIR)], help='Skill files or directories to analyze')
+    parser.add_argument('--paths', dest='list_paths', type=int, default=0,
+                        help='List every answer path of skills with at most N paths')
+    parser.add_argument('--max-questions', type=int, help='Exit 1 if any skill can ask more than N questions')
+    parser.add_argument('--output', choices=['text', 'json'], default='text', help='Output format')
+
+    args = parser.parse_args()
+
+    reports = []
+    for file_path in find_skill_files(args.paths):
+        try:
+            skill = load_skill(file_path)
+        except Exception as e:
+            print(f"⚠️  Skipping {file_path}: {str(e).splitlines()[0]}", file=sys.stderr)
+            continue
+        if skill['prompts']:
+            reports.append(analyze_skill(skill, args.list_paths))
+
+    failed = any(report['issues'] for report in reports) or (
+        args.max_questions is not None and any(report['max_questions'] > args.max_questions for report in reports))
+
+    if args.output == 'json':
+        print(json.dumps({'other_answer': OTHER, 'skills': reports}, indent=2))
+    else:
+        conditional = sum(1 for report in reports if report['conditional'])
+        print(f"🗣️  Dialog paths: {len(reports)} skills, {conditional} with conditional prompts")
+        print(f"━" * 50)
+        for report in reports:
+            print_report(report, args.max_questions)
+
+    sys.exit(1 if failed else 0)
+
+if __name__ == '__main__':
+    main()
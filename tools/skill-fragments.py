@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+VoiceBridge Prompt Fragment Compactor (skill-fragments)
+
+Finds prompts, validation regexes, postprocess entries and form selectors
+that are structurally identical across form templates and reports how many
+bytes and how much parse time moving them into a shared fragments.yaml would
+save. With --write it rewrites the templates to reference the fragments;
+the linter, the LSP, skill-compile and the catalog loaders resolve them.
+
+Asset templates (android/app/src/main/assets/skills) are left alone: the app
+loads them directly with SnakeYAML, which does not resolve fragment references.
+
+Usage:
+    python skill-fragments.py [paths ...] [--min-uses 2] [--json]
+    python skill-fragments.py skills/forms/ --write [--library skills/fragments.yaml]
+"""
+
+import os
+import sys
+import json
+import copy
+import time
+import argparse
+import statistics
+from typing import Dict, List, Any, Tuple
+
+import yaml
+
+from skill_catalog import SKILLS_DIR, find_skill_files, is_asset_schema
+from skill_fragments import (
+    LIBRARY_NAME, FragmentError, FragmentLibrary, canonical, dump_yaml,
+    find_library, load_library, plan_compaction, resolve_fragments
+)
+
+def load_templates(files: List[str]) -> Tuple[List[Tuple[str, Dict[str, Any]]], List[Dict[str, str]]]:
+    """Parse and resolve the form templates; returns templates and skipped files"""
+    templates = []
+    skipped = []
+    for file_path in files:
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                data = yaml.safe_load(f)
+            if not isinstance(data, dict):
+                raise ValueError("Root element must be a dictionary/object")
+            data = resolve_fragments(data, file_path)
+        except (OSError, ValueError, yaml.YAMLError) as e:
+            skipped.append({'file': file_path, 'reason': str(e).splitlines()[0]})
+            continue
+        if is_asset_schema(data):
+            skipped.append({'file': file_path, 'reason': 'asset template, loaded on device without fragments'})
+            continue
+        templates.append((file_path, data))
+    return templates, skipped
+
+def time_load(texts: List[str], library_text: str = None, paths: List[str] = None, repeats: int = 5) -> float:
+    """Median milliseconds to parse (and resolve) a set of templates"""
+    samples = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        library = FragmentLibrary.from_text(library_text) if library_text is not None else None
+        for text, path in zip(texts, paths or texts):
+            data = yaml.safe_load(text)
+            if library is not None:
+                resolve_fragments(data, path, library)
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1000
+
+def compact(files: List[str], library_path: str, min_uses: int) -> Dict[str, Any]:
+    templates, skipped = load_templates(files)
+
+    # A closer fragments.yaml would shadow the library we write
+    kept = []
+    for file_path, data in templates:
+        nearest = find_library(file_path)
+        if nearest is not None and nearest != os.path.abspath(library_path):
+            skipped.append({'file': file_path, 'reason': f'uses another fragment library ({nearest})'})
+        else:
+            kept.append((file_path, data))
+    templates = kept
+
+    library = load_library(library_path) if os.path.isfile(library_path) else None
+    originals = [canonical(data) for _, data in templates]
+    original_texts = []
+    for file_path, _ in templates:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            original_texts.append(f.read())
+
+    rewritten = [(file_path, copy.deepcopy(data)) for file_path, data in templates]
+    plan = plan_compaction(rewritten, library, min_uses)
+    library_text = dump_yaml({'fragments': plan['fragments']}) if plan['fragments'] else None
+    texts = [dump_yaml(data) for _, data in rewritten]
+
+    # The rewrite must resolve back to exactly what the templates said before
+    mismatched = []
+    if library_text is not None:
+        check = FragmentLibrary.from_text(library_text, library_path)
+        for (file_path, _), text, original in zip(rewritten, texts, originals):
+            if canonical(resolve_fragments(yaml.safe_load(text), file_path, check)) != original:
+                mismatched.append(file_path)
+
+    paths = [file_path for file_path, _ in templates]
+    before_bytes = sum(len(text.encode('utf-8')) for text in original_texts)
+    after_bytes = sum(len(text.encode('utf-8')) for text in texts) + len((library_text or '').encode('utf-8'))
+    return {
+        'library': library_path,
+        'templates': len(templates),
+        'skipped': skipped,
+        'fragments': plan['report'],
+        'mismatched': mismatched,
+        'bytes_before': before_bytes,
+        'bytes_after': after_bytes if library_text is not None else before_bytes,
+        'parse_ms_before': round(time_load(original_texts), 3),
+        'parse_ms_after': round(time_load(texts, library_text, paths), 3) if library_text is not None else None,
+        '_write': (library_text, list(zip(paths, texts))),
+    }
+
+def print_report(results: Dict[str, Any]) -> None:
+    print(f"🧩 Fragment compaction over {results['templates']} form templates → {results['library']}")
+    print(f"━" * 50)
+    for entry in results['fragments']:
+        status = "🆕" if entry['new'] else "♻️ "
+        print(f"{status} {entry['fragment']}: {entry['uses']} uses in {entry['files']} files, "
+              f"saves {entry['bytes_saved']:,} bytes")
+    if not results['fragments']:
+        print("✅ No repeated prompts, regexes, postprocess entries or selectors worth sharing")
+    for skipped in results['skipped']:
+        print(f"⚠️  Skipped {skipped['file']}: {skipped['reason']}")
+    for file_path in results['mismatched']:
+        print(f"❌ Rewrite of {file_path} does not resolve back to the original")
+    print()
+    before, after = results['bytes_before'], results['bytes_after']
+    print(f"Size: {after:,} bytes with fragments vs {before:,} bytes ({(before - after) / max(before, 1):.0%} saved)")
+    if results['parse_ms_after'] is not None:
+        print(f"Parse: {results['parse_ms_after']:.2f} ms with fragments vs {results['parse_ms_before']:.2f} ms")
+
+def main():
+    parser = argparse.ArgumentParser(description='VoiceBridge Prompt Fragment Compactor')
+    parser.add_argument('paths', nargs='*', default=[str(SKILLS_DIR)], help='Skill files or directories to compact')
+    parser.add_argument('--library', help=f'Fragment library to write (default: {LIBRARY_NAME} in the common directory)')
+    parser.add_argument('--min-uses', type=int, default=2, help='Copies needed before a value becomes a fragment')
+    parser.add_argument('--write', action='store_true', help='Rewrite the templates and the library')
+    parser.add_argument('--json', action='store_true', help='Output results as JSON')
+
+    args = parser.parse_args()
+
+    files = find_skill_files(args.paths)
+    if not files:
+        print(f"❌ No skill files found in {', '.join(args.paths)}")
+        sys.exit(1)
+
+    library_path = os.path.abspath(args.library or os.path.join(
+        os.path.commonpath([os.path.dirname(os.path.abspath(f)) for f in files]), LIBRARY_NAME))
+
+    try:
+        results = compact(files, library_path, args.min_uses)
+    except FragmentError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    library_text, rewrites = results.pop('_write')
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print_report(results)
+
+    if results['mismatched']:
+        sys.exit(1)
+
+    if args.write and library_text is not None:
+        with open(library_path, 'w', encoding='utf-8') as f:
+            f.write(library_text)
+        for file_path, text in rewrites:
+            with open(file_path, 'w', encoding='utf-8') as f:
+                f.write(text)
+        if not args.json:
+            print(f"📦 Wrote {library_path} and rewrote {len(rewrites)} templates")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+VoiceBridge Validator Benchmark (skill-lint-bench)
+
+Times SkillValidator per file on a catalog: the validation pass alone on
+pre-parsed documents and validate_file end to end. With --baseline it loads
+another skill-lint.py (e.g. one exported from an older commit), times it on
+the same documents and checks that both produce identical messages.
+
+A baseline from before the compiled schema has no validate_data; its
+validation pass is timed by running the checks its validate_file ran after
+parsing (_validate_schema through _validate_regex_patterns) on the same
+pre-parsed documents.
+
+Usage:
+    python skill-lint-bench.py [paths ...] [--repeat 20] [--strict]
+    git show <commit>:tools/skill-lint.py > /tmp/skill-lint-old.py
+    python skill-lint-bench.py skills/ --baseline /tmp/skill-lint-old.py
+"""
+
+import sys
+import time
+import argparse
+import importlib.util
+import statistics
+from typing import Callable, Dict, List, Any, Tuple
+
+import yaml
+
+from skill_catalog import SKILLS_DIR, find_skill_files, load_skill_lint
+
+# The checks the isinstance-loop SkillValidator ran after parsing, in order
+LEGACY_STEPS = ('_validate_schema', '_validate_semantic', '_validate_string_lengths', '_validate_regex_patterns')
+
+def load_validator_module(path: str):
+    spec = importlib.util.spec_from_file_location('skill_lint_baseline', path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+def time_per_file(runs: Dict[Any, Tuple[Callable[[Any], Any], List[Any]]], repeat: int) -> Dict[Any, float]:
+    """Median microseconds per item of every (run, items) over repeat passes
+
+    The runs take turns within each pass, so load on the machine slows the
+    current and the baseline validator alike.
+    """
+    samples: Dict[Any, List[float]] = {name: [] for name in runs}
+    for _ in range(repeat):
+        for name, (run, items) in runs.items():
+            start = time.perf_counter()
+            for item in items:
+                run(item)
+            samples[name].append((time.perf_counter() - start) / len(items))
+    return {name: statistics.median(times) * 1e6 for name, times in samples.items()}
+
+def legacy_validate_data(validator):
+    """validate_data for a validator without one: what its validate_file did after parsing"""
+    steps = [getattr(validator, name) for name in LEGACY_STEPS]
+
+    def validate_data(data: Any) -> Tuple[bool, List[str], List[str]]:
+        validator.errors = []
+        validator.warnings = []
+        try:
+            if not isinstance(data, dict):
+                validator.errors.append("Root element must be a dictionary/object")
+                return False, validator.errors, validator.warnings
+            for step in steps:
+                step(data)
+        except Exception as e:
+            validator.errors.append(f"Unexpected error: {e}")
+        return len(validator.errors) == 0, validator.errors, validator.warnings
+
+    return validate_data
+
+def bench(modules: Dict[str, Any], files: List[str], documents: List[Any], strict: bool,
+          repeat: int) -> Dict[str, Dict[str, Any]]:
+    """Per-file times and messages of every module's SkillValidator, keyed like modules"""
+    results = {}
+    runs = {}
+    for label, module in modules.items():
+        validator = module.SkillValidator(strict)
+        results[label] = {'messages': [validator.validate_file(file_path)[1:] for file_path in files]}
+        runs[label, 'validate_file_us'] = (validator.validate_file, files)
+        if hasattr(validator, 'validate_data'):
+            runs[label, 'validate_data_us'] = (validator.validate_data, documents)
+        elif all(hasattr(validator, name) for name in LEGACY_STEPS):
+            runs[label, 'validate_data_us'] = (legacy_validate_data(validator), documents)
+    for (label, key), per_file in time_per_file(runs, repeat).items():
+        results[label][key] = per_file
+    return results
+
+def print_row(label: str, result: Dict[str, Any]) -> None:
+    data_time = result.get('validate_data_us')
+    data_text = f"{data_time:9.1f} µs" if data_time is not None else "      n/a"
+    print(f"{label:<10} validation only {data_text}   validate_file {result['validate_file_us']:9.1f} µs")
+
+def main():
+    parser = argparse.ArgumentParser(description='VoiceBridge Validator Benchmark')
+    parser.add_argument('paths', nargs='*', default=[str(SKILLS_DIR)], help='Skill files or directories to validate')
+    parser.add_argument('--baseline', help='Another skill-lint.py to compare against')
+    parser.add_argument('--repeat', type=int, default=20, help='Timed passes over the catalog')
+    parser.add_argument('--strict', action='store_true', help='Validate in strict mode')
+
+    args = parser.parse_args()
+
+    files = find_skill_files(args.paths)
+    if not files:
+        print(f"❌ No skill files found in {', '.join(args.paths)}")
+        sys.exit(1)
+
+    documents = []
+    for file_path in files:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            try:
+                documents.append(yaml.safe_load(f))
+            except yaml.YAMLError:
+                documents.append(None)
+
+    print(f"⏱️  Per-file validation cost over {len(files)} files (median of {args.repeat} passes)")
+    print(f"━" * 50)
+    modules = {'current': load_skill_lint()}
+    if args.baseline:
+        modules['baseline'] = load_validator_module(args.baseline)
+    results = bench(modules, files, documents, args.strict, args.repeat)
+    for label, result in results.items():
+        print_row(label, result)
+
+    if not args.baseline:
+        return
+
+    current = results['current']
+    baseline = results['baseline']
+    if 'validate_data_us' in baseline:
+        print(f"Validation only: {baseline['validate_data_us'] / current['validate_data_us']:.2f}x faster")
+    print(f"validate_file: {baseline['validate_file_us'] / current['validate_file_us']:.2f}x faster")
+
+    differences = [
+        (file_path, old, new) for file_path, old, new in zip(files, baseline['messages'], current['messages'])
+        if old != new
+    ]
+    print()
+    if not differences:
+        print("✅ Identical messages on every file")
+    for file_path, old, new in differences:
+        print(f"⚠️  Messages differ for {file_path}")
+        for label, (errors, warnings) in (("baseline", old), ("current", new)):
+            for message in errors:
+                print(f"   {label} ❌ {message}")
+            for message in warnings:
+                print(f"   {label} ⚠️  {message}")
+    sys.exit(1 if differences else 0)
+
+if __name__ == '__main__':
+    main()
@@ -8,6 +8,16 @@ Prevents crashes from malformed skill files contributed by volunteers.
 Usage:
     python skill-lint.py [skill_file.yaml] [--strict] [--output json]
     python skill-lint.py --validate-all skills/
+    python skill-lint.py --validate-all skills/ --jobs 4
+    python skill-lint.py --validate-all skills/ --no-cache
+    python skill-lint.py skills/ --bench-regex [--regex-budget-ms 1.0]
+    python skill-lint.py --validate-all skills/ --check-triggers
+    python skill-lint.py --validate-all skills/ --check-variants
+    python skill-lint.py --validate-all skills/ --output jsonl
+    python skill-lint.py --validate-all skills/ --output sarif > skill-lint.sarif
+    python skill-lint.py skills/ --budget [--skill-budget-ms 50] [--catalog-budget-kb 1024]
+    python skill-lint.py --validate-all skills/ --profile [--profile-top 10] [--profile-dump lint.pstats]
+    python skill-lint.py --lsp [skills/]
 """
 
 import os
@@ -16,55 +26,50 @@ import yaml
 import json
 import re
 import argparse
-from typing import Dict, List, Any, Optional, Tuple
+import contextlib
+import hashlib
+import tempfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Deque, Dict, List, Any, Iterable, Iterator, Optional, Tuple
 from pathlib import Path
 
+import skill_catalog
+import skill_fragments
+import skill_redos
+import skill_schema
+from skill_output import WRITERS as STREAM_WRITERS
+
+# Returned by the loading steps of validate_file once an error is recorded
+# (None is a valid document: an empty file)
+_FAILED = object()
+
+# What the cross-file checks read of a normalized skill; the rest is dropped
+# before it is cached or sent back from a pool worker
+CROSS_FILE_SKILL_KEYS = ('id', 'schema', 'source', 'language', 'variant_of', 'postprocess', 'selectors',
+                         'submit_button', 'target_app')
+CROSS_FILE_PROMPT_KEYS = ('field', 'type', 'required', 'validation', 'format', 'min', 'max', 'options',
+                          'depends_on', 'show_when')
+CROSS_FILE_COMMAND_KEYS = ('trigger', 'action', 'skill')
+
+def cross_file_skill(skill: Dict[str, Any]) -> Dict[str, Any]:
+    """The part of a normalized skill the trigger and variant checks use, as plain JSON values"""
+    summary = {key: skill[key] for key in CROSS_FILE_SKILL_KEYS}
+    summary['prompts'] = [{key: prompt[key] for key in CROSS_FILE_PROMPT_KEYS} for prompt in skill['prompts']]
+    summary['commands'] = [{key: command[key] for key in CROSS_FILE_COMMAND_KEYS} for command in skill['commands']]
+    # A cached summary comes back from JSON, so a fresh one must compare the same way
+    return json.loads(json.dumps(summary, default=str))
+
 class SkillValidator:
     """Validates VoiceBridge skill template files"""
     
-    REQUIRED_FIELDS = {
-        'id': str,
-        'language': str, 
-        'name': str,
-        'description': str,
-        'version': str,
-        'prompts': list
-    }
-    
-    OPTIONAL_FIELDS = {
-        'category': str,
-        'postprocess': list,
-        'accessibility': dict,
-        'commands': list
-    }
-    
-    PROMPT_REQUIRED = {
-        'field': str,
-        'ask': str,
-        'type': str
-    }
-    
-    PROMPT_OPTIONAL = {
-        'hint': str,
-        'required': bool,
-        'validation': str,
-        'format': str,
-        'options': list,
-        'min': int,
-        'max': int,
-        'default': str,
-        'depends_on': str,
-        'show_when': str
-    }
-    
-    VALID_FIELD_TYPES = {
-        'name', 'email', 'phone', 'address', 'date', 'ssn', 
-        'text', 'number', 'currency', 'select', 'textarea'
-    }
-    
-    SUPPORTED_LANGUAGES = {
-        'en', 'es', 'pt', 'fr', 'de', 'it', 'zh', 'ja', 'ko', 'ru', 'ar', 'hi'
-    }
+    # The declarative schemas in skill_schema are the source of truth
+    REQUIRED_FIELDS = skill_schema.FORM_REQUIRED
+    OPTIONAL_FIELDS = skill_schema.FORM_OPTIONAL
+    PROMPT_REQUIRED = skill_schema.PROMPT_REQUIRED
+    PROMPT_OPTIONAL = skill_schema.PROMPT_OPTIONAL
+    VALID_FIELD_TYPES = skill_schema.VALID_FIELD_TYPES
+    SUPPORTED_LANGUAGES = skill_schema.SUPPORTED_LANGUAGES
     
     def __init__(self, strict_mode: bool = False):
         self.strict_mode = strict_mode
@@ -73,155 +78,417 @@ class SkillValidator:
         
     def validate_file(self, file_path: str) -> Tuple[bool, List[str], List[str]]:
         """Validate a single skill file"""
+        return self._validate_file(file_path)[0]
+        
+    def validate_file_with_skill(self, file_path: str) -> Tuple[Tuple[bool, List[str], List[str]], Optional[Dict[str, Any]]]:
+        """Validate a single skill file and summarize it for the cross-file checks
+
+        The summary is cross_file_skill of the normalized skill, or None when
+        the file does not load or normalize (its errors are already reported).
+        """
+        outcome, data = self._validate_file(file_path)
+        if not isinstance(data, dict):
+            return outcome, None
+        return outcome, self._summarize(data, file_path)
+        
+    def _validate_file(self, file_path: str) -> Tuple[Tuple[bool, List[str], List[str]], Any]:
         self.errors = []
         self.warnings = []
         
+        data = self._parse_file(file_path)
+        if data is not _FAILED:
+            data = self._resolve_fragments(data, file_path)
+        if data is _FAILED:
+            return (False, self.errors, self.warnings), data
+        
+        return self.validate_data(data), data
+    
+    def _summarize(self, data: Dict[str, Any], file_path: str) -> Optional[Dict[str, Any]]:
+        try:
+            return cross_file_skill(skill_catalog.normalize_skill(data, file_path))
+        except Exception:
+            return None
+    
+    def _parse_file(self, file_path: str) -> Any:
+        """Parsed YAML document, or _FAILED with the error recorded"""
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
-                
-            if not isinstance(data, dict):
-                self.errors.append("Root element must be a dictionary/object")
-                return False, self.errors, self.warnings
-                
-            self._validate_schema(data)
-            self._validate_semantic(data)
-            self._validate_string_lengths(data)
-            self._validate_regex_patterns(data)
-            
+                return yaml.safe_load(f)
         except yaml.YAMLError as e:
             self.errors.append(f"YAML parsing error: {e}")
         except FileNotFoundError:
             self.errors.append(f"File not found: {file_path}")
+        except Exception as e:
+            self.errors.append(f"Unexpected error: {e}")
+        return _FAILED
+    
+    def _resolve_fragments(self, data: Any, file_path: str) -> Any:
+        try:
+            return skill_fragments.resolve_fragments(data, file_path)
+        except (OSError, skill_fragments.FragmentError) as e:
+            self.errors.append(f"Fragment error: {e}")
+            return _FAILED
+    
+    def validate_data(self, data: Any) -> Tuple[bool, List[str], List[str]]:
+        """Validate an already parsed skill document (e.g. an unsaved editor buffer)"""
+        self.errors = []
+        self.warnings = []
+        
+        try:
+            if not isinstance(data, dict):
+                self.errors.append("Root element must be a dictionary/object")
+                return False, self.errors, self.warnings
+            
+            errors, warnings = skill_schema.validator_for(data).validate(data, self.strict_mode)
+            self.errors.extend(errors)
+            self.warnings.extend(warnings)
+            
         except Exception as e:
             self.errors.append(f"Unexpected error: {e}")
             
         return len(self.errors) == 0, self.errors, self.warnings
+
+class ProfilingValidator(SkillValidator):
+    """SkillValidator that charges each step of every file to a skill_profile.Profiler"""
     
-    def _validate_schema(self, data: Dict[str, Any]) -> None:
-        """Validate basic schema structure"""
-        
-        # Check required fields
-        for field, expected_type in self.REQUIRED_FIELDS.items():
-            if field not in data:
-                self.errors.append(f"Missing required field: {field}")
-                continue
-                
-            if not isinstance(data[field], expected_type):
-                self.errors.append(f"Field '{field}' must be of type {expected_type.__name__}")
-                
-        # Check optional fields types
-        for field, expected_type in self.OPTIONAL_FIELDS.items():
-            if field in data and not isinstance(data[field], expected_type):
-                self.errors.append(f"Field '{field}' must be of type {expected_type.__name__}")
-                
-        # Validate prompts structure
-        if 'prompts' in data and isinstance(data['prompts'], list):
-            for i, prompt in enumerate(data['prompts']):
-                self._validate_prompt(prompt, i)
-                
-    def _validate_prompt(self, prompt: Dict[str, Any], index: int) -> None:
-        """Validate individual prompt structure"""
+    def __init__(self, profiler, strict_mode: bool = False):
+        super().__init__(strict_mode)
+        self.profiler = profiler
         
-        if not isinstance(prompt, dict):
-            self.errors.append(f"Prompt {index} must be a dictionary")
-            return
+    def validate_file(self, file_path: str) -> Tuple[bool, List[str], List[str]]:
+        with self.profiler.file(file_path):
+            return super().validate_file(file_path)
             
-        # Check required prompt fields
-        for field, expected_type in self.PROMPT_REQUIRED.items():
-            if field not in prompt:
-                self.errors.append(f"Prompt {index} missing required field: {field}")
-                continue
-                
-            if not isinstance(prompt[field], expected_type):
-                self.errors.append(f"Prompt {index} field '{field}' must be of type {expected_type.__name__}")
-                
-        # Check optional prompt fields
-        for field, expected_type in self.PROMPT_OPTIONAL.items():
-            if field in prompt and not isinstance(prompt[field], expected_type):
-                self.errors.append(f"Prompt {index} field '{field}' must be of type {expected_type.__name__}")
-                
-        # Validate field type
-        if 'type' in prompt and prompt['type'] not in self.VALID_FIELD_TYPES:
-            self.errors.append(f"Prompt {index} has invalid type '{prompt['type']}'. Valid types: {', '.join(self.VALID_FIELD_TYPES)}")
+    def validate_file_with_skill(self, file_path: str) -> Tuple[Tuple[bool, List[str], List[str]], Optional[Dict[str, Any]]]:
+        with self.profiler.file(file_path):
+            return super().validate_file_with_skill(file_path)
             
-    def _validate_semantic(self, data: Dict[str, Any]) -> None:
-        """Validate semantic correctness"""
+    def _parse_file(self, file_path: str) -> Any:
+        with self.profiler.phase('parse'):
+            return super()._parse_file(file_path)
+            
+    def _resolve_fragments(self, data: Any, file_path: str) -> Any:
+        with self.profiler.phase('fragments'):
+            return super()._resolve_fragments(data, file_path)
+            
+    def validate_data(self, data: Any) -> Tuple[bool, List[str], List[str]]:
+        with self.profiler.phase('schema'):
+            return super().validate_data(data)
+            
+    def _summarize(self, data: Dict[str, Any], file_path: str) -> Optional[Dict[str, Any]]:
+        with self.profiler.phase('cross_file'):
+            return super()._summarize(data, file_path)
+
+class ValidationCache:
+    """Persistent per-file result cache keyed by content hash
+
+    Keys combine the validator version (a hash of the rule sources), the strict
+    flag and the SHA-256 of the file bytes, so editing either the template or
+    the lint rules invalidates the entry. Every check SkillValidator runs,
+    including the depends_on lookups, only looks inside the file being
+    validated and the fragment library it uses, so the key also covers the
+    nearest fragments.yaml.
+    
+    Entries written by a run with --check-triggers or --check-variants also
+    keep the file's cross-file summary (see cross_file_skill), so those
+    checks replay unchanged files without parsing them either. A skill
+    without an id is named after its file, so the key ends with the file
+    stem; the summary's source is the path it was validated under and is
+    replaced on replay.
+    """
+    
+    DEFAULT_PATH = '.skill-lint-cache.json'
+    
+    def __init__(self, path: str, strict: bool = False):
+        self.path = path
+        self.prefix = f"{self.validator_version()}:{int(strict)}:"
+        self.entries: Dict[str, List[Any]] = {}
+        self.hits = 0
+        self.misses = 0
+        self._dirty = False
+        self._library_stamps: Dict[str, Tuple[Any, str]] = {}
+        self._load()
         
-        # Check language support
-        if 'language' in data and data['language'] not in self.SUPPORTED_LANGUAGES:
-            self.warnings.append(f"Language '{data['language']}' may not be fully supported. Supported: {', '.join(self.SUPPORTED_LANGUAGES)}")
+    # Sources whose rules affect validation results and the cached summaries
+    RULE_SOURCES = (__file__, skill_schema.__file__, skill_redos.__file__, skill_fragments.__file__,
+                    skill_catalog.__file__)
+    
+    @classmethod
+    def validator_version(cls) -> str:
+        digest = hashlib.sha256()
+        for source in cls.RULE_SOURCES:
+            with open(source, 'rb') as f:
+                digest.update(f.read())
+        return digest.hexdigest()[:16]
             
-        # Check ID format
-        if 'id' in data:
-            if not re.match(r'^[a-z][a-z0-9_]*$', data['id']):
-                self.errors.append("ID must start with lowercase letter and contain only lowercase letters, numbers, and underscores")
-                
-        # Check version format
-        if 'version' in data:
-            if not re.match(r'^\d+\.\d+(\.\d+)?$', data['version']):
-                self.warnings.append("Version should follow semantic versioning (e.g., '1.0.0')")
-                
-        # Validate field name uniqueness
-        if 'prompts' in data:
-            field_names = []
-            for prompt in data['prompts']:
-                if 'field' in prompt:
-                    if prompt['field'] in field_names:
-                        self.errors.append(f"Duplicate field name: {prompt['field']}")
-                    field_names.append(prompt['field'])
-                    
-        # Check dependencies
-        self._validate_dependencies(data)
+    def _load(self) -> None:
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                entries = json.load(f).get('entries', {})
+        except (OSError, ValueError, AttributeError):
+            return
+        # Drop entries written by other validator versions
+        version = self.prefix.split(':', 1)[0]
+        self.entries = {key: value for key, value in entries.items() if key.startswith(version + ':')}
         
-    def _validate_dependencies(self, data: Dict[str, Any]) -> None:
-        """Validate field dependencies"""
+    def key_for(self, file_path: str) -> Optional[str]:
+        """Return the cache key for a file, or None if it cannot be read"""
+        try:
+            digest = hashlib.sha256()
+            with open(file_path, 'rb') as f:
+                digest.update(f.read())
+            library = self._library_digest(file_path)
+            return self.prefix + digest.hexdigest() + (':' + library if library else '') + '/' + Path(file_path).stem
+        except OSError:
+            return None
+            
+    def _library_digest(self, file_path: str) -> Optional[str]:
+        library = skill_fragments.find_library(file_path)
+        if library is None:
+            return None
+        stat = os.stat(library)
+        stamp = (library, stat.st_mtime_ns, stat.st_size)
+        if self._library_stamps.get(library, (None,))[0] != stamp:
+            with open(library, 'rb') as f:
+                self._library_stamps[library] = (stamp, hashlib.sha256(f.read()).hexdigest()[:16])
+        return self._library_stamps[library][1]
+            
+    def get(self, key: Optional[str], summarized: bool = False) -> Optional[Tuple[Tuple[bool, List[str], List[str]], Optional[Dict[str, Any]]]]:
+        """Return the stored (outcome, cross-file summary) of a key, or None
+
+        With summarized, an entry written by a run without cross-file checks
+        (it has no summary) is a miss.
+        """
+        entry = self.entries.get(key) if key else None
+        if entry is None or (summarized and len(entry) < 4):
+            self.misses += 1
+            return None
+        self.hits += 1
+        is_valid, errors, warnings = entry[:3]
+        return (is_valid, list(errors), list(warnings)), entry[3] if len(entry) > 3 else None
         
-        if 'prompts' not in data:
+    def put(self, key: Optional[str], result: Tuple[Tuple[bool, List[str], List[str]], Optional[Dict[str, Any]]],
+            summarized: bool = False) -> None:
+        if key:
+            (is_valid, errors, warnings), skill = result
+            self.entries[key] = [is_valid, errors, warnings] + ([skill] if summarized else [])
+            self._dirty = True
+            
+    def save(self) -> None:
+        if not self._dirty:
             return
+        directory = os.path.dirname(os.path.abspath(self.path))
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump({'entries': self.entries}, f)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"⚠️  Could not write lint cache {self.path}: {e}", file=sys.stderr)
             
-        field_names = {prompt.get('field') for prompt in data['prompts'] if 'field' in prompt}
+    def stats_line(self) -> str:
+        return f"Cache: {self.hits} hits, {self.misses} misses ({self.path})"
+
+_worker_validator: Optional[SkillValidator] = None
+_worker_summarize = False
+
+def _init_worker(strict: bool, summarize: bool = False) -> None:
+    """Create the per-process validator used by pool workers"""
+    global _worker_validator, _worker_summarize
+    _worker_validator = SkillValidator(strict)
+    _worker_summarize = summarize
+    
+def _validate_chunk_in_worker(file_paths: List[str]) -> List[Tuple[Tuple[bool, List[str], List[str]], Optional[Dict[str, Any]]]]:
+    """Validate (and with summarize, summarize) a chunk of files inside a pool worker"""
+    return [_validate_one(_worker_validator, file_path, _worker_summarize) for file_path in file_paths]
+    
+def _validate_one(validator: SkillValidator, file_path: str,
+                  summarize: bool) -> Tuple[Tuple[bool, List[str], List[str]], Optional[Dict[str, Any]]]:
+    if summarize:
+        return validator.validate_file_with_skill(file_path)
+    return validator.validate_file(file_path), None
+    
+# Files per pool block; results are emitted block by block, in order
+BLOCK_FILES_PER_JOB = 32
+
+def _blocks(items: Iterable[str], size: int) -> Iterator[List[str]]:
+    block = []
+    for item in items:
+        block.append(item)
+        if len(block) == size:
+            yield block
+            block = []
+    if block:
+        yield block
         
-        for prompt in data['prompts']:
-            if 'depends_on' in prompt:
-                depends_on = prompt['depends_on']
-                if depends_on not in field_names:
-                    self.errors.append(f"Field '{prompt.get('field')}' depends on non-existent field '{depends_on}'")
-                    
-    def _validate_string_lengths(self, data: Dict[str, Any]) -> None:
-        """Validate string lengths to prevent UI issues"""
+def iter_validation_outcomes(files: Iterable[str], strict: bool = False, jobs: int = 1,
+                             cache: Optional[ValidationCache] = None,
+                             validator: Optional[SkillValidator] = None,
+                             summarize: bool = False) -> Iterator[Tuple[str, Tuple[bool, List[str], List[str]], Optional[Dict[str, Any]]]]:
+    """Yield (file, (is_valid, errors, warnings), cross-file summary) in input order as files are validated
+
+    Only a bounded block of files is in flight at a time, so memory does
+    not grow with the number of files. With jobs > 1 each block is split
+    into chunks validated in a process pool while the previous block is
+    being emitted. jobs=0 uses every CPU. A validator passed in (e.g. a
+    ProfilingValidator) is used for a serial run. The summary (see
+    cross_file_skill) is only built with summarize; it is None otherwise.
+    """
+    if jobs == 0:
+        jobs = os.cpu_count() or 1
         
-        # Check main fields
-        if 'name' in data and len(data['name']) > 50:
-            self.warnings.append("Name is very long (>50 chars) - may cause UI issues")
-            
-        if 'description' in data and len(data['description']) > 200:
-            self.warnings.append("Description is very long (>200 chars) - may cause UI issues")
+    def lookup(block: List[str]) -> List[List[Any]]:
+        entries = []
+        for file_path in block:
+            key = cache.key_for(file_path) if cache is not None else None
+            entries.append([file_path, key, cache.get(key, summarize) if cache is not None else None])
+        return entries
+        
+    def finish(entries: List[List[Any]], fresh: List[Tuple[Tuple[bool, List[str], List[str]], Optional[Dict[str, Any]]]]):
+        fresh = iter(fresh)
+        for entry in entries:
+            if entry[2] is None:
+                entry[2] = next(fresh)
+                if cache is not None:
+                    cache.put(entry[1], entry[2], summarize)
+            outcome, skill = entry[2]
+            if skill is not None and skill['source'] != entry[0]:
+                skill = dict(skill, source=entry[0])
+            yield entry[0], outcome, skill
             
-        # Check prompt strings
-        if 'prompts' in data:
-            for i, prompt in enumerate(data['prompts']):
-                if 'ask' in prompt and len(prompt['ask']) > 100:
-                    self.warnings.append(f"Prompt {i} question is very long (>100 chars) - may cause UI issues")
-                    
-                if 'hint' in prompt and len(prompt['hint']) > 150:
-                    self.warnings.append(f"Prompt {i} hint is very long (>150 chars) - may cause UI issues")
-                    
-    def _validate_regex_patterns(self, data: Dict[str, Any]) -> None:
-        """Validate regex patterns for syntax errors"""
+    if jobs <= 1:
+        validator = validator or SkillValidator(strict)
+        for file_path in files:
+            [entry] = lookup([file_path])
+            fresh = [_validate_one(validator, file_path, summarize)] if entry[2] is None else []
+            yield from finish([entry], fresh)
+        return
         
-        if 'prompts' not in data:
-            return
+    pool = None
+    in_flight: Deque[Tuple[List[List[Any]], List[Any]]] = deque()
+    
+    def drain():
+        entries, futures = in_flight.popleft()
+        return finish(entries, [outcome for future in futures for outcome in future.result()])
+        
+    try:
+        for entries in map(lookup, _blocks(files, jobs * BLOCK_FILES_PER_JOB)):
+            pending = [entry[0] for entry in entries if entry[2] is None]
+            futures = []
+            if pending:
+                if pool is None:
+                    pool = ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker,
+                                               initargs=(strict, summarize))
+                size = max(1, -(-len(pending) // (jobs * 4)))
+                futures = [pool.submit(_validate_chunk_in_worker, chunk) for chunk in _blocks(pending, size)]
+            in_flight.append((entries, futures))
+            # Keep the next block validating while this one is emitted
+            if len(in_flight) > 1:
+                yield from drain()
+        while in_flight:
+            yield from drain()
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+            
+def cross_file_messages(skills: List[Dict[str, Any]], strict: bool = False, check_triggers: bool = False,
+                        check_variants: bool = False) -> Dict[str, Tuple[List[str], List[str]]]:
+    """Merge the enabled cross-file checks over one list of skills, keyed by skill source
+
+    The skills are normalized skills or their cross_file_skill summaries,
+    loaded once and shared by every check.
+    """
+    merged: Dict[str, Tuple[List[str], List[str]]] = {}
+    checks = [check for check, enabled in ((trigger_collision_messages, check_triggers),
+                                           (variant_drift_messages, check_variants)) if enabled]
+    for check in checks:
+        for file_path, (errors, warnings) in check(skills, strict).items():
+            merged_errors, merged_warnings = merged.setdefault(file_path, ([], []))
+            merged_errors.extend(errors)
+            merged_warnings.extend(warnings)
+    return merged
+
+def trigger_collision_messages(skills: Iterable[Dict[str, Any]], strict: bool = False) -> Dict[str, Tuple[List[str], List[str]]]:
+    """Collision messages for already normalized skills, keyed by skill source
+
+    Duplicates are always errors because the app would pick either skill;
+    prefix and substring shadowing are warnings unless strict.
+    """
+    from skill_triggers import DUPLICATE, TriggerIndex, describe_collision
+    
+    messages: Dict[str, Tuple[List[str], List[str]]] = {}
+    for collision in TriggerIndex.from_skills(skills).collisions():
+        errors, warnings = messages.setdefault(collision['source'], ([], []))
+        if collision['kind'] == DUPLICATE:
+            errors.append(describe_collision(collision))
+            mirrored = dict(collision, source=collision['shadowed_source'], skill=collision['shadowed_skill'],
+                            shadowed_source=collision['source'], shadowed_skill=collision['skill'])
+            messages.setdefault(mirrored['source'], ([], []))[0].append(describe_collision(mirrored))
+        elif strict:
+            errors.append(describe_collision(collision))
+        else:
+            warnings.append(describe_collision(collision))
             
-        for i, prompt in enumerate(data['prompts']):
-            if 'validation' in prompt:
-                try:
-                    re.compile(prompt['validation'])
-                except re.error as e:
-                    self.errors.append(f"Prompt {i} has invalid regex pattern: {e}")
+    return messages
 
-def validate_directory(directory: str, strict: bool = False) -> Dict[str, Any]:
-    """Validate all skill files in a directory"""
+def variant_drift_messages(skills: Iterable[Dict[str, Any]], strict: bool = False) -> Dict[str, Tuple[List[str], List[str]]]:
+    """Variant drift messages for already normalized skills, keyed by skill source"""
+    from skill_variants import variant_messages
+    
+    return variant_messages(skills, strict)
+
+def iter_directory_results(directory: str, strict: bool = False, jobs: int = 1,
+                           cache: Optional[ValidationCache] = None,
+                           check_triggers: bool = False, check_variants: bool = False,
+                           profiler=None) -> Iterator[Dict[str, Any]]:
+    """Yield one result per skill file in a directory, in order, as it is validated
+
+    With jobs > 1 the files are validated in a process pool; results come
+    back in the same order as a serial run. jobs=0 uses every CPU.
+    With a cache, files whose content is unchanged replay their stored
+    result without being parsed. check_triggers adds the cross-skill
+    trigger collision check and check_variants the language variant
+    check; both run on the skill summaries that come with the outcomes
+    (cached, or from the same parse as the validation), so every file is
+    validated before the first result is yielded.
+    A skill_profile.Profiler times every phase of a serial run.
+    """
+    validator = ProfilingValidator(profiler, strict) if profiler is not None else None
+    summarize = check_triggers or check_variants
+    outcomes = iter_validation_outcomes(skill_catalog.iter_skill_files(directory), strict, jobs, cache, validator, summarize)
+    collisions: Dict[str, Tuple[List[str], List[str]]] = {}
+    if summarize:
+        outcomes = list(outcomes)
+        skills = [skill for _, _, skill in outcomes if skill is not None]
+        with profiler.phase('cross_file') if profiler is not None else contextlib.nullcontext():
+            collisions = cross_file_messages(skills, strict, check_triggers, check_variants)
+    
+    for file_path, (is_valid, errors, warnings), _ in outcomes:
+        if file_path in collisions:
+            extra_errors, extra_warnings = collisions[file_path]
+            errors = list(errors) + extra_errors
+            warnings = list(warnings) + extra_warnings
+            is_valid = not errors
+            
+        yield {
+            'file': file_path,
+            'valid': is_valid,
+            'errors': errors,
+            'warnings': warnings
+        }
+        
+    if cache is not None:
+        cache.save()
+        
+def validate_directory(directory: str, strict: bool = False, jobs: int = 1,
+                       cache: Optional[ValidationCache] = None,
+                       check_triggers: bool = False, check_variants: bool = False,
+                       profiler=None) -> Dict[str, Any]:
+    """Validate all skill files in a directory
+
+    Collects every result from iter_directory_results into one report;
+    the streaming output formats consume the iterator directly instead.
+    """
     
     results = {
         'total_files': 0,
@@ -231,104 +498,235 @@ def validate_directory(directory: str, strict: bool = False) -> Dict[str, Any]:
         'details': []
     }
     
-    validator = SkillValidator(strict)
-    
-    for file_path in Path(directory).rglob('*.yaml'):
-        if file_path.name.startswith('.'):
-            continue
-            
+    for file_result in iter_directory_results(directory, strict, jobs, cache, check_triggers, check_variants,
+                                              profiler):
         results['total_files'] += 1
-        
-        is_valid, errors, warnings = validator.validate_file(str(file_path))
-        
-        file_result = {
-            'file': str(file_path),
-            'valid': is_valid,
-            'errors': errors,
-            'warnings': warnings
-        }
-        
         results['details'].append(file_result)
         
-        if is_valid:
+        if file_result['valid']:
             results['valid_files'] += 1
         else:
             results['files_with_errors'] += 1
             
-        if warnings:
+        if file_result['warnings']:
             results['files_with_warnings'] += 1
             
     return results
 
 def main():
     parser = argparse.ArgumentParser(description='VoiceBridge Skill Template Validator')
-    parser.add_argument('path', help='Skill file or directory to validate')
+    parser.add_argument('path', nargs='?', help='Skill file or directory to validate')
     parser.add_argument('--strict', action='store_true', help='Enable strict validation mode')
-    parser.add_argument('--output', choices=['text', 'json'], default='text', help='Output format')
+    parser.add_argument('--output', choices=['text', 'json', 'jsonl', 'sarif'], default='text',
+                        help='Output format (jsonl and sarif stream one record per file)')
     parser.add_argument('--validate-all', action='store_true', help='Validate all files in directory')
+    parser.add_argument('--jobs', '-j', type=int, default=1, help='Validate directory files in N worker processes (0 = all CPUs)')
+    parser.add_argument('--no-cache', action='store_true', help='Revalidate every file instead of replaying cached results')
+    parser.add_argument('--cache-file', default=ValidationCache.DEFAULT_PATH, help='Location of the incremental lint cache')
+    parser.add_argument('--check-triggers', action='store_true', help='Report voice command triggers that collide across skills')
+    parser.add_argument('--check-variants', action='store_true', help='Report language variants of a form whose structure drifted apart')
+    parser.add_argument('--bench-regex', action='store_true', help='Benchmark validation regex latency on synthetic inputs')
+    parser.add_argument('--regex-budget-ms', type=float, default=1.0, help='Per-match latency budget for --bench-regex')
+    parser.add_argument('--bench-max-length', type=int, default=4096, help='Longest synthetic input for --bench-regex')
+    parser.add_argument('--budget', action='store_true', help='Report per-skill startup cost and fail on budget overruns')
+    parser.add_argument('--skill-budget-ms', type=float, default=50.0, help='Per-skill parse time budget for --budget')
+    parser.add_argument('--skill-budget-kb', type=float, default=128.0, help='Per-skill resident size budget for --budget')
+    parser.add_argument('--catalog-budget-ms', type=float, default=500.0, help='Whole-catalog parse time budget for --budget')
+    parser.add_argument('--catalog-budget-kb', type=float, default=1024.0, help='Whole-catalog resident size budget for --budget')
+    parser.add_argument('--profile', action='store_true', help='Report wall and CPU time per phase and per file (serial, uncached)')
+    parser.add_argument('--profile-top', type=int, default=10, help='Slowest files listed by --profile')
+    parser.add_argument('--profile-dump', metavar='FILE', help='Also write cProfile stats of the run to FILE (implies --profile)')
+    parser.add_argument('--lsp', action='store_true', help='Run as a language server over stdio (path is the fallback workspace root)')
     
     args = parser.parse_args()
     
-    if args.validate_all or os.path.isdir(args.path):
-        # Directory validation
-        results = validate_directory(args.path, args.strict)
+    if args.lsp:
+        from skill_lsp import LanguageServer, SkillWorkspace
+        
+        workspace = SkillWorkspace(SkillValidator(args.strict),
+                                   lambda skills: trigger_collision_messages(skills, args.strict))
+        server = LanguageServer(workspace)
+        server.root = args.path
+        sys.exit(server.serve())
+        
+    if args.path is None:
+        parser.error('the following arguments are required: path')
+    
+    if args.bench_regex:
+        import skill_regex_bench
+        
+        results = skill_regex_bench.bench_catalog([args.path], args.regex_budget_ms, args.bench_max_length)
         
         if args.output == 'json':
             print(json.dumps(results, indent=2))
         else:
-            print(f"📋 Validation Results for {args.path}")
-            print(f"━" * 50)
-            print(f"Total files: {results['total_files']}")
-            print(f"✅ Valid files: {results['valid_files']}")
-            print(f"❌ Files with errors: {results['files_with_errors']}")
-            print(f"⚠️  Files with warnings: {results['files_with_warnings']}")
-            print()
+            skill_regex_bench.print_report(results)
             
-            for detail in results['details']:
-                status = "✅" if detail['valid'] else "❌"
-                print(f"{status} {detail['file']}")
+        sys.exit(0 if results['over_budget'] == 0 else 1)
+    
+    if args.budget:
+        import skill_budget
+        
+        results = skill_budget.budget_catalog([args.path], args.skill_budget_ms, args.skill_budget_kb,
+                                              args.catalog_budget_ms, args.catalog_budget_kb)
+        
+        if args.output == 'json':
+            print(json.dumps(results, indent=2))
+        else:
+            skill_budget.print_report(results)
+            
+        sys.exit(0 if results['over_budget'] == 0 and not results['catalog_over_budget'] else 1)
+    
+    profiler = None
+    if args.profile or args.profile_dump:
+        import skill_profile
+        
+        profiler = skill_profile.Profiler()
+        if args.jobs != 1:
+            print("⚠️  --profile validates in this process; ignoring --jobs", file=sys.stderr)
+            args.jobs = 1
+        # A replayed result would hide the work being profiled
+        args.no_cache = True
+        
+    with contextlib.ExitStack() as profiling:
+        if profiler is not None:
+            profiling.enter_context(profiler.timing(skill_schema, '_regex_report', 'regex'))
+            if args.profile_dump:
+                import cProfile
                 
-                for error in detail['errors']:
-                    print(f"   ❌ {error}")
-                    
-                for warning in detail['warnings']:
-                    print(f"   ⚠️  {warning}")
+                cpu_profile = cProfile.Profile()
+                profiling.callback(cpu_profile.dump_stats, args.profile_dump)
+                profiling.callback(cpu_profile.disable)
+                cpu_profile.enable()
+        status = run_validation(args, profiler)
+        
+    if args.profile_dump:
+        print(f"📄 cProfile stats written to {args.profile_dump} (python -m pstats {args.profile_dump})",
+              file=sys.stderr)
+    sys.exit(status)
+
+def _output_phase(profiler):
+    return profiler.phase('output') if profiler is not None else contextlib.nullcontext()
+
+def _print_profile(profiler, args, stream=sys.stdout) -> None:
+    import skill_profile
+    
+    print(file=stream)
+    skill_profile.print_report(profiler.report(args.profile_top), stream)
+
+def run_validation(args, profiler=None) -> int:
+    """Validate the file or directory in args and print the report; returns the exit status"""
+    if args.validate_all or os.path.isdir(args.path):
+        # Directory validation
+        cache = None if args.no_cache else ValidationCache(args.cache_file, args.strict)
+        
+        if args.output in STREAM_WRITERS:
+            # Stream each result as it is validated; only the counters stay in memory
+            with STREAM_WRITERS[args.output](sys.stdout) as writer:
+                for file_result in iter_directory_results(args.path, args.strict, args.jobs,
+                                                          cache, args.check_triggers, args.check_variants,
+                                                          profiler):
+                    with _output_phase(profiler):
+                        writer.write(file_result)
                     
-                if detail['errors'] or detail['warnings']:
-                    print()
+            if cache is not None:
+                print(cache.stats_line(), file=sys.stderr)
+            if profiler is not None:
+                # stdout holds the stream, so the profile goes to stderr
+                _print_profile(profiler, args, sys.stderr)
+                
+            return 0 if writer.summary['files_with_errors'] == 0 else 1
+            
+        results = validate_directory(args.path, args.strict, args.jobs, cache, args.check_triggers,
+                                     args.check_variants, profiler)
+        
+        if cache is not None:
+            # Keep stdout byte-identical to an uncached run
+            print(cache.stats_line(), file=sys.stderr)
+        
+        if args.output == 'json':
+            with _output_phase(profiler):
+                report = json.dumps(results, indent=2)
+            if profiler is not None:
+                results['profile'] = profiler.report(args.profile_top)
+                report = json.dumps(results, indent=2)
+            print(report)
+        else:
+            with _output_phase(profiler):
+                print_directory_report(args.path, results)
+            if profiler is not None:
+                _print_profile(profiler, args)
                     
-        sys.exit(0 if results['files_with_errors'] == 0 else 1)
+        return 0 if results['files_with_errors'] == 0 else 1
         
     else:
         # Single file validation
-        validator = SkillValidator(args.strict)
+        validator = SkillValidator(args.strict) if profiler is None else ProfilingValidator(profiler, args.strict)
         is_valid, errors, warnings = validator.validate_file(args.path)
+        result = {
+            'file': args.path,
+            'valid': is_valid,
+            'errors': errors,
+            'warnings': warnings
+        }
         
-        if args.output == 'json':
-            result = {
-                'file': args.path,
-                'valid': is_valid,
-                'errors': errors,
-                'warnings': warnings
-            }
-            print(json.dumps(result, indent=2))
+        if args.output in STREAM_WRITERS:
+            with _output_phase(profiler), STREAM_WRITERS[args.output](sys.stdout) as writer:
+                writer.write(result)
+            if profiler is not None:
+                _print_profile(profiler, args, sys.stderr)
+        elif args.output == 'json':
+            with _output_phase(profiler):
+                report = json.dumps(result, indent=2)
+            if profiler is not None:
+                result['profile'] = profiler.report(args.profile_top)
+                report = json.dumps(result, indent=2)
+            print(report)
         else:
-            print(f"📋 Validating {args.path}")
-            print(f"━" * 50)
-            
-            if is_valid:
-                print("✅ Skill template is valid!")
-            else:
-                print("❌ Skill template has errors:")
-                for error in errors:
-                    print(f"   • {error}")
-                    
-            if warnings:
-                print("\n⚠️  Warnings:")
-                for warning in warnings:
-                    print(f"   • {warning}")
+            with _output_phase(profiler):
+                print_file_report(args.path, is_valid, errors, warnings)
+            if profiler is not None:
+                _print_profile(profiler, args)
                     
-        sys.exit(0 if is_valid else 1)
+        return 0 if is_valid else 1
+
+def print_directory_report(path: str, results: Dict[str, Any]) -> None:
+    print(f"📋 Validation Results for {path}")
+    print(f"━" * 50)
+    print(f"Total files: {results['total_files']}")
+    print(f"✅ Valid files: {results['valid_files']}")
+    print(f"❌ Files with errors: {results['files_with_errors']}")
+    print(f"⚠️  Files with warnings: {results['files_with_warnings']}")
+    print()
+    
+    for detail in results['details']:
+        status = "✅" if detail['valid'] else "❌"
+        print(f"{status} {detail['file']}")
+        
+        for error in detail['errors']:
+            print(f"   ❌ {error}")
+            
+        for warning in detail['warnings']:
+            print(f"   ⚠️  {warning}")
+            
+        if detail['errors'] or detail['warnings']:
+            print()
+
+def print_file_report(path: str, is_valid: bool, errors: List[str], warnings: List[str]) -> None:
+    print(f"📋 Validating {path}")
+    print(f"━" * 50)
+    
+    if is_valid:
+        print("✅ Skill template is valid!")
+    else:
+        print("❌ Skill template has errors:")
+        for error in errors:
+            print(f"   • {error}")
+            
+    if warnings:
+        print("\n⚠️  Warnings:")
+        for warning in warnings:
+            print(f"   • {warning}")
 
 if __name__ == '__main__':
     main()
\ No newline at end of file
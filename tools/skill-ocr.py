@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+VoiceBridge OCR Field Extraction (skill-ocr)
+
+Maps the labels in OCR text dumps of scanned forms to skill fields using the
+`aliases`, `patterns` and `validation` of the asset templates' field_mappings
+(see skill_ocr.py), and pulls out the validated values next to them. Files
+and folders of .txt dumps are streamed line by line, over several worker
+processes with --jobs.
+
+A dump with a labeled fixture beside it (name.json next to name.txt) is
+scored against it:
+
+    {"skill": "government_form_skill", "fields": {"first_name": "Maria", "zip_code": "33101"}}
+
+The report gives fields extracted per second and precision and recall per
+field; --output jsonl writes every document's fields instead, one per line.
+
+Usage:
+    python skill-ocr.py ocr-fixtures/
+    python skill-ocr.py scans/ --jobs 4 --output json
+    python skill-ocr.py scan.txt --skill medical_form_skill --output jsonl
+"""
+
+import os
+import sys
+import json
+import argparse
+from typing import Dict, Any
+
+from skill_catalog import ASSET_SKILLS_DIR
+from skill_ocr import ExtractionStats, FieldExtractor, extract_files, find_text_files, load_fixture, load_skills
+
+def _percent(value) -> str:
+    return f"{value:.1%}" if value is not None else "n/a"
+
+def print_report(report: Dict[str, Any], show_mistakes: int) -> None:
+    print(f"📄 {report['files']} files, {report['lines']} lines: {report['fields_extracted']} fields extracted, "
+          f"{report['values_rejected']} values rejected, {report['unmatched_files']} files without a form")
+    rate = report['fields_per_s']
+    print(f"⏱️  {report['elapsed_s']:.2f}s: {rate if rate is not None else 'n/a'} fields/s, "
+          f"{report['lines_per_s']} lines/s, {report['files_per_s']} files/s")
+    for skill, count in report['skills'].items():
+        print(f"   {skill}: {count}")
+    if not report['labeled_files']:
+        return
+
+    print(f"━" * 50)
+    print(f"🎯 {report['labeled_files']} labeled files: skill accuracy {_percent(report['skill_accuracy'])}, "
+          f"precision {_percent(report['precision'])}, recall {_percent(report['recall'])}")
+    width = max(len(field) for field in report['per_field']) if report['per_field'] else 5
+    print(f"{'field':<{width}} {'found':>6} {'right':>6} {'label':>6} {'precision':>10} {'recall':>8}")
+    for field, counts in report['per_field'].items():
+        print(f"{field:<{width}} {counts['extracted']:>6} {counts['correct']:>6} {counts['expected']:>6} "
+              f"{_percent(counts['precision']):>10} {_percent(counts['recall']):>8}")
+    for mistake in report['mistakes'][:show_mistakes]:
+        name = os.path.basename(mistake['file'])
+        what = f"field {mistake['field']}" if mistake['field'] else "skill"
+        print(f"   ❌ {name}: {what} expected {mistake['expected']!r}, got {mistake['got']!r}")
+
+def main():
+    parser = argparse.ArgumentParser(description='VoiceBridge OCR Field Extraction')
+    parser.add_argument('paths', nargs='+', help='OCR text dumps (.txt) or directories of them')
+    parser.add_argument('--skills', nargs='*', default=[str(ASSET_SKILLS_DIR)],
+                        help='Skill files or directories whose field labels are indexed')
+    parser.add_argument('--skill', help='Extract fields of this skill only instead of picking the best match')
+    parser.add_argument('--jobs', '-j', type=int, default=1, help='Worker processes')
+    parser.add_argument('--show-mistakes', type=int, default=20, help='Fixture mismatches listed')
+    parser.add_argument('--output', choices=['text', 'json', 'jsonl'], default='text', help='Output format')
+
+    args = parser.parse_args()
+
+    skills, skipped = load_skills(args.skills)
+    for message in skipped:
+        print(f"⚠️  Skipping {message}", file=sys.stderr)
+    extractor = FieldExtractor(skills, args.skill)
+    if not extractor.skill_ids:
+        print(f"❌ No skills with fields{f' named {args.skill}' if args.skill else ''} in {', '.join(args.skills)}")
+        sys.exit(1)
+
+    files = find_text_files(args.paths)
+    if not files:
+        print(f"❌ No OCR text files in {', '.join(args.paths)}")
+        sys.exit(1)
+
+    stats = ExtractionStats()
+    for document in extract_files(files, extractor, max(1, args.jobs)):
+        try:
+            fixture = load_fixture(document['file'])
+        except (OSError, ValueError) as e:
+            print(f"⚠️  Ignoring fixture: {e}", file=sys.stderr)
+            fixture = None
+        stats.add(document, fixture)
+        if args.output == 'jsonl':
+            print(json.dumps(document))
+    report = stats.report()
+    report['labels'] = len(extractor.labels)
+    report['skills_indexed'] = len(extractor.skill_ids)
+
+    if args.output == 'json':
+        print(json.dumps(report, indent=2))
+    elif args.output == 'jsonl':
+        summary = {key: value for key, value in report.items() if key not in ('per_field', 'mistakes')}
+        print(json.dumps(summary), file=sys.stderr)
+    else:
+        print(f"🔎 {report['labels']} labels from {report['skills_indexed']} skills")
+        print(f"━" * 50)
+        print_report(report, args.show_mistakes)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+VoiceBridge Transcript Replay (skill-replay)
+
+Replays a JSONL corpus of (anonymized) transcripts against every skill's
+voice command triggers without a phone. Each line is one utterance:
+
+    {"id": "u1", "text": "fil medical in take", "expected": "medical_intake"}
+
+"expected" is the skill the utterance should start, or null when it should
+start none. Every utterance goes through the fuzzy trigger index
+(skill_replay.py) and through the app's current `contains` matching, and
+both are reported side by side: recall, precision, false matches, the
+skills they confuse, per-utterance latency percentiles and throughput.
+
+Usage:
+    python skill-replay.py transcripts/sample.jsonl
+    python skill-replay.py corpus.jsonl --skills skills/ --output json
+    python skill-replay.py corpus.jsonl --min-recall 0.95
+"""
+
+import sys
+import json
+import argparse
+from typing import Dict, Any
+
+from skill_catalog import SKILLS_DIR, find_skill_files, load_skill
+from skill_replay import (DEFAULT_CANDIDATES, DEFAULT_THRESHOLD, ContainsMatcher, FuzzyTriggerIndex,
+                          load_corpus, replay)
+
+def print_result(label: str, result: Dict[str, Any], show_misses: int) -> None:
+    latency = result['latency_us']
+    recall = f"{result['recall']:.1%}" if result['recall'] is not None else "n/a"
+    precision = f"{result['precision']:.1%}" if result['precision'] is not None else "n/a"
+    print(f"{label}")
+    print(f"   recall {recall} ({result['correct']}/{result['positives']}), precision {precision}, "
+          f"{result['missed']} missed, {result['wrong_skill']} wrong skill, {result['false_matches']} false matches")
+    print(f"   latency p50 {latency['p50']:.1f} µs, p90 {latency['p90']:.1f} µs, p99 {latency['p99']:.1f} µs, "
+          f"max {latency['max']:.1f} µs; {result['throughput_per_s']:,.0f} utterances/s")
+    for expected, predicted in result['confusion'].items():
+        for skill, count in predicted.items():
+            if skill != expected:
+                print(f"   🔀 {expected} → {skill}: {count}")
+    for miss in result['misses'][:show_misses]:
+        got = f"{miss['predicted']} via '{miss['trigger']}' ({miss['score']})" if miss['predicted'] else "nothing"
+        print(f"   ❌ [{miss['id']}] \"{miss['text']}\" expected {miss['expected']}, got {got}")
+
+def main():
+    parser = argparse.ArgumentParser(description='VoiceBridge Transcript Replay')
+    parser.add_argument('corpus', help='JSONL transcripts with "text" and "expected" skill id (or null)')
+    parser.add_argument('--skills', nargs='*', default=[str(SKILLS_DIR)], help='Skill files or directories to load')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help='Highest alignment cost per trigger word accepted as a fuzzy match')
+    parser.add_argument('--candidates', type=int, default=DEFAULT_CANDIDATES,
+                        help='Triggers aligned per utterance after the n-gram lookup')
+    parser.add_argument('--repeat', type=int, default=1,
+                        help='Match each utterance N times and keep the fastest (N > 1 measures warm caches)')
+    parser.add_argument('--show-misses', type=int, default=20, help='Misses listed per matcher')
+    parser.add_argument('--min-recall', type=float, help='Exit 1 if the fuzzy index recall is below this')
+    parser.add_argument('--output', choices=['text', 'json'], default='text', help='Output format')
+
+    args = parser.parse_args()
+
+    try:
+        corpus = load_corpus(args.corpus)
+    except (OSError, ValueError) as e:
+        print(f"❌ Cannot read corpus: {e}")
+        sys.exit(1)
+
+    skills = []
+    for file_path in find_skill_files(args.skills):
+        try:
+            skills.append(load_skill(file_path))
+        except Exception as e:
+            print(f"⚠️  Skipping {file_path}: {str(e).splitlines()[0]}", file=sys.stderr)
+
+    index = FuzzyTriggerIndex(skills, args.threshold, args.candidates)
+    repeat = max(1, args.repeat)
+    results = {
+        'corpus': args.corpus,
+        'skills': len(skills),
+        'triggers': len(index.triggers),
+        'fuzzy': replay(index, corpus, repeat),
+        'contains': replay(ContainsMatcher(skills), corpus, repeat),
+    }
+
+    if args.output == 'json':
+        print(json.dumps(results, indent=2))
+    else:
+        print(f"🎙️  Replayed {len(corpus)} transcripts against {results['triggers']} triggers "
+              f"in {results['skills']} skills")
+        print(f"━" * 50)
+        print_result("Fuzzy index (n-grams + BK-tree)", results['fuzzy'], args.show_misses)
+        print()
+        print_result("App matching (contains)", results['contains'], args.show_misses)
+
+    recall = results['fuzzy']['recall']
+    sys.exit(1 if args.min_recall is not None and recall is not None and recall < args.min_recall else 0)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+VoiceBridge Form Selector Checker (skill-selectors)
+
+Evaluates every skill's `accessibility.form_selectors` against a directory of
+saved HTML form fixtures. Reports, per skill, which fields each selector hits
+or misses on the skill's fixtures, fields whose selectors grab the same
+element, and how long each selector takes to evaluate.
+
+Usage:
+    python skill-selectors.py fixtures/ [skill paths ...] [--min-coverage 0.5]
+    python skill-selectors.py fixtures/ skills/forms/medical_intake.yaml --json
+"""
+
+import os
+import sys
+import json
+import argparse
+
+from skill_catalog import SKILLS_DIR, find_skill_files, load_skill
+from skill_selectors import DEFAULT_MIN_COVERAGE, evaluate_catalog
+
+def print_report(results, fixtures_dir: str):
+    print(f"🎯 Selector check: {results['fixtures']} fixtures, {results['elements']:,} elements "
+          f"(indexed in {results['index_ms']:.1f} ms, evaluated in {results['eval_ms']:.1f} ms)")
+    print(f"━" * 50)
+    for report in results['skills']:
+        print(f"\n📋 {report['skill']} ({report['source']})")
+        print(f"   Matching fixtures: {len(report['fixtures'])}")
+        for entry in report['fields']:
+            if 'error' in entry:
+                print(f"   ❌ {entry['field']}: {entry['error']}")
+                continue
+            status = "⚠️ " if entry['misses'] else "✅"
+            print(f"   {status} {entry['field']}: {entry['hits']}/{len(report['fixtures'])} fixtures, "
+                  f"{entry['time_ms']:.3f} ms  {entry['selector']}")
+            for miss in entry['misses'][:5]:
+                print(f"      • misses {os.path.relpath(miss, fixtures_dir)}")
+            if len(entry['misses']) > 5:
+                print(f"      • ... and {len(entry['misses']) - 5} more")
+        for overlap in report['overlaps']:
+            print(f"   ❌ {', '.join(overlap['fields'])} select the same element "
+                  f"({overlap['elements']}x), e.g. {overlap['example']}")
+    for error in results['parse_errors']:
+        print(f"⚠️  Could not read {error['file']}: {error['reason']}")
+
+def main():
+    parser = argparse.ArgumentParser(description='VoiceBridge Form Selector Checker')
+    parser.add_argument('fixtures', help='Directory of saved HTML form fixtures')
+    parser.add_argument('paths', nargs='*', default=[str(SKILLS_DIR)], help='Skill files or directories to check')
+    parser.add_argument('--min-coverage', type=float, default=DEFAULT_MIN_COVERAGE,
+                        help="Share of a skill's fields a fixture must hit to count as that skill's form")
+    parser.add_argument('--json', action='store_true', help='Output results as JSON')
+
+    args = parser.parse_args()
+
+    if not os.path.isdir(args.fixtures):
+        print(f"❌ Fixture directory not found: {args.fixtures}")
+        sys.exit(1)
+
+    skills = []
+    for file_path in find_skill_files(args.paths):
+        try:
+            skills.append(load_skill(file_path))
+        except Exception as e:
+            print(f"⚠️  Skipping {file_path}: {str(e).splitlines()[0]}", file=sys.stderr)
+
+    results = evaluate_catalog(args.fixtures, skills, args.min_coverage)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print_report(results, args.fixtures)
+
+    failed = any(report['overlaps'] or any('error' in entry for entry in report['fields'])
+                 for report in results['skills'])
+    sys.exit(1 if failed else 0)
+
+if __name__ == '__main__':
+    main()
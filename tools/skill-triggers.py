@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+VoiceBridge Trigger Index Builder (skill-triggers)
+
+Builds the global voice command trigger index for every skill and language,
+reports triggers that collide across skills and exports the automaton as a
+JSON artifact the app can load to match an utterance in one pass.
+
+Usage:
+    python skill-triggers.py [paths ...] [-o build/trigger-index.json]
+    python skill-triggers.py skills/ --match "please fill tax form now"
+"""
+
+import os
+import sys
+import json
+import argparse
+
+from skill_catalog import SKILLS_DIR, find_skill_files, load_skill
+from skill_triggers import DUPLICATE, TriggerIndex, describe_collision
+
+DEFAULT_OUTPUT = os.path.join('build', 'trigger-index.json')
+
+def main():
+    parser = argparse.ArgumentParser(description='VoiceBridge Trigger Index Builder')
+    parser.add_argument('paths', nargs='*', default=[str(SKILLS_DIR)], help='Skill files or directories to index')
+    parser.add_argument('--output', '-o', default=DEFAULT_OUTPUT, help='Index file to write')
+    parser.add_argument('--match', help='Print the skills an utterance would trigger and exit')
+
+    args = parser.parse_args()
+
+    skills = []
+    for file_path in find_skill_files(args.paths):
+        try:
+            skills.append(load_skill(file_path))
+        except Exception as e:
+            print(f"⚠️  Skipping {file_path}: {str(e).splitlines()[0]}")
+
+    index = TriggerIndex.from_skills(skills)
+
+    if args.match is not None:
+        for trigger in index.match(args.match):
+            print(f"{trigger['skill']}: '{trigger['trigger']}' ({trigger['language']})")
+        return
+
+    collisions = index.collisions()
+    print(f"🔀 Trigger index: {len(index.triggers)} triggers, {len(index.tokens)} tokens, "
+          f"{len(index.children)} nodes")
+    print(f"━" * 50)
+    for collision in collisions:
+        marker = "❌" if collision['kind'] == DUPLICATE else "⚠️ "
+        print(f"{marker} [{collision['kind']}] {collision['source']}")
+        print(f"   {describe_collision(collision)}")
+    if not collisions:
+        print("✅ No trigger collisions between skills")
+
+    output_dir = os.path.dirname(args.output)
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(index.export(), f, ensure_ascii=False, separators=(',', ':'))
+    print(f"📦 Wrote {args.output} ({os.path.getsize(args.output):,} bytes)")
+
+    sys.exit(1 if any(c['kind'] == DUPLICATE for c in collisions) else 0)
+
+if __name__ == '__main__':
+    main()
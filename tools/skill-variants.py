@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+VoiceBridge Variant Family Checker (skill-variants)
+
+Groups form skills into families of language variants (`variant_of`, or the
+id without its language suffix), hashes each variant's language-independent
+structure and reports the fields every variant is missing or has diverged
+on compared with the rest of its family.
+
+Usage:
+    python skill-variants.py [paths ...] [--json]
+    python skill-variants.py skills/ android/app/src/main/assets/skills/
+"""
+
+import sys
+import json
+import time
+import argparse
+
+from skill_catalog import SKILLS_DIR, find_skill_files, load_skill
+from skill_variants import check_variants, describe_variant
+
+def print_report(reports, elapsed_ms: float) -> None:
+    print(f"🌐 Variant families: {len(reports)} with more than one variant (checked in {elapsed_ms:.2f} ms)")
+    print(f"━" * 50)
+    for report in reports:
+        status = "✅" if report['consistent'] else "⚠️ "
+        print(f"\n{status} {report['family']}: {', '.join(report['languages'])}")
+        for language in report['duplicate_languages']:
+            print(f"   ⚠️  More than one '{language}' variant")
+        for variant in report['variants']:
+            messages = describe_variant(report['family'], variant)
+            marker = "⚠️ " if messages else "✅"
+            print(f"   {marker} {variant['skill']} ({variant['language']}) {variant['hash']}  {variant['source']}")
+            for message in messages:
+                print(f"      • {message}")
+
+def main():
+    parser = argparse.ArgumentParser(description='VoiceBridge Variant Family Checker')
+    parser.add_argument('paths', nargs='*', default=[str(SKILLS_DIR)], help='Skill files or directories to check')
+    parser.add_argument('--json', action='store_true', help='Output results as JSON')
+
+    args = parser.parse_args()
+
+    skills = []
+    for file_path in find_skill_files(args.paths):
+        try:
+            skills.append(load_skill(file_path))
+        except Exception as e:
+            print(f"⚠️  Skipping {file_path}: {str(e).splitlines()[0]}", file=sys.stderr)
+
+    start = time.perf_counter()
+    reports = check_variants(skills)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    if args.json:
+        print(json.dumps(reports, indent=2))
+    else:
+        print_report(reports, elapsed_ms)
+
+    sys.exit(0 if all(report['consistent'] for report in reports) else 1)
+
+if __name__ == '__main__':
+    main()
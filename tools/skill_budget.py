@@ -0,0 +1,195 @@
+"""
+Startup cost and memory budget for skill templates
+
+Backs `skill-lint.py --budget`. `SkillEngine.initialize()` parses every
+template at launch and keeps the parsed object graph resident, so each
+template costs cold start time and heap. For every skill this measures:
+
+- parse time: median YAML parse of the file's text
+- footprint: strings and their UTF-8 bytes, containers, and an estimate of
+  the resident size of the parsed graph (sum of distinct object sizes)
+- shape: prompts, validation regexes and form selectors
+- serialized size: bytes on disk and as compact JSON
+
+Skills are ranked by parse time. A skill fails when it cannot be parsed or
+goes over the per-skill budget; the run fails when the catalog totals go
+over the catalog budget.
+"""
+
+import json
+import statistics
+import sys
+import time
+from typing import Dict, List, Any
+
+import yaml
+
+from skill_catalog import find_skill_files, is_asset_schema, normalize_skill
+from skill_fragments import FragmentError, resolve_fragments
+
+DEFAULT_SKILL_BUDGET_MS = 50.0
+DEFAULT_SKILL_BUDGET_KB = 128.0
+DEFAULT_CATALOG_BUDGET_MS = 500.0
+DEFAULT_CATALOG_BUDGET_KB = 1024.0
+DEFAULT_REPEAT = 5
+
+def footprint(data: Any) -> Dict[str, int]:
+    """Walk a parsed document and size its object graph"""
+    counts = {'strings': 0, 'string_bytes': 0, 'containers': 0, 'scalars': 0, 'resident_bytes': 0}
+    seen = set()
+    stack = [data]
+    while stack:
+        value = stack.pop()
+        if id(value) in seen:
+            continue
+        seen.add(id(value))
+        counts['resident_bytes'] += sys.getsizeof(value)
+        if isinstance(value, str):
+            counts['strings'] += 1
+            counts['string_bytes'] += len(value.encode('utf-8'))
+        elif isinstance(value, dict):
+            counts['containers'] += 1
+            stack.extend(value.keys())
+            stack.extend(value.values())
+        elif isinstance(value, (list, tuple, set)):
+            counts['containers'] += 1
+            stack.extend(value)
+        else:
+            counts['scalars'] += 1
+    return counts
+
+def shape(skill: Dict[str, Any]) -> Dict[str, int]:
+    """Prompt, regex and selector counts of a normalized skill"""
+    regexes = sum(1 for prompt in skill['prompts'] if isinstance(prompt['validation'], str))
+    regexes += sum(1 for action in skill['postprocess'] if isinstance(action['pattern'], str))
+    return {
+        'prompts': len(skill['prompts']),
+        'regexes': regexes,
+        'selectors': len(skill['selectors']) + (1 if skill['submit_button'] else 0),
+    }
+
+def time_parse(text: str, repeat: int) -> float:
+    """Median milliseconds to parse text the way the linter does"""
+    samples = []
+    for _ in range(max(1, repeat)):
+        start = time.perf_counter()
+        yaml.safe_load(text)
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1000
+
+def measure_skill(file_path: str, repeat: int = DEFAULT_REPEAT) -> Dict[str, Any]:
+    """Cost record for one template; 'error' is set when it cannot be parsed"""
+    with open(file_path, 'rb') as f:
+        raw = f.read()
+    record: Dict[str, Any] = {'file': file_path, 'file_bytes': len(raw)}
+
+    try:
+        text = raw.decode('utf-8')
+        data = yaml.safe_load(text)
+    except (UnicodeDecodeError, yaml.YAMLError) as e:
+        record['error'] = str(e).splitlines()[0]
+        return record
+    if not isinstance(data, dict):
+        record['error'] = "Root element must be a dictionary/object"
+        return record
+    try:
+        data = resolve_fragments(data, file_path)
+    except (OSError, FragmentError) as e:
+        record['error'] = str(e)
+        return record
+
+    # The catalog is measured without validating it first, so a template of
+    # the wrong shape is one failed record rather than the end of the report
+    try:
+        skill = normalize_skill(data, file_path)
+        skill_shape = shape(skill)
+    except Exception as e:
+        record['error'] = f"invalid structure: {str(e).splitlines()[0]}"
+        return record
+    record['skill'] = skill['id']
+    record['schema'] = 'asset' if is_asset_schema(data) else 'form'
+    record['parse_ms'] = round(time_parse(text, repeat), 3)
+    record.update(footprint(data))
+    record.update(skill_shape)
+    record['json_bytes'] = len(json.dumps(data, separators=(',', ':'), default=str).encode('utf-8'))
+    return record
+
+def budget_catalog(paths: List[str], skill_budget_ms: float = DEFAULT_SKILL_BUDGET_MS,
+                   skill_budget_kb: float = DEFAULT_SKILL_BUDGET_KB,
+                   catalog_budget_ms: float = DEFAULT_CATALOG_BUDGET_MS,
+                   catalog_budget_kb: float = DEFAULT_CATALOG_BUDGET_KB,
+                   repeat: int = DEFAULT_REPEAT) -> Dict[str, Any]:
+    """Measure every skill under paths and check it against the budgets"""
+    results = {
+        'budgets': {
+            'skill_ms': skill_budget_ms,
+            'skill_kb': skill_budget_kb,
+            'catalog_ms': catalog_budget_ms,
+            'catalog_kb': catalog_budget_kb,
+        },
+        'totals': {'skills': 0, 'parse_ms': 0.0, 'resident_bytes': 0, 'file_bytes': 0, 'json_bytes': 0,
+                   'string_bytes': 0, 'prompts': 0, 'regexes': 0, 'selectors': 0},
+        'over_budget': 0,
+        'catalog_over_budget': [],
+        'details': [],
+    }
+    totals = results['totals']
+
+    for file_path in find_skill_files(paths):
+        record = measure_skill(file_path, repeat)
+        problems = []
+        if 'error' in record:
+            problems.append(f"cannot be parsed: {record['error']}")
+        else:
+            if record['parse_ms'] > skill_budget_ms:
+                problems.append(f"parse {record['parse_ms']:.2f} ms exceeds {skill_budget_ms} ms")
+            if record['resident_bytes'] / 1024 > skill_budget_kb:
+                problems.append(f"resident {record['resident_bytes'] / 1024:.1f} KB exceeds {skill_budget_kb} KB")
+            totals['skills'] += 1
+            for key in ('parse_ms', 'resident_bytes', 'json_bytes', 'string_bytes', 'prompts', 'regexes', 'selectors'):
+                totals[key] += record[key]
+        totals['file_bytes'] += record['file_bytes']
+        record['problems'] = problems
+        if problems:
+            results['over_budget'] += 1
+        results['details'].append(record)
+
+    totals['parse_ms'] = round(totals['parse_ms'], 3)
+    if totals['parse_ms'] > catalog_budget_ms:
+        results['catalog_over_budget'].append(
+            f"catalog parse {totals['parse_ms']:.2f} ms exceeds {catalog_budget_ms} ms")
+    if totals['resident_bytes'] / 1024 > catalog_budget_kb:
+        results['catalog_over_budget'].append(
+            f"catalog resident {totals['resident_bytes'] / 1024:.1f} KB exceeds {catalog_budget_kb} KB")
+
+    # Most expensive first; unparseable templates lead since the app cannot load them at all
+    results['details'].sort(key=lambda record: (
+        'error' not in record, -record.get('parse_ms', 0.0), -record.get('resident_bytes', 0)))
+    return results
+
+def print_report(results: Dict[str, Any]) -> None:
+    budgets = results['budgets']
+    print(f"📦 Skill startup budget (per skill {budgets['skill_ms']} ms / {budgets['skill_kb']} KB, "
+          f"catalog {budgets['catalog_ms']} ms / {budgets['catalog_kb']} KB)")
+    print(f"━" * 50)
+    for rank, record in enumerate(results['details'], 1):
+        status = "❌" if record['problems'] else "✅"
+        if 'error' in record:
+            print(f"{rank:>3}. {status} {record['file']}  ({record['file_bytes']:,} bytes on disk)")
+        else:
+            print(f"{rank:>3}. {status} {record['skill']} ({record['file']})")
+            print(f"       parse {record['parse_ms']:.2f} ms, resident {record['resident_bytes'] / 1024:.1f} KB, "
+                  f"{record['strings']:,} strings / {record['string_bytes']:,} bytes")
+            print(f"       {record['prompts']} prompts, {record['regexes']} regexes, {record['selectors']} selectors, "
+                  f"{record['file_bytes']:,} bytes on disk, {record['json_bytes']:,} as JSON")
+        for problem in record['problems']:
+            print(f"       ❌ {problem}")
+    totals = results['totals']
+    print()
+    print(f"Skills measured: {totals['skills']}")
+    print(f"Catalog: parse {totals['parse_ms']:.2f} ms, resident {totals['resident_bytes'] / 1024:.1f} KB, "
+          f"{totals['file_bytes']:,} bytes on disk, {totals['json_bytes']:,} as JSON")
+    print(f"Catalog shape: {totals['prompts']} prompts, {totals['regexes']} regexes, {totals['selectors']} selectors")
+    for problem in results['catalog_over_budget']:
+        print(f"❌ {problem}")
+    print(f"❌ Skills over budget: {results['over_budget']}")
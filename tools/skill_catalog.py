@@ -0,0 +1,240 @@
+"""
+VoiceBridge Skill Catalog helpers
+
+Shared loading code for the skill tooling. The repo ships two template
+schemas and this module maps both onto one normalized shape:
+
+- Form skills (skills/forms/*.yaml): prompts, postprocess, accessibility, commands
+- Asset skills (android/app/src/main/assets/skills/*.yaml): field_mappings,
+  voice_commands, languages
+"""
+
+import importlib.util
+import os
+import sys
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Iterable, Iterator
+
+from skill_fragments import is_fragment_library, resolve_fragments
+
+TOOLS_DIR = Path(__file__).resolve().parent
+REPO_ROOT = TOOLS_DIR.parent
+SKILLS_DIR = REPO_ROOT / 'skills'
+ASSET_SKILLS_DIR = REPO_ROOT / 'android' / 'app' / 'src' / 'main' / 'assets' / 'skills'
+
+# Every skill tool, including skill-lint and its cache, looks for this pattern
+SKILL_GLOB = '*.yaml'
+
+# Asset templates carry no prompt type, so infer one from the field name
+ASSET_TYPE_HINTS = [
+    ('email', 'email'),
+    ('phone', 'phone'),
+    ('ssn', 'ssn'),
+    ('social_security', 'ssn'),
+    ('date', 'date'),
+    ('dob', 'date'),
+    ('salary', 'currency'),
+    ('income', 'currency'),
+    ('address', 'address'),
+    ('name', 'name'),
+]
+
+_skill_lint_module = None
+
+def load_skill_lint():
+    """Import tools/skill-lint.py, whose file name is not a valid module name"""
+    global _skill_lint_module
+    if _skill_lint_module is None:
+        module = sys.modules.get('skill_lint')
+        if module is None:
+            spec = importlib.util.spec_from_file_location('skill_lint', TOOLS_DIR / 'skill-lint.py')
+            module = importlib.util.module_from_spec(spec)
+            sys.modules['skill_lint'] = module
+            spec.loader.exec_module(module)
+        _skill_lint_module = module
+    return _skill_lint_module
+
+def iter_skill_files(directory: str) -> Iterator[str]:
+    """Lazily yield the skill files under a directory, skipping dotfiles and fragment libraries"""
+    for file_path in Path(directory).rglob(SKILL_GLOB):
+        if not file_path.name.startswith('.') and not is_fragment_library(str(file_path)):
+            yield str(file_path)
+
+def find_skill_files(paths: Iterable[str]) -> List[str]:
+    """Expand files and directories into a sorted list of skill files"""
+    found = []
+    for path in paths:
+        if os.path.isdir(path):
+            found.extend(iter_skill_files(path))
+        else:
+            found.append(str(path))
+    return sorted(set(found))
+
+def normalize_trigger(trigger: str) -> str:
+    """Lowercase and collapse whitespace the way the app compares commands"""
+    return ' '.join(str(trigger).lower().split())
+
+def is_asset_schema(data: Dict[str, Any]) -> bool:
+    """True for asset-style templates built on field_mappings"""
+    return 'field_mappings' in data and 'prompts' not in data
+
+def skill_id_for(data: Dict[str, Any], source: str) -> str:
+    """Asset templates have no id, so fall back to the file name"""
+    skill_id = data.get('id')
+    if isinstance(skill_id, str) and skill_id:
+        return skill_id
+    return Path(source).stem
+
+def infer_asset_type(field: str, spec: Dict[str, Any]) -> str:
+    if spec.get('options'):
+        return 'select'
+    if spec.get('multiline'):
+        return 'textarea'
+    for hint, field_type in ASSET_TYPE_HINTS:
+        if hint in field:
+            return field_type
+    return 'text'
+
+def _text(value: Any) -> Optional[str]:
+    return None if value is None else str(value)
+
+# The normalizer runs on unvalidated data too (editors, batch tools), so a
+# section of the wrong type reads as empty instead of raising
+def _dict(value: Any) -> Dict[str, Any]:
+    return value if isinstance(value, dict) else {}
+
+def _list(value: Any) -> List[Any]:
+    return value if isinstance(value, list) else []
+
+def _normalize_prompt(prompt: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        'field': prompt.get('field'),
+        'ask': prompt.get('ask', ''),
+        'hint': prompt.get('hint', ''),
+        'type': prompt.get('type', 'text'),
+        'required': bool(prompt.get('required', False)),
+        'validation': prompt.get('validation'),
+        'format': _text(prompt.get('format')),
+        'options': list(_list(prompt.get('options'))),
+        'min': prompt.get('min'),
+        'max': prompt.get('max'),
+        'default': _text(prompt.get('default')),
+        'depends_on': prompt.get('depends_on'),
+        'show_when': prompt.get('show_when'),
+        'group': None,
+        'aliases': [],
+        'patterns': [],
+    }
+
+def _normalize_form_skill(data: Dict[str, Any], source: str) -> Dict[str, Any]:
+    accessibility = _dict(data.get('accessibility'))
+    return {
+        'id': skill_id_for(data, source),
+        'schema': 'form',
+        'source': source,
+        'language': data.get('language', 'en'),
+        'languages': [data.get('language', 'en')],
+        'name': data.get('name', ''),
+        'description': data.get('description', ''),
+        'version': _text(data.get('version', '1.0')),
+        'category': data.get('category', 'general'),
+        'variant_of': data.get('variant_of'),
+        'prompts': [_normalize_prompt(p) for p in _list(data.get('prompts')) if isinstance(p, dict)],
+        'postprocess': [
+            {
+                'action': action.get('action'),
+                'field': action.get('field'),
+                'format': _text(action.get('format')),
+                'pattern': action.get('pattern'),
+            }
+            for action in _list(data.get('postprocess')) if isinstance(action, dict)
+        ],
+        'selectors': dict(_dict(accessibility.get('form_selectors'))),
+        'submit_button': accessibility.get('submit_button'),
+        'target_app': accessibility.get('target_app'),
+        'commands': [
+            {
+                'trigger': str(command.get('trigger', '')),
+                'action': command.get('action', 'execute_skill'),
+                'skill': command.get('skill') or skill_id_for(data, source),
+                'fields': [],
+            }
+            for command in _list(data.get('commands')) if isinstance(command, dict)
+        ],
+    }
+
+def _normalize_asset_skill(data: Dict[str, Any], source: str) -> Dict[str, Any]:
+    skill_id = skill_id_for(data, source)
+    languages = [str(lang) for lang in _list(data.get('languages')) or ['en']]
+
+    prompts = []
+    for group, fields in _dict(data.get('field_mappings')).items():
+        if not isinstance(fields, dict):
+            continue
+        for field, spec in fields.items():
+            if not isinstance(spec, dict):
+                continue
+            field = str(field)
+            aliases = [str(alias) for alias in _list(spec.get('aliases'))]
+            prompt = _normalize_prompt({
+                'field': field,
+                'ask': aliases[0] if aliases else field.replace('_', ' '),
+                'type': infer_asset_type(field, spec),
+                'required': spec.get('required', False),
+                'validation': spec.get('validation'),
+                'format': spec.get('format'),
+                'options': spec.get('options'),
+                'default': spec.get('default'),
+            })
+            prompt['group'] = group
+            prompt['aliases'] = aliases
+            prompt['patterns'] = [str(pattern) for pattern in _list(spec.get('patterns'))]
+            prompts.append(prompt)
+
+    voice_commands = _dict(data.get('voice_commands'))
+    commands = []
+    for entry in _list(voice_commands.get('patterns')):
+        if isinstance(entry, dict) and 'pattern' in entry:
+            commands.append({
+                'trigger': str(entry['pattern']),
+                'action': 'fill_fields',
+                'skill': skill_id,
+                'fields': [f.get('field') for f in _list(entry.get('fields')) if isinstance(f, dict)],
+            })
+    for trigger in _list(voice_commands.get('navigation_commands')):
+        commands.append({'trigger': str(trigger), 'action': 'navigate', 'skill': skill_id, 'fields': []})
+
+    return {
+        'id': skill_id,
+        'schema': 'asset',
+        'source': source,
+        'language': languages[0] if languages else 'en',
+        'languages': languages,
+        'name': data.get('name', ''),
+        'description': data.get('description', ''),
+        'version': _text(data.get('version', '1.0')),
+        'category': data.get('category', 'general'),
+        'variant_of': None,
+        'prompts': prompts,
+        'postprocess': [],
+        'selectors': {},
+        'submit_button': None,
+        'target_app': None,
+        'commands': commands,
+    }
+
+def normalize_skill(data: Dict[str, Any], source: str) -> Dict[str, Any]:
+    """Map either template schema onto the normalized skill shape"""
+    if is_asset_schema(data):
+        return _normalize_asset_skill(data, source)
+    return _normalize_form_skill(data, source)
+
+def load_skill(file_path: str) -> Dict[str, Any]:
+    """Parse and normalize one skill file; raises on YAML or shape errors"""
+    import yaml
+
+    with open(file_path, 'r', encoding='utf-8') as f:
+        data = yaml.safe_load(f)
+    if not isinstance(data, dict):
+        raise ValueError("Root element must be a dictionary/object")
+    return normalize_skill(resolve_fragments(data, file_path), file_path)
@@ -0,0 +1,308 @@
+"""
+Dialog paths through conditional prompts
+
+Every prompt is a spoken round trip, and `depends_on` / `show_when` decide
+which prompts a user is actually asked. This module builds the conditional
+prompt graph of a skill and measures the distinct answer paths through it.
+
+A prompt is asked when the dialog reaches it in file order and, if it has
+`depends_on`, its parent was asked before it and (with `show_when`) was
+answered with that value; values compare case- and space-insensitively. A
+prompt can never be asked when:
+
+- its parent does not exist, comes later in the file, or is itself never asked
+- the parents form a cycle
+- the parent has `options` and `show_when` is not one of them
+
+`show_when` without `depends_on` is reported too; it is ignored.
+
+Only the answers that change which prompts come next are distinguished: a
+parent's answers fall into one class per `show_when` value its children
+use, plus one class for every other answer (when the options leave any),
+so a 50-option select that gates one follow-up has two branches, not 50.
+Answers of different parents are independent, so path statistics combine
+bottom-up over the dependency forest, without enumerating paths:
+
+- paths: the number of distinct answer paths (the product and sum of the
+  branches' counts, exact as Python integers)
+- min / max: the fewest and most questions on any path, with the answers
+  that reach them
+- mean: the average number of questions over the distinct paths
+- expected: the expected number when every option is equally likely (each
+  class weighted by its share of the parent's options; free-text parents
+  weigh their classes equally)
+"""
+
+from typing import Dict, List, Any, Iterator, Optional, Tuple
+
+MISSING_PARENT = 'missing_parent'
+FORWARD = 'forward'
+CYCLE = 'cycle'
+OPTION = 'show_when_not_in_options'
+ORPHAN = 'show_when_without_depends_on'
+UNREACHABLE = 'unreachable'
+
+OTHER = '*'  # the class of answers no child's show_when names
+
+def _answer(value: Any) -> str:
+    return ' '.join(str(value).split()).casefold()
+
+class PathStats:
+    """Question counts over a set of answer paths"""
+
+    __slots__ = ('count', 'total', 'low', 'high', 'expected', 'low_answers', 'high_answers')
+
+    def __init__(self, count: int = 1, total: int = 0, low: int = 0, high: int = 0, expected: float = 0.0,
+                 low_answers: Any = None, high_answers: Any = None):
+        self.count = count
+        self.total = total
+        self.low = low
+        self.high = high
+        self.expected = expected
+        # Answers behind low and high as nested pairs: None, (field, answer) or (left, right)
+        self.low_answers = low_answers
+        self.high_answers = high_answers
+
+    def then(self, other: 'PathStats') -> 'PathStats':
+        """Paths of two independent parts of the dialog taken together"""
+        return PathStats(self.count * other.count,
+                         self.total * other.count + other.total * self.count,
+                         self.low + other.low, self.high + other.high, self.expected + other.expected,
+                         _pair(self.low_answers, other.low_answers), _pair(self.high_answers, other.high_answers))
+
+    @staticmethod
+    def either(field: str, branches: List[Tuple[str, float, 'PathStats']]) -> 'PathStats':
+        """Paths of one answer to field out of (answer, weight, paths) branches"""
+        low = min(branches, key=lambda branch: branch[2].low)
+        high = max(branches, key=lambda branch: branch[2].high)
+        return PathStats(sum(stats.count for _, _, stats in branches),
+                         sum(stats.total for _, _, stats in branches),
+                         low[2].low, high[2].high,
+                         sum(weight * stats.expected for _, weight, stats in branches),
+                         _pair((field, low[0]), low[2].low_answers), _pair((field, high[0]), high[2].high_answers))
+
+def _pair(left: Any, right: Any) -> Any:
+    if left is None:
+        return right
+    if right is None:
+        return left
+    return (left, right)
+
+def flatten_answers(answers: Any) -> Dict[str, str]:
+    """The {field: answer} of a nested answer pair, OTHER standing for any other answer"""
+    flat = {}
+    stack = [answers]
+    while stack:
+        node = stack.pop()
+        if node is None:
+            continue
+        if isinstance(node[0], str):
+            flat[node[0]] = node[1]
+        else:
+            stack.append(node[1])
+            stack.append(node[0])
+    return flat
+
+class DialogGraph:
+    """Conditional prompt graph of one skill"""
+
+    def __init__(self, skill: Dict[str, Any]):
+        self.skill = skill
+        self.prompts = skill['prompts']
+        self.fields = [prompt['field'] for prompt in self.prompts]
+        self.issues: List[Dict[str, Any]] = []
+        positions: Dict[str, int] = {}
+        for position, field in enumerate(self.fields):
+            positions.setdefault(field, position)
+
+        self.parents: List[Optional[int]] = []
+        for position, prompt in enumerate(self.prompts):
+            depends_on = prompt['depends_on']
+            parent = positions.get(depends_on) if depends_on is not None else None
+            self.parents.append(parent)
+            if depends_on is None:
+                if prompt['show_when'] is not None:
+                    self._issue(ORPHAN, position, f"Field '{self.fields[position]}' has show_when "
+                                f"'{prompt['show_when']}' but no depends_on, so it is always asked")
+            elif parent is None:
+                self._issue(MISSING_PARENT, position,
+                            f"Field '{self.fields[position]}' depends on non-existent field '{depends_on}'")
+
+        self._find_cycles()
+        self.reachable: List[bool] = []
+        for position in range(len(self.prompts)):
+            self.reachable.append(self._check(position))
+        # Reachable children per prompt, grouped by the show_when answer (None: any answer)
+        self.children: List[Dict[Optional[str], List[int]]] = [{} for _ in self.prompts]
+        # (parent, compared form) -> the parent's option as written, else the show_when
+        self.answers: Dict[Tuple[int, str], str] = {}
+        self.roots: List[int] = []
+        for position, parent in enumerate(self.parents):
+            if not self.reachable[position]:
+                continue
+            if parent is None:
+                self.roots.append(position)
+            else:
+                show_when = self.prompts[position]['show_when']
+                key = _answer(show_when) if show_when is not None else None
+                if key is not None:
+                    for option in self.prompts[parent]['options']:
+                        if _answer(option) == key:
+                            show_when = option
+                    self.answers.setdefault((parent, key), str(show_when))
+                self.children[parent].setdefault(key, []).append(position)
+
+    def _issue(self, kind: str, position: int, message: str) -> None:
+        self.issues.append({'kind': kind, 'field': self.fields[position], 'message': message})
+
+    def _find_cycles(self) -> None:
+        self.cyclic = set()
+        state = [0] * len(self.prompts)  # 0 unvisited, 1 on the current walk, 2 done
+        for start in range(len(self.prompts)):
+            walk = []
+            position = start
+            while position is not None and state[position] == 0:
+                state[position] = 1
+                walk.append(position)
+                position = self.parents[position]
+            if position is not None and state[position] == 1:
+                cycle = walk[walk.index(position):]
+                self.cyclic.update(cycle)
+                names = ' -> '.join(self.fields[member] for member in cycle + [position])
+                self._issue(CYCLE, position, f"Fields depend on each other in a cycle: {names}")
+            for member in walk:
+                state[member] = 2
+
+    def _check(self, position: int) -> bool:
+        """Whether the prompt can ever be asked; parents are checked first (they come earlier)"""
+        prompt = self.prompts[position]
+        parent = self.parents[position]
+        field = self.fields[position]
+        if prompt['depends_on'] is None:
+            return True
+        if parent is None:
+            return False
+        if parent >= position:
+            # Every cycle has such an edge; it is reported as the cycle
+            if position not in self.cyclic:
+                self._issue(FORWARD, position, f"Field '{field}' depends on '{self.fields[parent]}', "
+                            f"which is asked after it, so it is never asked")
+            return False
+        options = self.prompts[parent]['options']
+        show_when = prompt['show_when']
+        if show_when is not None and options and _answer(show_when) not in {_answer(o) for o in options}:
+            self._issue(OPTION, position, f"Field '{field}' is shown when '{self.fields[parent]}' is "
+                        f"'{show_when}', which is not one of its options: {', '.join(map(str, options))}")
+            return False
+        if not self.reachable[parent]:
+            if position in self.cyclic:
+                return False
+            self._issue(UNREACHABLE, position, f"Field '{field}' depends on '{self.fields[parent]}', "
+                        f"which is never asked")
+            return False
+        return True
+
+    def _branches(self, position: int) -> List[Tuple[str, float, List[int]]]:
+        """(answer class, weight, children asked) per answer class of a prompt"""
+        groups = self.children[position]
+        always = groups.get(None, [])
+        values = [value for value in groups if value is not None]
+        if not values:
+            return [(OTHER, 1.0, always)]
+        options = {_answer(option) for option in self.prompts[position]['options']}
+        others = len(options - set(values)) if options else 1
+        classes = len(values) + (1 if others else 0)
+        weight = (lambda share: share / len(options)) if options else (lambda share: 1.0 / classes)
+        branches = [(self.answers[position, value], weight(1), always + groups[value]) for value in values]
+        if others:
+            branches.append((OTHER, weight(others), always))
+        return branches
+
+    def stats(self) -> PathStats:
+        """Path statistics of the whole dialog, combined bottom-up over the prompt forest"""
+        node_stats: Dict[int, PathStats] = {}
+        self.counts: Dict[int, int] = {}
+        # Children come after their parents, so reverse file order is bottom-up
+        for position in reversed(range(len(self.prompts))):
+            if not self.reachable[position]:
+                continue
+            branches = []
+            for answer, weight, children in self._branches(position):
+                stats = PathStats()
+                for child in children:
+                    stats = stats.then(node_stats[child])
+                branches.append((answer, weight, stats))
+            asked = PathStats(1, 1, 1, 1, 1.0)
+            if len(branches) == 1:
+                node_stats[position] = asked.then(branches[0][2])
+            else:
+                node_stats[position] = asked.then(PathStats.either(self.fields[position], branches))
+            self.counts[position] = node_stats[position].count
+        total = PathStats()
+        for root in self.roots:
+            total = total.then(node_stats[root])
+        return total
+
+    def iter_paths(self) -> Iterator[Tuple[Dict[str, str], List[str]]]:
+        """Every distinct answer path as ({gating field: answer class}, fields asked in order)"""
+        if not hasattr(self, 'counts'):
+            self.stats()
+        for answers, asked in self._sequence(self.roots):
+            yield answers, [self.fields[position] for position in sorted(asked)]
+
+    def _sequence(self, positions: List[int]) -> Iterator[Tuple[Dict[str, str], List[int]]]:
+        # Subtrees with a single path are taken whole, so the recursion only
+        # follows branching prompts (fewer than the number of paths)
+        fixed = []
+        stack = [position for position in positions if self.counts[position] == 1]
+        while stack:
+            position = stack.pop()
+            fixed.append(position)
+            for children in self.children[position].values():
+                stack.extend(children)
+        yield from self._branching([position for position in positions if self.counts[position] > 1], fixed)
+
+    def _branching(self, positions: List[int], asked: List[int]) -> Iterator[Tuple[Dict[str, str], List[int]]]:
+        if not positions:
+            yield {}, asked
+            return
+        for answers, node_asked in self._node(positions[0]):
+            for more_answers, more_asked in self._branching(positions[1:], asked):
+                yield {**answers, **more_answers}, node_asked + more_asked
+
+    def _node(self, position: int) -> Iterator[Tuple[Dict[str, str], List[int]]]:
+        branches = self._branches(position)
+        for answer, _, children in branches:
+            for answers, asked in self._sequence(children):
+                if len(branches) > 1:
+                    answers = {self.fields[position]: answer, **answers}
+                yield answers, [position] + asked
+
+def analyze_skill(skill: Dict[str, Any], list_paths: int = 0) -> Dict[str, Any]:
+    """Path statistics and issues of one skill; lists up to list_paths paths when there are no more"""
+    graph = DialogGraph(skill)
+    stats = graph.stats()
+    report = {
+        'skill': skill['id'],
+        'source': skill['source'],
+        'prompts': len(graph.prompts),
+        'reachable': sum(graph.reachable),
+        'conditional': sum(1 for prompt in graph.prompts if prompt['depends_on'] is not None),
+        'paths': stats.count,
+        'min_questions': stats.low,
+        'max_questions': stats.high,
+        'mean_questions': round(stats.total / stats.count, 3),
+        'expected_questions': round(stats.expected, 3),
+        'best_case': flatten_answers(stats.low_answers),
+        'worst_case': flatten_answers(stats.high_answers),
+        'issues': graph.issues,
+    }
+    if list_paths and stats.count <= list_paths:
+        report['listed_paths'] = [{'answers': answers, 'questions': len(asked), 'asked': asked}
+                                  for answers, asked in graph.iter_paths()]
+    return report
+
+def describe_answers(answers: Dict[str, str]) -> str:
+    if not answers:
+        return "any answers"
+    return ', '.join(f"{field}={'(other)' if answer == OTHER else answer}" for field, answer in answers.items())
@@ -0,0 +1,211 @@
+"""
+Reference skill executor for batch record processing
+
+A Python port of `SkillEngine.executeSkill` (validation, the native
+`TextProcessor.formatForForm` pass and `applyPostprocessAction`) that works a
+column at a time. Each field's regex and its whole formatting pipeline are
+built once per skill, then applied to entire columns, so the same code serves
+as a golden oracle for the Kotlin implementation and as a bulk filler for
+exported spreadsheets.
+
+Semantics mirrored from the app:
+- Regexes are full matches with ASCII \\w, \\d and \\s, like java.util.regex
+- A missing field is null; required fields that are null or blank fail
+- Fields failing validation are left out of the processed data
+- Postprocess actions only touch fields present in the processed data
+"""
+
+import re
+from decimal import Decimal, ROUND_HALF_UP
+from typing import Callable, Dict, List, Any, Optional, Sequence, Tuple
+
+from skill_catalog import load_skill
+
+Formatter = Callable[[str], str]
+ColumnResult = Tuple[str, List[Optional[str]], List[Optional[str]]]
+
+_NON_DIGIT = re.compile(r'[^0-9]')
+_NON_AMOUNT = re.compile(r'[^0-9.]')
+_CONTROL_SPACE = re.compile(r'[\t\n\v\f\r]')
+_MULTI_SPACE = re.compile(r' {2,}')
+_AMOUNT = re.compile(r'[0-9]*\.?[0-9]*')
+_CENT = Decimal('0.01')
+
+_ASCII_LOWER = str.maketrans('ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz')
+_ASCII_SPACE = ' \t\n\v\f\r'
+
+def clean_text(value: str) -> str:
+    """TextProcessor::cleanText: drop non-space whitespace, collapse and trim spaces"""
+    value = _CONTROL_SPACE.sub('', value)
+    value = _MULTI_SPACE.sub(' ', value)
+    return value.strip(' ')
+
+def _format_phone_digits(value: str) -> str:
+    digits = _NON_DIGIT.sub('', value)
+    if len(digits) == 10:
+        return f"({digits[:3]}) {digits[3:6]}-{digits[6:]}"
+    return digits
+
+def _capitalize_words_ascii(value: str) -> str:
+    """formatForForm("name"): upper-case the first byte of each word, C locale"""
+    chars = list(value)
+    capitalize_next = True
+    for i, c in enumerate(chars):
+        if c in _ASCII_SPACE:
+            capitalize_next = True
+        elif capitalize_next:
+            if 'a' <= c <= 'z':
+                chars[i] = chr(ord(c) - 32)
+            capitalize_next = False
+    return ''.join(chars)
+
+def form_formatter(field_type: str) -> Formatter:
+    """TextProcessor::formatForForm for one field type"""
+    if field_type == 'phone':
+        return lambda value: _format_phone_digits(clean_text(value))
+    if field_type == 'email':
+        return lambda value: clean_text(value).translate(_ASCII_LOWER)
+    if field_type == 'name':
+        return lambda value: _capitalize_words_ascii(clean_text(value))
+    return clean_text
+
+def format_phone(value: str) -> str:
+    digits = _NON_DIGIT.sub('', value)
+    if len(digits) == 10:
+        return f"({digits[:3]}) {digits[3:6]}-{digits[6:]}"
+    return value
+
+def format_ssn(value: str) -> str:
+    digits = _NON_DIGIT.sub('', value)
+    if len(digits) == 9:
+        return f"{digits[:3]}-{digits[3:5]}-{digits[5:]}"
+    return value
+
+def capitalize_name(value: str) -> str:
+    # Kotlin: split(" ") then lowercase().replaceFirstChar { it.uppercase() }
+    return ' '.join(word[:1].upper() + word[1:] for word in (w.lower() for w in value.split(' ')))
+
+def uppercase_state(value: str) -> str:
+    return value.upper()
+
+def format_currency(value: str) -> str:
+    digits = _NON_AMOUNT.sub('', value)
+    # String.toDoubleOrNull on [0-9.]: needs a digit and at most one dot
+    if not digits or digits == '.' or not _AMOUNT.fullmatch(digits):
+        return value
+    amount = float(digits)
+    if amount == float('inf'):
+        return '$Infinity'
+    # java.util.Formatter rounds the shortest decimal form HALF_UP
+    return '$' + str(Decimal(repr(amount)).quantize(_CENT, rounding=ROUND_HALF_UP))
+
+POSTPROCESS_ACTIONS: Dict[str, Formatter] = {
+    'format_phone': format_phone,
+    'format_ssn': format_ssn,
+    'capitalize_name': capitalize_name,
+    'uppercase_state': uppercase_state,
+    'format_currency': format_currency,
+}
+
+def _chain(steps: List[Formatter]) -> Formatter:
+    if len(steps) == 1:
+        return steps[0]
+
+    def run(value: str) -> str:
+        for step in steps:
+            value = step(value)
+        return value
+    return run
+
+class FieldPlan:
+    """Compiled per-field work: required flag, full-match regex and formatter pipeline"""
+
+    __slots__ = ('field', 'required', 'matcher', 'formatter', 'missing_error', 'format_error')
+
+    def __init__(self, prompt: Dict[str, Any], postprocess: List[Dict[str, Any]]):
+        self.field = prompt['field']
+        self.required = prompt['required']
+        validation = prompt['validation']
+        self.matcher = re.compile(validation, re.ASCII).fullmatch if validation is not None else None
+        steps = [form_formatter(prompt['type'])]
+        for action in postprocess:
+            if action['field'] == self.field and action['action'] in POSTPROCESS_ACTIONS:
+                steps.append(POSTPROCESS_ACTIONS[action['action']])
+        self.formatter = _chain(steps)
+        self.missing_error = f"Required field '{self.field}' is missing"
+        self.format_error = f"Field '{self.field}' does not match required format"
+
+    def apply(self, column: Sequence[Optional[str]], empty_is_missing: bool = False):
+        """Process one column; returns (values, errors) with None where absent"""
+        required = self.required
+        matcher = self.matcher
+        formatter = self.formatter
+        # Spreadsheets repeat values (states, statuses, blanks), so memoize per chunk
+        memo: Dict[str, Any] = {}
+        if empty_is_missing:
+            memo[''] = (None, self.missing_error if required else None)
+        values: List[Optional[str]] = []
+        errors: List[Optional[str]] = []
+        append_value = values.append
+        append_error = errors.append
+
+        for value in column:
+            if value is None:
+                append_value(None)
+                append_error(self.missing_error if required else None)
+                continue
+            outcome = memo.get(value)
+            if outcome is None:
+                if required and not value.strip():
+                    outcome = (None, self.missing_error)
+                elif matcher is not None and matcher(value) is None:
+                    outcome = (None, self.format_error)
+                else:
+                    outcome = (formatter(value), None)
+                memo[value] = outcome
+            append_value(outcome[0])
+            append_error(outcome[1])
+        return values, errors
+
+class SkillExecutor:
+    """Runs one skill over chunks of records laid out as columns"""
+
+    def __init__(self, skill: Dict[str, Any]):
+        self.skill = skill
+        self.plans = [FieldPlan(prompt, skill['postprocess']) for prompt in skill['prompts']]
+        self.fields = [plan.field for plan in self.plans]
+
+    @classmethod
+    def from_file(cls, file_path: str) -> 'SkillExecutor':
+        return cls(load_skill(file_path))
+
+    def execute_columns(self, columns: Dict[str, Sequence[Optional[str]]], row_count: int,
+                        empty_is_missing: bool = False) -> List[ColumnResult]:
+        """Execute a chunk given as field -> column; returns (field, values, errors) per prompt
+
+        With empty_is_missing, empty strings count as absent fields, which is
+        how blank spreadsheet cells are read.
+        """
+        missing = [None] * row_count
+        return [
+            (plan.field,) + plan.apply(columns.get(plan.field, missing), empty_is_missing)
+            for plan in self.plans
+        ]
+
+    @staticmethod
+    def rows(processed: List[ColumnResult], row_count: int) -> List[Dict[str, Any]]:
+        """Turn column results back into executeSkill-style per-row results"""
+        results = [{'success': True, 'data': {}, 'errors': []} for _ in range(row_count)]
+        for field, values, errors in processed:
+            for result, value, error in zip(results, values, errors):
+                if error is not None:
+                    result['errors'].append(error)
+                    result['success'] = False
+                elif value is not None:
+                    result['data'][field] = value
+        return results
+
+    def execute(self, record: Dict[str, Optional[str]]) -> Dict[str, Any]:
+        """executeSkill for a single record"""
+        columns = {field: [value] for field, value in record.items()}
+        return self.rows(self.execute_columns(columns, 1), 1)[0]
@@ -0,0 +1,306 @@
+"""
+Shared prompt fragments for skill templates
+
+A fragment library is a `fragments.yaml` file next to the templates (or in
+any parent directory) holding pieces that several skills repeat verbatim:
+
+    fragments:
+      prompts:
+        city: {ask: "What city do you live in?", type: text, required: true}
+      regexes:
+        zip_code: "^\\d{5}(-\\d{4})?$"
+      postprocess:
+        format_ssn: {action: format_ssn, field: social_security_number, format: XXX-XX-XXXX}
+      selectors:
+        city: "input[name*='city'], input[id*='city']"
+
+A template refers to a fragment with a `use` mapping. Mapping fragments are
+merged with the keys written next to `use`, which win; scalar fragments
+replace the mapping outright:
+
+    prompts:
+      - field: city
+        use: prompts/city
+      - field: zip
+        ask: "ZIP?"
+        validation: {use: regexes/zip_code}
+
+resolve_fragments() expands the references of a parsed template. Libraries
+are parsed and resolved once per process (until the file changes) and every
+template shares the resolved fragment objects. Templates without references
+are returned unchanged.
+"""
+
+import json
+import os
+from collections import Counter
+from pathlib import Path
+from typing import Callable, Dict, List, Any, Optional, Set, Tuple
+
+import yaml
+
+LIBRARY_NAME = 'fragments.yaml'
+FRAGMENT_KINDS = ('prompts', 'regexes', 'postprocess', 'selectors')
+USE_KEY = 'use'
+
+class FragmentError(ValueError):
+    """A template refers to a fragment that cannot be resolved"""
+
+def is_fragment_library(file_path: str) -> bool:
+    return os.path.basename(file_path) == LIBRARY_NAME
+
+def find_library(source: str) -> Optional[str]:
+    """Nearest fragments.yaml in the template's directory or its parents"""
+    directory = Path(source).resolve().parent
+    for candidate in (directory, *directory.parents):
+        library = candidate / LIBRARY_NAME
+        if library.is_file():
+            return str(library)
+    return None
+
+class FragmentLibrary:
+    """Parsed fragment library with its fragments resolved against itself"""
+
+    def __init__(self, fragments: Dict[str, Dict[str, Any]], path: str = LIBRARY_NAME):
+        self.path = path
+        self.raw = fragments
+        self.resolved: Dict[Tuple[str, str], Any] = {}
+
+    @classmethod
+    def from_file(cls, path: str) -> 'FragmentLibrary':
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls.from_text(f.read(), path)
+
+    @classmethod
+    def from_text(cls, text: str, path: str = LIBRARY_NAME) -> 'FragmentLibrary':
+        try:
+            data = yaml.safe_load(text)
+        except yaml.YAMLError as e:
+            raise FragmentError(f"Fragment library {path} is not valid YAML: {str(e).splitlines()[0]}")
+        fragments = data.get('fragments') if isinstance(data, dict) else None
+        if not isinstance(fragments, dict):
+            raise FragmentError(f"Fragment library {path} must have a 'fragments' mapping")
+        for kind, entries in fragments.items():
+            if kind not in FRAGMENT_KINDS:
+                raise FragmentError(f"Fragment library {path} has unknown kind '{kind}'")
+            if not isinstance(entries, dict):
+                raise FragmentError(f"Fragment library {path}: '{kind}' must be a mapping of names")
+        return cls(fragments, path)
+
+    def get(self, reference: Any, active: Set[Tuple[str, str]] = frozenset()) -> Any:
+        """Resolve 'kind/name' to its fragment, expanding references inside it"""
+        if not isinstance(reference, str) or reference.count('/') != 1:
+            raise FragmentError(f"Fragment reference {reference!r} must look like 'kind/name'")
+        key = tuple(reference.split('/'))
+        if key in self.resolved:
+            return self.resolved[key]
+        kind, name = key
+        entries = self.raw.get(kind)
+        if not isinstance(entries, dict) or name not in entries:
+            raise FragmentError(f"Unknown fragment '{reference}' (not in {self.path})")
+        if key in active:
+            raise FragmentError(f"Fragment '{reference}' refers to itself")
+        self.resolved[key] = _expand(entries[name], self, active | {key})
+        return self.resolved[key]
+
+_libraries: Dict[str, Tuple[int, FragmentLibrary]] = {}
+
+def load_library(path: str) -> FragmentLibrary:
+    """Parse a library once per process and again only after it changes"""
+    mtime = os.stat(path).st_mtime_ns
+    cached = _libraries.get(path)
+    if cached is None or cached[0] != mtime:
+        cached = (mtime, FragmentLibrary.from_file(path))
+        _libraries[path] = cached
+    return cached[1]
+
+def has_references(data: Any) -> bool:
+    stack = [data]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, dict):
+            if USE_KEY in value:
+                return True
+            stack.extend(value.values())
+        elif isinstance(value, list):
+            stack.extend(value)
+    return False
+
+def _expand(value: Any, library: FragmentLibrary, active: Set[Tuple[str, str]]) -> Any:
+    """Copy-on-write expansion; subtrees without references are returned as is"""
+    if isinstance(value, dict):
+        if USE_KEY in value:
+            fragment = library.get(value[USE_KEY], active)
+            overrides = {key: item for key, item in value.items() if key != USE_KEY}
+            if not isinstance(fragment, dict):
+                if overrides:
+                    raise FragmentError(f"Fragment '{value[USE_KEY]}' is not a mapping and cannot take "
+                                        f"extra keys ({', '.join(map(str, overrides))})")
+                return fragment
+            merged = dict(fragment)
+            merged.update(_expand(overrides, library, active))
+            return merged
+        expanded = {key: _expand(item, library, active) for key, item in value.items()}
+        return value if all(expanded[key] is value[key] for key in value) else expanded
+    if isinstance(value, list):
+        expanded = [_expand(item, library, active) for item in value]
+        return value if all(new is old for new, old in zip(expanded, value)) else expanded
+    return value
+
+def resolve_fragments(data: Any, source: str, library: Optional[FragmentLibrary] = None) -> Any:
+    """Expand every fragment reference in a parsed template; raises FragmentError"""
+    if not has_references(data):
+        return data
+    if library is None:
+        path = find_library(source)
+        if path is None:
+            raise FragmentError(f"Template uses fragments but no {LIBRARY_NAME} was found above {source}")
+        library = load_library(path)
+    return _expand(data, library, frozenset())
+
+# Compaction: find repeated pieces across templates and move them to a library
+
+def canonical(value: Any) -> str:
+    """Structural hash key: equal for structurally identical YAML values"""
+    return json.dumps(value, sort_keys=True, ensure_ascii=False, separators=(',', ':'), default=str)
+
+class _Dumper(yaml.SafeDumper):
+    """Block style, except bare references which read best inline: {use: kind/name}"""
+
+def _represent_dict(dumper: yaml.SafeDumper, data: Dict[Any, Any]) -> yaml.Node:
+    flow = len(data) == 1 and USE_KEY in data
+    return dumper.represent_mapping('tag:yaml.org,2002:map', data.items(), flow_style=flow or None)
+
+_Dumper.add_representer(dict, _represent_dict)
+
+def dump_yaml(data: Any) -> str:
+    return yaml.dump(data, Dumper=_Dumper, sort_keys=False, allow_unicode=True,
+                     default_flow_style=False, width=4096)
+
+def _size(value: Any) -> int:
+    return len(dump_yaml(value).encode('utf-8'))
+
+class _Candidate:
+    __slots__ = ('kind', 'value', 'names', 'sites')
+
+    def __init__(self, kind: str, value: Any):
+        self.kind = kind
+        self.value = value
+        self.names: List[str] = []
+        # (template index, setter) for every place the value occurs
+        self.sites: List[Tuple[int, Callable[[Any], None]]] = []
+
+def _setter(container: Any, key: Any, keep: Optional[Dict[str, Any]] = None) -> Callable[[Any], None]:
+    def assign(reference: Any) -> None:
+        container[key] = dict(keep, **reference) if keep else reference
+    return assign
+
+def _existing_names(library: Optional[FragmentLibrary]) -> Dict[Tuple[str, str], str]:
+    """Fragments already in the library, by (kind, structural key)"""
+    names = {}
+    if library is not None:
+        for kind, entries in library.raw.items():
+            for name in entries:
+                names.setdefault((kind, canonical(library.get(f'{kind}/{name}'))), name)
+    return names
+
+def plan_compaction(templates: List[Tuple[str, Dict[str, Any]]], library: Optional[FragmentLibrary] = None,
+                    min_uses: int = 2) -> Dict[str, Any]:
+    """Move repeated prompts, regexes, postprocess entries and selectors into fragments
+
+    templates are (path, resolved form template) pairs and are rewritten in
+    place to use references. Prompts are compared without their `field`, which
+    stays in the template. A repeated value only becomes a fragment when the
+    references are smaller than the copies they replace. Returns the new
+    library fragments and a per-fragment report.
+    """
+    existing = _existing_names(library)
+    fragments: Dict[str, Dict[str, Any]] = {kind: dict(library.raw.get(kind, {})) if library else {}
+                                            for kind in FRAGMENT_KINDS}
+    report = []
+
+    def collect(kind: str, found: Dict[str, _Candidate], value: Any, name: str, site) -> None:
+        candidate = found.setdefault(canonical(value), _Candidate(kind, value))
+        candidate.names.append(name)
+        candidate.sites.append(site)
+
+    def promote(found: Dict[str, _Candidate]) -> Dict[str, str]:
+        """Turn candidates that pay for themselves into fragments; returns key -> reference"""
+        references = {}
+        for key, candidate in found.items():
+            kind = candidate.kind
+            reused = existing.get((kind, key))
+            if len(candidate.sites) < min_uses and reused is None:
+                continue
+            name = reused or Counter(candidate.names).most_common(1)[0][0]
+            reference = f'{kind}/{name}'
+            copies = _size(candidate.value) * len(candidate.sites)
+            references_cost = _size({USE_KEY: reference}) * len(candidate.sites)
+            saved = copies - references_cost - (0 if reused else _size({name: candidate.value}))
+            if saved <= 0:
+                continue
+            if reused is None:
+                suffix = 2
+                while name in fragments[kind]:
+                    name = f"{Counter(candidate.names).most_common(1)[0][0]}_{suffix}"
+                    suffix += 1
+                reference = f'{kind}/{name}'
+                fragments[kind][name] = candidate.value
+                existing[(kind, key)] = name
+            for _, assign in candidate.sites:
+                assign({USE_KEY: reference})
+            references[key] = reference
+            report.append({'fragment': reference, 'uses': len(candidate.sites),
+                           'files': len({index for index, _ in candidate.sites if index >= 0}),
+                           'bytes_saved': saved, 'new': reused is None})
+        return references
+
+    # Whole prompts first, so their regexes are only counted once
+    found: Dict[str, _Candidate] = {}
+    for index, (_, data) in enumerate(templates):
+        for i, prompt in enumerate(data.get('prompts') or []):
+            if isinstance(prompt, dict) and isinstance(prompt.get('field'), str):
+                body = {key: value for key, value in prompt.items() if key != 'field'}
+                collect('prompts', found, body, prompt['field'],
+                        (index, _setter(data['prompts'], i, {'field': prompt['field']})))
+    promote(found)
+
+    found = {}
+    for name, body in fragments['prompts'].items():
+        if isinstance(body, dict) and isinstance(body.get('validation'), str):
+            collect('regexes', found, body['validation'], name, (-1, _setter(body, 'validation')))
+    for index, (_, data) in enumerate(templates):
+        for prompt in data.get('prompts') or []:
+            if isinstance(prompt, dict) and USE_KEY not in prompt and isinstance(prompt.get('validation'), str):
+                collect('regexes', found, prompt['validation'], str(prompt.get('field')),
+                        (index, _setter(prompt, 'validation')))
+        for action in data.get('postprocess') or []:
+            if isinstance(action, dict) and isinstance(action.get('pattern'), str):
+                collect('regexes', found, action['pattern'], str(action.get('field')),
+                        (index, _setter(action, 'pattern')))
+    promote(found)
+
+    found = {}
+    for index, (_, data) in enumerate(templates):
+        for i, action in enumerate(data.get('postprocess') or []):
+            if isinstance(action, dict) and USE_KEY not in action:
+                name = '_'.join(str(action[key]) for key in ('action', 'field') if action.get(key))
+                collect('postprocess', found, action, name or 'action', (index, _setter(data['postprocess'], i)))
+    promote(found)
+
+    found = {}
+    for index, (_, data) in enumerate(templates):
+        accessibility = data.get('accessibility')
+        if not isinstance(accessibility, dict):
+            continue
+        selectors = accessibility.get('form_selectors')
+        for field, selector in (selectors.items() if isinstance(selectors, dict) else []):
+            if isinstance(selector, str):
+                collect('selectors', found, selector, str(field), (index, _setter(selectors, field)))
+        if isinstance(accessibility.get('submit_button'), str):
+            collect('selectors', found, accessibility['submit_button'], 'submit_button',
+                    (index, _setter(accessibility, 'submit_button')))
+    promote(found)
+
+    report.sort(key=lambda entry: -entry['bytes_saved'])
+    return {'fragments': {kind: entries for kind, entries in fragments.items() if entries}, 'report': report}
@@ -0,0 +1,545 @@
+"""
+Language server mode for skill-lint
+
+Backs `skill-lint.py --lsp`. A long-running process that speaks the Language
+Server Protocol over stdio, so an editor gets diagnostics without starting a
+fresh interpreter and re-importing PyYAML on every save.
+
+The server keeps every skill document of the workspace parsed in memory,
+together with a cross-file symbol table:
+
+- skill ids and the documents defining them (duplicate ids)
+- command `skill:` references to other skills (unknown skills)
+- voice command triggers (collisions between skills)
+
+When a document changes only that document is re-parsed and re-validated.
+Cross-file diagnostics are then recomputed for the documents that depend on
+it: documents sharing or referencing its old or new skill id, and, when its
+triggers changed, documents whose trigger collisions changed. Diagnostics are
+pushed with line and column ranges taken from the YAML node marks.
+
+Fragment references are resolved before validation. Editing a fragments.yaml
+buffer re-validates every document that uses it, against the unsaved text.
+"""
+
+import json
+import re
+import sys
+import time
+import traceback
+from pathlib import Path
+from typing import Callable, Dict, List, Any, Optional, Set, Tuple
+from urllib.parse import unquote, urlparse
+
+import yaml
+
+from skill_catalog import find_skill_files, normalize_skill, normalize_trigger
+from skill_fragments import (
+    FragmentError, FragmentLibrary, find_library, has_references, is_fragment_library, load_library,
+    resolve_fragments
+)
+
+# libyaml keeps a full re-parse of a template around a couple of milliseconds
+Loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+ERROR = 1
+WARNING = 2
+
+TriggerMessages = Callable[[List[Dict[str, Any]]], Dict[str, Tuple[List[str], List[str]]]]
+
+def path_to_uri(path: str) -> str:
+    return Path(path).resolve().as_uri()
+
+def uri_to_path(uri: str) -> str:
+    return str(Path(unquote(urlparse(uri).path)).resolve())
+
+def parse_document(text: str) -> Tuple[Any, Optional[yaml.Node], Optional[yaml.YAMLError]]:
+    """Compose and construct in one pass, keeping the node tree for positions"""
+    loader = Loader(text)
+    try:
+        node = loader.get_single_node()
+        data = loader.construct_document(node) if node is not None else None
+        return data, node, None
+    except yaml.YAMLError as e:
+        return None, None, e
+    finally:
+        loader.dispose()
+
+def _get(node: Optional[yaml.Node], key: str) -> Optional[yaml.Node]:
+    if isinstance(node, yaml.MappingNode):
+        for key_node, value_node in node.value:
+            if key_node.value == key:
+                return value_node
+    return None
+
+def _items(node: Optional[yaml.Node]) -> List[yaml.Node]:
+    return node.value if isinstance(node, yaml.SequenceNode) else []
+
+def _prompt(root: yaml.Node, index: str) -> Optional[yaml.Node]:
+    prompts = _items(_get(root, 'prompts'))
+    return prompts[int(index)] if int(index) < len(prompts) else None
+
+def _prompt_key(root: yaml.Node, index: str, key: str) -> Optional[yaml.Node]:
+    prompt = _prompt(root, index)
+    return _get(prompt, key) or prompt
+
+def _prompt_by_field(root: yaml.Node, field: str, occurrence: int = 0) -> Optional[yaml.Node]:
+    for prompt in _items(_get(root, 'prompts')):
+        value = _get(prompt, 'field')
+        if value is not None and value.value == field:
+            if occurrence == 0:
+                return prompt
+            occurrence -= 1
+    return None
+
+def _command_by_trigger(root: yaml.Node, trigger: str) -> Optional[yaml.Node]:
+    for command in _items(_get(root, 'commands')):
+        value = _get(command, 'trigger')
+        if isinstance(value, yaml.ScalarNode) and normalize_trigger(value.value) == trigger:
+            return value
+    return None
+
+def _field_mapping(root: yaml.Node, path: str) -> Optional[yaml.Node]:
+    group, _, field = path.partition('.')
+    node = _get(_get(root, 'field_mappings'), group)
+    return _get(node, field) if field else node
+
+def _voice_pattern(root: yaml.Node, index: str) -> Optional[yaml.Node]:
+    patterns = _items(_get(_get(root, 'voice_commands'), 'patterns'))
+    return patterns[int(index)] if int(index) < len(patterns) else None
+
+def _command_skill(root: yaml.Node, index: str) -> Optional[yaml.Node]:
+    commands = _items(_get(root, 'commands'))
+    return _get(commands[int(index)], 'skill') if int(index) < len(commands) else None
+
+# Validator message -> node it is about; the first matching rule wins
+_LOCATIONS: List[Tuple['re.Pattern', Callable[..., Optional[yaml.Node]]]] = [(re.compile(pattern), locate) for pattern, locate in [
+    (r"^Prompt (\d+) field '(\w+)'", lambda root, m: _prompt_key(root, m[1], m[2])),
+    (r"^Prompt (\d+) has invalid type", lambda root, m: _prompt_key(root, m[1], 'type')),
+    (r"^Prompt (\d+) question", lambda root, m: _prompt_key(root, m[1], 'ask')),
+    (r"^Prompt (\d+) hint", lambda root, m: _prompt_key(root, m[1], 'hint')),
+    (r"^Prompt (\d+) (?:has invalid regex|validation regex)", lambda root, m: _prompt_key(root, m[1], 'validation')),
+    (r"^Prompt (\d+)", lambda root, m: _prompt(root, m[1])),
+    (r"^Field '(.+?)' depends on non-existent field", lambda root, m: _get(_prompt_by_field(root, m[1]), 'depends_on')),
+    (r"^Field '(\w+)' must be", lambda root, m: _get(root, m[1])),
+    (r"^Duplicate field name: (.+)$", lambda root, m: _get(_prompt_by_field(root, m[1], 1), 'field')),
+    (r"^(?:ID must|Skill id ')", lambda root, m: _get(root, 'id')),
+    (r"^Version should", lambda root, m: _get(root, 'version')),
+    (r"^Language '", lambda root, m: _get(root, 'language')),
+    (r"^Name is very long", lambda root, m: _get(root, 'name')),
+    (r"^Description is very long", lambda root, m: _get(root, 'description')),
+    (r"^Command (\d+) refers", lambda root, m: _command_skill(root, m[1])),
+    (r"^Trigger '(.+?)'", lambda root, m: _command_by_trigger(root, m[1])),
+    (r"^Field mapping '([^']+)'", lambda root, m: _field_mapping(root, m[1])),
+    (r"^Field group '([^']+)'", lambda root, m: _field_mapping(root, m[1])),
+    (r"^Voice command (\d+)", lambda root, m: _voice_pattern(root, m[1])),
+]]
+
+def _position(mark) -> Dict[str, int]:
+    return {'line': mark.line, 'character': mark.column}
+
+def _node_range(node: yaml.Node) -> Dict[str, Dict[str, int]]:
+    # Point collections at their first key instead of their whole body
+    while isinstance(node, (yaml.MappingNode, yaml.SequenceNode)) and node.value:
+        node = node.value[0][0] if isinstance(node, yaml.MappingNode) else node.value[0]
+    return {'start': _position(node.start_mark), 'end': _position(node.end_mark)}
+
+_DOCUMENT_START = {'start': {'line': 0, 'character': 0}, 'end': {'line': 0, 'character': 0}}
+
+def locate(message: str, root: Optional[yaml.Node]) -> Dict[str, Dict[str, int]]:
+    """Range in the document a validator message refers to"""
+    if root is not None:
+        for pattern, find in _LOCATIONS:
+            match = pattern.match(message)
+            if match:
+                node = find(root, match)
+                if node is not None:
+                    return _node_range(node)
+                break
+    return _DOCUMENT_START
+
+class Document:
+    """One parsed skill template and its per-file validation result"""
+
+    __slots__ = ('path', 'text', 'is_open', 'node', 'skill', 'errors', 'warnings', 'references', 'triggers',
+                 'uses_fragments')
+
+    def __init__(self, path: str, text: str, is_open: bool):
+        self.path = path
+        self.text = text
+        self.is_open = is_open
+        self.node = None
+        self.skill: Optional[Dict[str, Any]] = None
+        self.errors: List[Tuple[str, Dict[str, Any]]] = []
+        self.warnings: List[Tuple[str, Dict[str, Any]]] = []
+        # (command index, referenced skill id)
+        self.references: List[Tuple[int, str]] = []
+        self.triggers: Tuple[Tuple[str, str, str], ...] = ()
+        self.uses_fragments = False
+
+    @property
+    def skill_id(self) -> Optional[str]:
+        return self.skill['id'] if self.skill else None
+
+class SkillWorkspace:
+    """In-memory documents and the cross-file symbol table"""
+
+    def __init__(self, validator, trigger_messages: TriggerMessages):
+        self.validator = validator
+        self.trigger_messages = trigger_messages
+        self.documents: Dict[str, Document] = {}
+        self.defines: Dict[str, Set[str]] = {}
+        self.references: Dict[str, Set[str]] = {}
+        self.collisions: Dict[str, Tuple[List[str], List[str]]] = {}
+        # Open fragments.yaml buffers, or the error that stops them from loading
+        self.libraries: Dict[str, Any] = {}
+
+    def _library_for(self, path: str) -> Optional[FragmentLibrary]:
+        library_path = find_library(path)
+        if library_path is None:
+            return None
+        library = self.libraries.get(library_path)
+        if library is None:
+            library = load_library(library_path)
+        if isinstance(library, FragmentError):
+            raise library
+        return library
+
+    def _analyze(self, path: str, text: str, is_open: bool) -> Document:
+        document = Document(path, text, is_open)
+        data, node, error = parse_document(text)
+        if error is not None:
+            mark = getattr(error, 'problem_mark', None) or getattr(error, 'context_mark', None)
+            where = {'start': _position(mark), 'end': _position(mark)} if mark else _DOCUMENT_START
+            document.errors = [(f"YAML parsing error: {error}", where)]
+            return document
+
+        document.node = node
+        if has_references(data):
+            document.uses_fragments = True
+            try:
+                library = self._library_for(path)
+                if library is None:
+                    raise FragmentError(f"Template uses fragments but no fragments.yaml was found above {path}")
+                data = resolve_fragments(data, path, library)
+            except (OSError, FragmentError) as e:
+                document.errors = [(f"Fragment error: {e}", _DOCUMENT_START)]
+                return document
+        # A half-typed buffer can be any shape; a failure here is the
+        # document's diagnostic, never the end of the server
+        try:
+            _, errors, warnings = self.validator.validate_data(data)
+        except Exception as e:
+            document.errors = [(f"Validation failed: {type(e).__name__}: {e}", _DOCUMENT_START)]
+            return document
+        document.errors = [(message, locate(message, node)) for message in errors]
+        document.warnings = [(message, locate(message, node)) for message in warnings]
+        if isinstance(data, dict):
+            try:
+                skill = normalize_skill(data, path)
+                triggers = tuple(sorted(
+                    (normalize_trigger(c['trigger']), str(c['skill'] or ''), str(c['action'])) for c in skill['commands']
+                ))
+            except Exception as e:
+                document.errors.append((f"Template could not be read as a skill: {type(e).__name__}: {e}",
+                                        _DOCUMENT_START))
+                return document
+            document.skill = skill
+            document.triggers = triggers
+            commands = data.get('commands')
+            for i, command in enumerate(commands if isinstance(commands, list) else []):
+                if isinstance(command, dict) and isinstance(command.get('skill'), str):
+                    document.references.append((i, command['skill']))
+        return document
+
+    def _unlink(self, document: Document) -> None:
+        if document.skill_id is not None:
+            self.defines.get(document.skill_id, set()).discard(document.path)
+        for _, skill_id in document.references:
+            self.references.get(skill_id, set()).discard(document.path)
+
+    def _link(self, document: Document) -> None:
+        if document.skill_id is not None:
+            self.defines.setdefault(document.skill_id, set()).add(document.path)
+        for _, skill_id in document.references:
+            self.references.setdefault(skill_id, set()).add(document.path)
+
+    def _dependents(self, skill_ids: Set[str]) -> Set[str]:
+        affected = set()
+        for skill_id in skill_ids:
+            affected |= self.defines.get(skill_id, set())
+            affected |= self.references.get(skill_id, set())
+        return affected
+
+    def _refresh_collisions(self) -> Set[str]:
+        """Recompute trigger collisions; returns documents whose collisions changed"""
+        skills = [document.skill for document in self.documents.values() if document.skill]
+        collisions = self.trigger_messages(skills)
+        changed = {path for path in set(collisions) | set(self.collisions)
+                   if collisions.get(path) != self.collisions.get(path)}
+        self.collisions = collisions
+        return changed
+
+    def load(self, root: str) -> List[str]:
+        """Read every skill file under root from disk; returns the loaded paths"""
+        for file_path in find_skill_files([root]):
+            path = str(Path(file_path).resolve())
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    text = f.read()
+            except (OSError, UnicodeDecodeError):
+                continue
+            document = self._analyze(path, text, is_open=False)
+            self.documents[path] = document
+            self._link(document)
+        self._refresh_collisions()
+        return list(self.documents)
+
+    def update(self, path: str, text: str, is_open: bool = True) -> Set[str]:
+        """Re-validate one document; returns every document whose diagnostics may have changed"""
+        if is_fragment_library(path):
+            return self._update_library(path, text)
+        previous = self.documents.get(path)
+        if previous is not None and previous.text == text:
+            previous.is_open = is_open
+            return {path}
+
+        document = self._analyze(path, text, is_open)
+        ids = {document.skill_id}
+        if previous is not None:
+            self._unlink(previous)
+            ids.add(previous.skill_id)
+        self.documents[path] = document
+        self._link(document)
+
+        affected = {path} | self._dependents({skill_id for skill_id in ids if skill_id})
+        if previous is None or previous.triggers != document.triggers:
+            affected |= self._refresh_collisions()
+        return affected
+
+    def _update_library(self, path: str, text: Optional[str]) -> Set[str]:
+        """Swap in a fragments.yaml buffer (None: back to disk) and re-validate its users"""
+        if text is None:
+            self.libraries.pop(path, None)
+        else:
+            try:
+                self.libraries[path] = FragmentLibrary.from_text(text, path)
+            except FragmentError as e:
+                self.libraries[path] = e
+        affected = set()
+        for document in list(self.documents.values()):
+            if document.uses_fragments and find_library(document.path) == path:
+                # Drop the old analysis so the unchanged text is validated again
+                del self.documents[document.path]
+                self._unlink(document)
+                if document.skill_id:
+                    affected |= self._dependents({document.skill_id})
+                affected |= self.update(document.path, document.text, document.is_open)
+        return affected
+
+    def remove(self, path: str) -> Set[str]:
+        if is_fragment_library(path):
+            return self._update_library(path, None)
+        document = self.documents.pop(path, None)
+        if document is None:
+            return set()
+        self._unlink(document)
+        affected = {path}
+        if document.skill_id:
+            affected |= self._dependents({document.skill_id})
+        if document.triggers:
+            affected |= self._refresh_collisions()
+        return affected
+
+    def diagnostics(self, path: str) -> List[Dict[str, Any]]:
+        document = self.documents.get(path)
+        if document is None:
+            return []
+        errors = list(document.errors)
+        warnings = list(document.warnings)
+
+        skill_id = document.skill_id
+        if skill_id is not None and len(self.defines.get(skill_id, ())) > 1:
+            others = sorted(self.defines[skill_id] - {path})
+            message = f"Skill id '{skill_id}' is also defined in {', '.join(others)}"
+            errors.append((message, locate(message, document.node)))
+        for i, target in document.references:
+            if not self.defines.get(target):
+                message = f"Command {i} refers to unknown skill '{target}'"
+                warnings.append((message, locate(message, document.node)))
+        collision_errors, collision_warnings = self.collisions.get(path, ([], []))
+        errors.extend((message, locate(message, document.node)) for message in collision_errors)
+        warnings.extend((message, locate(message, document.node)) for message in collision_warnings)
+
+        return (
+            [{'range': where, 'severity': ERROR, 'source': 'skill-lint', 'message': message} for message, where in errors] +
+            [{'range': where, 'severity': WARNING, 'source': 'skill-lint', 'message': message} for message, where in warnings]
+        )
+
+class LanguageServer:
+    """JSON-RPC over stdio with Content-Length framing"""
+
+    def __init__(self, workspace: SkillWorkspace, stdin=None, stdout=None):
+        self.workspace = workspace
+        self.stdin = stdin or sys.stdin.buffer
+        self.stdout = stdout or sys.stdout.buffer
+        self.root: Optional[str] = None
+        self.shutdown_requested = False
+
+    def read_message(self) -> Optional[Dict[str, Any]]:
+        length = None
+        headers = False
+        while True:
+            line = self.stdin.readline()
+            if not line:
+                return None
+            line = line.strip()
+            if not line:
+                if headers:
+                    break
+                continue  # stray blank line between messages
+            headers = True
+            name, _, value = line.decode('ascii', errors='replace').partition(':')
+            if name.lower() == 'content-length':
+                try:
+                    length = int(value.strip())
+                except ValueError:
+                    pass
+        if length is None:
+            # The headers are consumed, so the next message still frames correctly
+            raise ValueError("Message without a valid Content-Length header")
+        return json.loads(self.stdin.read(length).decode('utf-8'))
+
+    def send(self, payload: Dict[str, Any]) -> None:
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        self.stdout.write(b'Content-Length: %d\r\n\r\n' % len(body) + body)
+        self.stdout.flush()
+
+    def notify(self, method: str, params: Dict[str, Any]) -> None:
+        self.send({'jsonrpc': '2.0', 'method': method, 'params': params})
+
+    def publish(self, paths: Set[str]) -> None:
+        for path in sorted(paths):
+            self.notify('textDocument/publishDiagnostics', {
+                'uri': path_to_uri(path),
+                'diagnostics': self.workspace.diagnostics(path),
+            })
+
+    def log(self, message: str, level: int = 4) -> None:
+        """window/logMessage; level 1 is an error, 4 a plain log line"""
+        self.notify('window/logMessage', {'type': level, 'message': message})
+
+    def on_initialize(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        folders = params.get('workspaceFolders') or []
+        if folders:
+            self.root = uri_to_path(folders[0]['uri'])
+        elif params.get('rootUri'):
+            self.root = uri_to_path(params['rootUri'])
+        elif params.get('rootPath'):
+            self.root = params['rootPath']
+        return {
+            'capabilities': {
+                # Full document sync: templates are small and re-parsing is cheaper than patching
+                'textDocumentSync': {'openClose': True, 'change': 1, 'save': {'includeText': False}},
+            },
+            'serverInfo': {'name': 'skill-lint'},
+        }
+
+    def on_initialized(self, params: Dict[str, Any]) -> None:
+        if self.root:
+            start = time.perf_counter()
+            paths = self.workspace.load(self.root)
+            self.publish({path for path in paths if self.workspace.diagnostics(path)})
+            self.log(f"Loaded {len(paths)} skill templates in {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    def on_change(self, uri: str, text: str) -> None:
+        start = time.perf_counter()
+        affected = self.workspace.update(uri_to_path(uri), text)
+        self.publish(affected)
+        self.log(f"Validated {uri} and {len(affected) - 1} dependents in "
+                 f"{(time.perf_counter() - start) * 1000:.1f} ms")
+
+    def on_close(self, uri: str) -> None:
+        # Fall back to the saved file, or forget a buffer that was never saved
+        path = uri_to_path(uri)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                self.publish(self.workspace.update(path, f.read(), is_open=False))
+        except (OSError, UnicodeDecodeError):
+            self.publish(self.workspace.remove(path))
+
+    def on_watched_files(self, changes: List[Dict[str, Any]]) -> None:
+        for change in changes:
+            path = uri_to_path(change['uri'])
+            document = self.workspace.documents.get(path)
+            if document is not None and document.is_open:
+                continue  # the editor buffer is the source of truth
+            if change.get('type') == 3:
+                self.publish(self.workspace.remove(path))
+            else:
+                self.on_close(change['uri'])
+
+    def handle(self, message: Dict[str, Any]) -> None:
+        """Dispatch one message; a failing handler answers with an error instead of exiting"""
+        try:
+            self._dispatch(message)
+        except Exception as e:
+            method = message.get('method') if isinstance(message, dict) else None
+            detail = f"{method or 'message'} failed: {type(e).__name__}: {e}"
+            self.log(f"{detail}\n{traceback.format_exc()}", level=1)
+            if isinstance(message, dict) and message.get('id') is not None:
+                self.send({'jsonrpc': '2.0', 'id': message['id'],
+                           'error': {'code': -32603, 'message': detail}})
+
+    def _dispatch(self, message: Dict[str, Any]) -> None:
+        method = message.get('method')
+        params = message.get('params') or {}
+
+        if method == 'initialize':
+            result = self.on_initialize(params)
+        elif method == 'shutdown':
+            self.shutdown_requested = True
+            result = None
+        elif method == 'initialized':
+            self.on_initialized(params)
+            return
+        elif method == 'textDocument/didOpen':
+            document = params['textDocument']
+            self.on_change(document['uri'], document['text'])
+            return
+        elif method == 'textDocument/didChange':
+            changes = params.get('contentChanges') or []
+            if changes:
+                self.on_change(params['textDocument']['uri'], changes[-1]['text'])
+            return
+        elif method == 'textDocument/didClose':
+            self.on_close(params['textDocument']['uri'])
+            return
+        elif method == 'workspace/didChangeWatchedFiles':
+            self.on_watched_files(params.get('changes') or [])
+            return
+        elif 'id' in message:
+            self.send({'jsonrpc': '2.0', 'id': message['id'],
+                       'error': {'code': -32601, 'message': f"Method not found: {method}"}})
+            return
+        else:
+            return  # notifications we do not handle, e.g. didSave or $/cancelRequest
+
+        self.send({'jsonrpc': '2.0', 'id': message['id'], 'result': result})
+
+    def serve(self) -> int:
+        """Run until the client sends exit; returns the process exit code"""
+        while True:
+            try:
+                message = self.read_message()
+            except (ValueError, UnicodeDecodeError) as e:
+                self.send({'jsonrpc': '2.0', 'id': None, 'error': {'code': -32700, 'message': f"Parse error: {e}"}})
+                continue
+            if message is None:
+                return 1
+            if not isinstance(message, dict):
+                self.send({'jsonrpc': '2.0', 'id': None, 'error': {'code': -32600, 'message': "Invalid request"}})
+                continue
+            if message.get('method') == 'exit':
+                return 0 if self.shutdown_requested else 1
+            self.handle(message)
@@ -0,0 +1,349 @@
+"""
+OCR text to skill field extraction
+
+SkillEngine.processOCRText only checks whether a scanned page mentions a
+prompt's question or field name, and stops at the first form that does. The
+asset templates know much more about their fields: `aliases` are the labels
+printed on paper forms, `patterns` the names used in markup (first_name,
+firstName), and `validation` what a value has to look like. This module
+turns all of them into one extractor:
+
+- every alias and pattern (split into words) of every skill goes into one
+  inverted index, label -> [(skill, field), ...], and into one token-level
+  Aho-Corasick automaton (skill_triggers.TriggerIndex) that finds every
+  label on a line in a single pass
+- OCR text is streamed line by line; overlapping labels resolve to the
+  longest, leftmost one, and a label only counts where a form prints one:
+  at the start of a line or after a column gap, followed by a colon, a
+  column gap or the end of the line (or by a single space at line start)
+- the value is the text up to the next label on the line, or the next
+  non-empty line when the label stands alone ("Address:" above the answer)
+- each value is checked against the field's validation regex with the
+  app's java-like semantics (as in skill_executor), retried lowercased for
+  option lists such as gender; a label shared by several fields goes to the
+  first free field whose regex accepts the value, and a value no field
+  accepts is reported as rejected; a value after a weak label ("STATE
+  DEPARTMENT OF ..." in a letterhead) gives way to a later strong one
+- a document belongs to the skill with the most validated fields, unless
+  the caller names one
+
+Folders of scanned-form text are processed in parallel, one pickled
+extractor per worker process, with documents yielded in input order. A
+fixture is a `name.json` next to `name.txt` holding the expected skill and
+field values; ExtractionStats scores documents against them per field.
+"""
+
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Any, Iterable, Iterator, Optional, Set, Tuple
+
+from skill_catalog import find_skill_files, load_skill
+from skill_triggers import TriggerIndex
+
+TEXT_EXTENSIONS = ('.txt',)
+
+# Words as the labels and the OCR text are tokenized; "driver's" and
+# "e-mail" stay one word
+_WORD = re.compile(r"[^\W_]+(?:['\-][^\W_]+)*")
+_CAMEL = re.compile(r'(?<=[a-z0-9])(?=[A-Z])')
+# Column gaps between a label and its neighbours
+_GAP = re.compile(r'\s{2,}|\t|\|')
+_SEPARATOR = re.compile(r'[ \t]*[:|]')
+_LEADING = re.compile(r'^[\s:|_.\-]+')
+
+def label_words(text: str) -> List[str]:
+    """Lowercased words of an alias or pattern; first_name and firstName become 'first name'"""
+    return [word.lower() for word in _WORD.findall(_CAMEL.sub(' ', text).replace('_', ' '))]
+
+def clean_value(text: str) -> str:
+    """Strip the separators and fill-in underscores around a value and collapse whitespace"""
+    return ' '.join(_LEADING.sub('', text).rstrip(' \t|_:').split())
+
+def same_value(a: Any, b: Any) -> bool:
+    return ' '.join(str(a).split()).casefold() == ' '.join(str(b).split()).casefold()
+
+def load_skills(paths: Iterable[str]) -> Tuple[List[Dict[str, Any]], List[str]]:
+    """Skills with prompts under paths, and a message per file that failed to load"""
+    skills, skipped = [], []
+    for file_path in find_skill_files(paths):
+        try:
+            skill = load_skill(file_path)
+        except Exception as e:
+            skipped.append(f"{file_path}: {str(e).splitlines()[0]}")
+            continue
+        if skill['prompts']:
+            skills.append(skill)
+    return skills, skipped
+
+class FieldExtractor:
+    """Inverted label index and multi-pattern matcher over every skill's field labels"""
+
+    def __init__(self, skills: Iterable[Dict[str, Any]], skill_id: Optional[str] = None):
+        self.skill_id = skill_id
+        self.skill_ids: List[str] = []
+        # label -> [(skill id, field), ...] in skill and prompt order
+        self.labels: Dict[str, List[Tuple[str, str]]] = {}
+        self.validators: Dict[Tuple[str, str], Optional[re.Pattern]] = {}
+        self.index = TriggerIndex()
+
+        for skill in skills:
+            if skill_id is not None and skill['id'] != skill_id:
+                continue
+            self.skill_ids.append(skill['id'])
+            for prompt in skill['prompts']:
+                key = (skill['id'], prompt['field'])
+                validation = prompt['validation']
+                self.validators[key] = re.compile(validation, re.ASCII) if validation is not None else None
+                names = prompt.get('aliases', []) + prompt.get('patterns', []) + [prompt['field']]
+                for name in names:
+                    words = label_words(name)
+                    if not words:
+                        continue
+                    label = ' '.join(words)
+                    owners = self.labels.get(label)
+                    if owners is None:
+                        owners = self.labels[label] = []
+                        self.index.add(label, skill['id'], skill['language'], skill['source'])
+                    if key not in owners:
+                        owners.append(key)
+        self.index.build()
+
+    def labels_on(self, line: str) -> List[Tuple[int, int, str, bool]]:
+        """(start, end, label, strong) of every label on a line, left to right
+
+        A strong label is followed by a colon, a column gap or the end of the
+        line; a weak one starts the line and is followed by a single space.
+        """
+        spans = [match.span() for match in _WORD.finditer(line)]
+        if not spans:
+            return []
+        words = [line[start:end].lower() for start, end in spans]
+        found = sorted(self.index.find(words), key=lambda hit: (hit[0], hit[0] - hit[1]))
+        labels = []
+        taken = -1
+        for first, last, trigger_id in found:
+            if first <= taken:
+                continue
+            start, end = spans[first][0], spans[last][1]
+            at_start = first == 0 and not line[:start].strip()
+            if not at_start and not _GAP.search(line[spans[first - 1][1]:start]):
+                continue
+            rest = line[end:]
+            strong = bool(_SEPARATOR.match(rest) or rest.startswith(('  ', '\t')) or not rest.strip())
+            if not strong and not (at_start and rest.startswith(' ')):
+                continue
+            labels.append((start, end, self.index.triggers[trigger_id]['trigger'], strong))
+            taken = last
+        return labels
+
+    def _check(self, key: Tuple[str, str], value: str) -> Optional[str]:
+        pattern = self.validators[key]
+        if pattern is None or pattern.fullmatch(value):
+            return value
+        lowered = value.lower()
+        if lowered != value and pattern.fullmatch(lowered):
+            return lowered
+        return None
+
+    def _assign(self, found: Dict[str, Dict[str, Any]], rejected: Dict[str, List[Dict[str, Any]]],
+                weak: Set[Tuple[str, str]], label: str, value: str, line: int, strong: bool) -> None:
+        owners = self.labels[label]
+        for skill_id in dict.fromkeys(owner for owner, _ in owners):
+            fields = found[skill_id]
+            # A value behind a colon or column gap replaces one read after a weak label
+            free = [field for owner, field in owners
+                    if owner == skill_id and (field not in fields or (strong and (skill_id, field) in weak))]
+            for field in free:
+                checked = self._check((skill_id, field), value)
+                if checked is not None:
+                    fields[field] = {'value': checked, 'label': label, 'line': line}
+                    if strong:
+                        weak.discard((skill_id, field))
+                    else:
+                        weak.add((skill_id, field))
+                    break
+            else:
+                if free:
+                    rejected[skill_id].append({'field': free[0], 'value': value, 'label': label, 'line': line})
+
+    def extract_lines(self, lines: Iterable[str]) -> Dict[str, Any]:
+        """Fields of one document, read from its lines as they stream in"""
+        found: Dict[str, Dict[str, Any]] = {skill_id: {} for skill_id in self.skill_ids}
+        rejected: Dict[str, List[Dict[str, Any]]] = {skill_id: [] for skill_id in self.skill_ids}
+        weak: Set[Tuple[str, str]] = set()
+        pending: Optional[Tuple[str, int]] = None
+        count = 0
+
+        for count, line in enumerate(lines, 1):
+            line = line.rstrip('\r\n')
+            if not line.strip():
+                continue
+            labels = self.labels_on(line)
+            if pending is not None:
+                # A label standing alone takes the next line, unless that line
+                # starts with a label of its own
+                if labels and labels[0][0] == len(line) - len(line.lstrip()) and not labels[0][3]:
+                    labels = []
+                head = clean_value(line[:labels[0][0]] if labels else line)
+                if head:
+                    self._assign(found, rejected, weak, pending[0], head, count, True)
+                    pending = None
+                elif labels:
+                    pending = None
+            for position, (start, end, label, strong) in enumerate(labels):
+                stop = labels[position + 1][0] if position + 1 < len(labels) else len(line)
+                value = clean_value(line[end:stop])
+                if value:
+                    self._assign(found, rejected, weak, label, value, count, strong)
+                    pending = None
+                else:
+                    pending = (label, count)
+
+        scores = {skill_id: len(fields) for skill_id, fields in found.items() if fields}
+        if self.skill_id is not None:
+            skill = self.skill_id if self.skill_id in found else None
+        else:
+            ranked = sorted(self.skill_ids, key=lambda skill_id: (-len(found[skill_id]), len(rejected[skill_id])))
+            skill = ranked[0] if ranked and found[ranked[0]] else None
+        return {
+            'lines': count,
+            'skill': skill,
+            'fields': found[skill] if skill else {},
+            'rejected': rejected[skill] if skill else [],
+            'scores': scores,
+        }
+
+    def extract_file(self, file_path: str) -> Dict[str, Any]:
+        with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
+            document = self.extract_lines(f)
+        document['file'] = file_path
+        return document
+
+def find_text_files(paths: Iterable[str]) -> List[str]:
+    """OCR text dumps under the given files and directories, in a stable order"""
+    files = []
+    for path in paths:
+        path = Path(path)
+        if path.is_dir():
+            files.extend(sorted(str(p) for p in path.rglob('*') if p.suffix in TEXT_EXTENSIONS and p.is_file()))
+        elif path.is_file():
+            files.append(str(path))
+    return files
+
+def load_fixture(file_path: str) -> Optional[Dict[str, Any]]:
+    """The labeled fixture next to an OCR dump (name.json beside name.txt), if any"""
+    import json
+
+    fixture_path = Path(file_path).with_suffix('.json')
+    if not fixture_path.is_file():
+        return None
+    with open(fixture_path, 'r', encoding='utf-8') as f:
+        fixture = json.load(f)
+    if not isinstance(fixture, dict) or not isinstance(fixture.get('fields', {}), dict):
+        raise ValueError(f"{fixture_path}: expected an object with 'skill' and 'fields'")
+    return fixture
+
+_worker_extractor: Optional[FieldExtractor] = None
+
+def _init_worker(extractor: FieldExtractor) -> None:
+    """Install the extractor pickled once per pool worker"""
+    global _worker_extractor
+    _worker_extractor = extractor
+
+def _extract_in_worker(file_path: str) -> Dict[str, Any]:
+    return _worker_extractor.extract_file(file_path)
+
+def extract_files(files: List[str], extractor: FieldExtractor, jobs: int = 1) -> Iterator[Dict[str, Any]]:
+    """Yield one document per file in input order, over N worker processes when jobs > 1"""
+    if jobs <= 1 or len(files) < 2:
+        for file_path in files:
+            yield extractor.extract_file(file_path)
+        return
+    chunk = max(1, -(-len(files) // (jobs * 4)))
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=(extractor,)) as pool:
+        yield from pool.map(_extract_in_worker, files, chunksize=chunk)
+
+class ExtractionStats:
+    """Throughput over a batch, and per-field precision and recall against fixtures"""
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.files = 0
+        self.lines = 0
+        self.extracted = 0
+        self.rejected = 0
+        self.unmatched = 0
+        self.skills: Dict[str, int] = {}
+        self.labeled = 0
+        self.skill_correct = 0
+        # field -> [extracted, correct, expected] over labeled documents
+        self.fields: Dict[str, List[int]] = {}
+        self.mistakes: List[Dict[str, Any]] = []
+
+    def add(self, document: Dict[str, Any], fixture: Optional[Dict[str, Any]] = None) -> None:
+        self.files += 1
+        self.lines += document['lines']
+        self.extracted += len(document['fields'])
+        self.rejected += len(document['rejected'])
+        if document['skill'] is None:
+            self.unmatched += 1
+        else:
+            self.skills[document['skill']] = self.skills.get(document['skill'], 0) + 1
+        if fixture is None:
+            return
+
+        self.labeled += 1
+        if document['skill'] == fixture.get('skill'):
+            self.skill_correct += 1
+        elif fixture.get('skill'):
+            self.mistakes.append({'file': document['file'], 'field': None,
+                                  'expected': fixture.get('skill'), 'got': document['skill']})
+        expected = fixture.get('fields', {})
+        extracted = {field: found['value'] for field, found in document['fields'].items()}
+        for field in sorted(set(expected) | set(extracted)):
+            counts = self.fields.setdefault(field, [0, 0, 0])
+            if field in extracted:
+                counts[0] += 1
+            if field in expected:
+                counts[2] += 1
+            if field in extracted and field in expected and same_value(extracted[field], expected[field]):
+                counts[1] += 1
+            elif field in extracted or field in expected:
+                self.mistakes.append({'file': document['file'], 'field': field,
+                                      'expected': expected.get(field), 'got': extracted.get(field)})
+
+    def report(self) -> Dict[str, Any]:
+        elapsed = time.perf_counter() - self.start
+        rate = (lambda count: round(count / elapsed, 1)) if elapsed > 0 else (lambda count: None)
+        fields = {}
+        for field, (extracted, correct, expected) in sorted(self.fields.items()):
+            fields[field] = {
+                'extracted': extracted,
+                'correct': correct,
+                'expected': expected,
+                'precision': round(correct / extracted, 4) if extracted else None,
+                'recall': round(correct / expected, 4) if expected else None,
+            }
+        extracted = sum(counts[0] for counts in self.fields.values())
+        correct = sum(counts[1] for counts in self.fields.values())
+        expected = sum(counts[2] for counts in self.fields.values())
+        return {
+            'files': self.files,
+            'lines': self.lines,
+            'fields_extracted': self.extracted,
+            'values_rejected': self.rejected,
+            'unmatched_files': self.unmatched,
+            'skills': dict(sorted(self.skills.items())),
+            'elapsed_s': round(elapsed, 3),
+            'fields_per_s': rate(self.extracted),
+            'lines_per_s': rate(self.lines),
+            'files_per_s': rate(self.files),
+            'labeled_files': self.labeled,
+            'skill_accuracy': round(self.skill_correct / self.labeled, 4) if self.labeled else None,
+            'precision': round(correct / extracted, 4) if extracted else None,
+            'recall': round(correct / expected, 4) if expected else None,
+            'per_field': fields,
+            'mistakes': self.mistakes,
+        }
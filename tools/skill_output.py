@@ -0,0 +1,152 @@
+"""
+Streaming output formats for skill-lint
+
+Each writer emits one record per file as soon as its result is known and
+keeps only the summary counters in memory, so linting a catalog of any size
+runs in flat memory and CI can start reading before the run finishes:
+
+- jsonl: one JSON object per line, `{"type": "file", ...}` per file and a
+  final `{"type": "summary", ...}` line
+- sarif: a SARIF 2.1.0 log with one result per error or warning, for code
+  scanning uploads; the counters are written last in the run properties.
+  Files in the repository are reported relative to %SRCROOT% (the repo
+  root), and a result only has a region when the message names a line
+"""
+
+import re
+import json
+from pathlib import Path
+from urllib.parse import quote
+from typing import Dict, Any, Optional, TextIO
+
+from skill_catalog import REPO_ROOT
+
+SARIF_SCHEMA = 'https://json.schemastore.org/sarif-2.1.0.json'
+SARIF_VERSION = '2.1.0'
+SARIF_SRCROOT = '%SRCROOT%'
+
+# PyYAML errors end with the position of the problem: 'line 3, column 5'
+MESSAGE_POSITION = re.compile(r', line (\d+), column (\d+)')
+
+class StreamWriter:
+    """Base class: counts results and leaves the formatting to subclasses"""
+
+    def __init__(self, stream: TextIO):
+        self.stream = stream
+        self.summary = {
+            'total_files': 0,
+            'valid_files': 0,
+            'files_with_errors': 0,
+            'files_with_warnings': 0,
+        }
+
+    def __enter__(self) -> 'StreamWriter':
+        self.begin()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.end()
+
+    def write(self, file_result: Dict[str, Any]) -> None:
+        """Count one file result and write it out immediately"""
+        self.summary['total_files'] += 1
+        if file_result['valid']:
+            self.summary['valid_files'] += 1
+        else:
+            self.summary['files_with_errors'] += 1
+        if file_result['warnings']:
+            self.summary['files_with_warnings'] += 1
+
+        self.write_result(file_result)
+        self.stream.flush()
+
+    def begin(self) -> None:
+        pass
+
+    def write_result(self, file_result: Dict[str, Any]) -> None:
+        raise NotImplementedError
+
+    def end(self) -> None:
+        pass
+
+class JsonLinesWriter(StreamWriter):
+    """One JSON object per line, summary last"""
+
+    def write_result(self, file_result: Dict[str, Any]) -> None:
+        self.stream.write(json.dumps({'type': 'file', **file_result}) + '\n')
+
+    def end(self) -> None:
+        self.stream.write(json.dumps({'type': 'summary', **self.summary}) + '\n')
+        self.stream.flush()
+
+class SarifWriter(StreamWriter):
+    """SARIF 2.1.0 log written incrementally, one result per message"""
+
+    RULES = [
+        {'id': 'skill-lint/error', 'shortDescription': {'text': 'Skill template error'},
+         'defaultConfiguration': {'level': 'error'}},
+        {'id': 'skill-lint/warning', 'shortDescription': {'text': 'Skill template warning'},
+         'defaultConfiguration': {'level': 'warning'}},
+    ]
+
+    def __init__(self, stream: TextIO, root: Path = REPO_ROOT):
+        super().__init__(stream)
+        self.root = Path(root).resolve()
+        self.results_written = 0
+
+    def begin(self) -> None:
+        driver = {'name': 'skill-lint', 'informationUri': 'https://github.com/WeberG619/VoiceBridge',
+                  'rules': self.RULES}
+        base = {SARIF_SRCROOT: {'uri': self.root.as_uri().rstrip('/') + '/'}}
+        header = json.dumps({'$schema': SARIF_SCHEMA, 'version': SARIF_VERSION})
+        # Leave the log open after the results array so results can be appended
+        self.stream.write(header[:-1] + ', "runs": [{"tool": ' + json.dumps({'driver': driver})
+                          + ', "originalUriBaseIds": ' + json.dumps(base) + ', "results": [')
+        self.stream.flush()
+
+    def artifact_location(self, path: str) -> Dict[str, str]:
+        """URI relative to %SRCROOT% for files in the repo, an absolute file URI otherwise"""
+        resolved = Path(path).resolve()
+        try:
+            relative = resolved.relative_to(self.root)
+        except ValueError:
+            return {'uri': resolved.as_uri()}
+        return {'uri': quote(relative.as_posix()), 'uriBaseId': SARIF_SRCROOT}
+
+    @staticmethod
+    def region(message: str) -> Optional[Dict[str, int]]:
+        """Line and column named in the message, if any"""
+        match = MESSAGE_POSITION.search(message)
+        if match is None:
+            return None
+        return {'startLine': int(match.group(1)), 'startColumn': int(match.group(2))}
+
+    def write_result(self, file_result: Dict[str, Any]) -> None:
+        artifact = None
+        for level, messages in (('error', file_result['errors']), ('warning', file_result['warnings'])):
+            for message in messages:
+                if artifact is None:
+                    artifact = self.artifact_location(file_result['file'])
+                location = {'artifactLocation': artifact}
+                region = self.region(message)
+                if region is not None:
+                    location['region'] = region
+                result = {
+                    'ruleId': f'skill-lint/{level}',
+                    'ruleIndex': 0 if level == 'error' else 1,
+                    'level': level,
+                    'message': {'text': message},
+                    'locations': [{'physicalLocation': location}],
+                }
+                separator = ',' if self.results_written else ''
+                self.stream.write(f"{separator}\n{json.dumps(result)}")
+                self.results_written += 1
+
+    def end(self) -> None:
+        self.stream.write('\n], "properties": ' + json.dumps(self.summary) + '}]}\n')
+        self.stream.flush()
+
+WRITERS = {
+    'jsonl': JsonLinesWriter,
+    'sarif': SarifWriter,
+}
@@ -0,0 +1,131 @@
+"""
+Per-phase timing for skill-lint runs
+
+Backs `skill-lint.py --profile`. A lint run spends its time in a few phases:
+
+- parse: reading a file and parsing its YAML
+- fragments: resolving `use:` references against the fragment library
+- schema: the compiled schema traversal, minus the regex analysis
+- regex: compiling validation patterns and the ReDoS analysis
+- cross_file: the trigger collision and language variant checks
+- output: formatting and writing the report
+
+Phases nest (regex runs inside schema), and each one is charged only its
+exclusive time, so the phase totals add up to the profiled run. Wall time
+comes from perf_counter and CPU time from process_time, per phase and per
+file; a file's time is every phase that ran while it was being validated.
+
+An unprofiled run never touches this module: the timed steps live in
+ProfilingValidator, a SkillValidator subclass in skill-lint.py, and the regex
+timer is swapped into skill_schema only for the duration of a profiled run.
+"""
+
+import sys
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Any, Optional, TextIO
+
+PHASES = ('parse', 'fragments', 'schema', 'regex', 'cross_file', 'output')
+
+DEFAULT_TOP = 10
+
+class Profiler:
+    """Exclusive wall and CPU time per phase, overall and per file"""
+
+    def __init__(self):
+        self.totals: Dict[str, List[float]] = {phase: [0.0, 0.0] for phase in PHASES}
+        self.files: Dict[str, Dict[str, List[float]]] = {}
+        self._file: Optional[Dict[str, List[float]]] = None
+        # Time spent in nested phases, per open phase
+        self._stack: List[List[float]] = []
+
+    @contextmanager
+    def phase(self, name: str):
+        self._stack.append([0.0, 0.0])
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            yield
+        finally:
+            wall = time.perf_counter() - wall
+            cpu = time.process_time() - cpu
+            nested_wall, nested_cpu = self._stack.pop()
+            if self._stack:
+                self._stack[-1][0] += wall
+                self._stack[-1][1] += cpu
+            self._charge(self.totals, name, wall - nested_wall, cpu - nested_cpu)
+            if self._file is not None:
+                self._charge(self._file, name, wall - nested_wall, cpu - nested_cpu)
+
+    @staticmethod
+    def _charge(table: Dict[str, List[float]], name: str, wall: float, cpu: float) -> None:
+        entry = table.setdefault(name, [0.0, 0.0])
+        entry[0] += wall
+        entry[1] += cpu
+
+    @contextmanager
+    def file(self, file_path: str):
+        """Charge the phases that run inside to this file as well"""
+        previous, self._file = self._file, self.files.setdefault(file_path, {})
+        try:
+            yield
+        finally:
+            self._file = previous
+
+    @contextmanager
+    def timing(self, module: Any, attribute: str, name: str):
+        """Time every call of module.attribute as a phase while the block runs"""
+        original = getattr(module, attribute)
+
+        def timed(*args, **kwargs):
+            with self.phase(name):
+                return original(*args, **kwargs)
+
+        setattr(module, attribute, timed)
+        try:
+            yield
+        finally:
+            setattr(module, attribute, original)
+
+    def report(self, top: int = DEFAULT_TOP) -> Dict[str, Any]:
+        """Phase totals, every file's phases and the `top` slowest files (times in ms)"""
+        total_wall = sum(wall for wall, _ in self.totals.values())
+        total_cpu = sum(cpu for _, cpu in self.totals.values())
+        files = [_file_record(file_path, phases) for file_path, phases in self.files.items()]
+        return {
+            'wall_ms': _ms(total_wall),
+            'cpu_ms': _ms(total_cpu),
+            'phases': {
+                name: {'wall_ms': _ms(wall), 'cpu_ms': _ms(cpu),
+                       'share': round(wall / total_wall, 4) if total_wall else 0.0}
+                for name, (wall, cpu) in self.totals.items()
+            },
+            'slowest': sorted(files, key=lambda record: record['wall_ms'], reverse=True)[:top],
+            'files': files,
+        }
+
+def _ms(seconds: float) -> float:
+    return round(seconds * 1000, 3)
+
+def _file_record(file_path: str, phases: Dict[str, List[float]]) -> Dict[str, Any]:
+    return {
+        'file': file_path,
+        'wall_ms': _ms(sum(wall for wall, _ in phases.values())),
+        'cpu_ms': _ms(sum(cpu for _, cpu in phases.values())),
+        'phases': {name: {'wall_ms': _ms(phases[name][0]), 'cpu_ms': _ms(phases[name][1])}
+                   for name in PHASES if name in phases},
+    }
+
+def print_report(report: Dict[str, Any], stream: TextIO = sys.stdout) -> None:
+    print(f"⏱️  Profile: {report['wall_ms']:.1f} ms wall, {report['cpu_ms']:.1f} ms CPU "
+          f"over {len(report['files'])} files", file=stream)
+    print(f"━" * 50, file=stream)
+    for name, phase in report['phases'].items():
+        print(f"{name:<12} {phase['wall_ms']:10.1f} ms wall {phase['cpu_ms']:10.1f} ms CPU "
+              f"{phase['share']:7.1%}", file=stream)
+    if report['slowest']:
+        print(file=stream)
+        print("Slowest files:", file=stream)
+    for rank, record in enumerate(report['slowest'], 1):
+        phases = ', '.join(f"{name} {phase['wall_ms']:.1f}" for name, phase in record['phases'].items())
+        print(f"{rank:>3}. {record['wall_ms']:8.1f} ms  {record['file']}", file=stream)
+        print(f"       {phases}", file=stream)
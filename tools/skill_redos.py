@@ -0,0 +1,380 @@
+"""
+Static ReDoS analysis for skill validation regexes
+
+The app runs every prompt `validation` pattern through
+`userInput.matches(Regex(pattern))`, a backtracking full match. This module
+parses a pattern with sre_parse and looks for the two shapes that make such a
+match super-linear on a long transcript:
+
+- Exponential, O(2^n): a large quantifier whose body can match the same run
+  of one character in more than one way, e.g. (a+)+, (\\w+\\s?)*, (a|a)*
+- Polynomial, O(n^k): k large quantifiers in sequence that can all match the
+  same character, with everything between them able to match it too (or be
+  skipped), e.g. \\w+\\s*\\w+$
+
+The analysis pumps runs of single probe characters through the parse tree, so
+it can miss ambiguity that only shows up on mixed input; fragments are shown
+as sre_parse normalizes them, e.g. (a|a) is reported as (a|).
+"""
+
+from typing import Dict, List, Any, Optional, Set, Tuple
+
+try:
+    # sre_parse was folded into re._parser in Python 3.11 and now warns on import
+    from re import _parser as sre_parse
+    from re import _constants as sre_constants
+except ImportError:  # pragma: no cover - Python < 3.11
+    import sre_parse
+    import sre_constants
+
+MAXREPEAT = sre_constants.MAXREPEAT
+LITERAL = sre_constants.LITERAL
+NOT_LITERAL = sre_constants.NOT_LITERAL
+IN = sre_constants.IN
+ANY = sre_constants.ANY
+AT = sre_constants.AT
+BRANCH = sre_constants.BRANCH
+SUBPATTERN = sre_constants.SUBPATTERN
+MAX_REPEAT = sre_constants.MAX_REPEAT
+MIN_REPEAT = sre_constants.MIN_REPEAT
+POSSESSIVE_REPEAT = getattr(sre_constants, 'POSSESSIVE_REPEAT', None)
+ATOMIC_GROUP = getattr(sre_constants, 'ATOMIC_GROUP', None)
+GROUPREF = sre_constants.GROUPREF
+ASSERT = sre_constants.ASSERT
+ASSERT_NOT = sre_constants.ASSERT_NOT
+CATEGORY = sre_constants.CATEGORY
+RANGE = sre_constants.RANGE
+NEGATE = sre_constants.NEGATE
+
+# Quantifiers with an upper bound at least this large are treated as unbounded
+LARGE_REPEAT = 10
+
+# Lengths are tracked up to this cap; longer runs collapse onto it
+LENGTH_CAP = 6
+
+EXPONENTIAL = 'exponential'
+POLYNOMIAL = 'polynomial'
+
+# Finding shapes: a repeat whose body is ambiguous, or a run of quantifiers
+NESTED = 'nested'
+ADJACENT = 'adjacent'
+
+_CATEGORY_TESTS = {
+    sre_constants.CATEGORY_DIGIT: lambda c: c.isdigit(),
+    sre_constants.CATEGORY_NOT_DIGIT: lambda c: not c.isdigit(),
+    sre_constants.CATEGORY_SPACE: lambda c: c.isspace(),
+    sre_constants.CATEGORY_NOT_SPACE: lambda c: not c.isspace(),
+    sre_constants.CATEGORY_WORD: lambda c: c.isalnum() or c == '_',
+    sre_constants.CATEGORY_NOT_WORD: lambda c: not (c.isalnum() or c == '_'),
+}
+
+_CATEGORY_TEXT = {
+    sre_constants.CATEGORY_DIGIT: r'\d',
+    sre_constants.CATEGORY_NOT_DIGIT: r'\D',
+    sre_constants.CATEGORY_SPACE: r'\s',
+    sre_constants.CATEGORY_NOT_SPACE: r'\S',
+    sre_constants.CATEGORY_WORD: r'\w',
+    sre_constants.CATEGORY_NOT_WORD: r'\W',
+}
+
+_AT_TEXT = {
+    sre_constants.AT_BEGINNING: '^',
+    sre_constants.AT_BEGINNING_STRING: r'\A',
+    sre_constants.AT_END: '$',
+    sre_constants.AT_END_STRING: r'\Z',
+    sre_constants.AT_BOUNDARY: r'\b',
+    sre_constants.AT_NON_BOUNDARY: r'\B',
+}
+
+# Characters always probed, on top of those mentioned by the pattern
+_BASE_PROBES = set('aA0 _-.@\n') | {'é'}
+
+class RegexFinding:
+    """One super-linear construct found in a pattern"""
+
+    __slots__ = ('kind', 'complexity', 'fragment', 'probe', 'shape')
+
+    def __init__(self, kind: str, complexity: str, fragment: str, probe: str, shape: str = NESTED):
+        self.kind = kind
+        self.complexity = complexity
+        self.fragment = fragment
+        self.probe = probe
+        self.shape = shape
+
+    def describe(self) -> str:
+        if self.shape == ADJACENT:
+            detail = "adjacent quantifiers overlap on the same characters"
+        elif self.kind == EXPONENTIAL:
+            detail = "nested or overlapping quantifier can match the same input in many ways"
+        else:
+            detail = "nested quantifier under a bounded repeat can split the same input in many ways"
+        return (f"risks {self.kind} backtracking {self.complexity} in '{self.fragment}': "
+                f"{detail} (e.g. a long run of {self.probe!r})")
+
+def _is_large(max_count: int) -> bool:
+    return max_count == MAXREPEAT or max_count >= LARGE_REPEAT
+
+def _class_matches(items: List[Tuple[Any, Any]], c: str) -> bool:
+    negate = False
+    matched = False
+    for op, arg in items:
+        if op is NEGATE:
+            negate = True
+        elif op is LITERAL:
+            matched = matched or ord(c) == arg
+        elif op is RANGE:
+            matched = matched or arg[0] <= ord(c) <= arg[1]
+        elif op is CATEGORY:
+            test = _CATEGORY_TESTS.get(arg)
+            matched = matched or bool(test and test(c))
+    return matched != negate
+
+def _char_matches(op: Any, arg: Any, c: str) -> bool:
+    if op is LITERAL:
+        return ord(c) == arg
+    if op is NOT_LITERAL:
+        return ord(c) != arg
+    if op is ANY:
+        return c != '\n'
+    if op is IN:
+        return _class_matches(arg, c)
+    return False
+
+def _add_lengths(left: Dict[int, int], right: Dict[int, int]) -> Dict[int, int]:
+    """Convolve two length->ways maps, capping lengths and counts"""
+    result: Dict[int, int] = {}
+    for a, ways_a in left.items():
+        for b, ways_b in right.items():
+            length = min(a + b, LENGTH_CAP)
+            result[length] = min(2, result.get(length, 0) + ways_a * ways_b)
+    return result
+
+def _merge_lengths(left: Dict[int, int], right: Dict[int, int]) -> Dict[int, int]:
+    result = dict(left)
+    for length, ways in right.items():
+        result[length] = min(2, result.get(length, 0) + ways)
+    return result
+
+def _sequence_lengths(items: List[Tuple[Any, Any]], c: str) -> Dict[int, int]:
+    lengths = {0: 1}
+    for op, arg in items:
+        lengths = _add_lengths(lengths, _node_lengths(op, arg, c))
+        if not lengths:
+            break
+    return lengths
+
+def _node_lengths(op: Any, arg: Any, c: str) -> Dict[int, int]:
+    """Map of length -> number of ways (capped at 2) the node can match c*length"""
+    if op in (LITERAL, NOT_LITERAL, ANY, IN):
+        return {1: 1} if _char_matches(op, arg, c) else {}
+    if op is SUBPATTERN:
+        return _sequence_lengths(arg[-1], c)
+    if op is ATOMIC_GROUP:
+        return _sequence_lengths(arg, c)
+    if op is BRANCH:
+        result: Dict[int, int] = {}
+        for branch in arg[1]:
+            result = _merge_lengths(result, _sequence_lengths(branch, c))
+        return result
+    if op in (MAX_REPEAT, MIN_REPEAT) or (POSSESSIVE_REPEAT is not None and op is POSSESSIVE_REPEAT):
+        min_count, max_count, body = arg
+        body_lengths = _sequence_lengths(body, c)
+        result = {0: 1} if min_count == 0 else {}
+        current = {0: 1}
+        for count in range(1, min(max_count, LENGTH_CAP) + 1):
+            current = _add_lengths(current, body_lengths)
+            if not current:
+                break
+            if count >= min_count:
+                result = _merge_lengths(result, current)
+        if min_count > LENGTH_CAP and current:
+            result = {LENGTH_CAP: 1}
+        return result
+    # Anchors, lookarounds and back-references consume nothing we model
+    return {0: 1}
+
+def _render_sequence(items: List[Tuple[Any, Any]]) -> str:
+    return ''.join(_render(op, arg) for op, arg in items)
+
+def _render_literal(code: int, in_class: bool = False) -> str:
+    c = chr(code)
+    special = '\\]^-[' if in_class else '\\.^$*+?{}[]|()'
+    if c in special:
+        return '\\' + c
+    if c == '\n':
+        return r'\n'
+    if c == '\t':
+        return r'\t'
+    return c
+
+def _render(op: Any, arg: Any) -> str:
+    """Turn a parsed node back into regex source for messages"""
+    if op is LITERAL:
+        return _render_literal(arg)
+    if op is NOT_LITERAL:
+        return '[^' + _render_literal(arg, True) + ']'
+    if op is ANY:
+        return '.'
+    if op is AT:
+        return _AT_TEXT.get(arg, '')
+    if op is IN:
+        if len(arg) == 1 and arg[0][0] is CATEGORY:
+            return _CATEGORY_TEXT.get(arg[0][1], '')
+        parts = []
+        for item_op, item_arg in arg:
+            if item_op is NEGATE:
+                parts.append('^')
+            elif item_op is LITERAL:
+                parts.append(_render_literal(item_arg, True))
+            elif item_op is RANGE:
+                parts.append(_render_literal(item_arg[0], True) + '-' + _render_literal(item_arg[1], True))
+            elif item_op is CATEGORY:
+                parts.append(_CATEGORY_TEXT.get(item_arg, ''))
+        return '[' + ''.join(parts) + ']'
+    if op is SUBPATTERN:
+        group = arg[0]
+        return ('(' if group else '(?:') + _render_sequence(arg[-1]) + ')'
+    if op is ATOMIC_GROUP:
+        return '(?>' + _render_sequence(arg) + ')'
+    if op is BRANCH:
+        return '|'.join(_render_sequence(branch) for branch in arg[1])
+    if op in (MAX_REPEAT, MIN_REPEAT) or (POSSESSIVE_REPEAT is not None and op is POSSESSIVE_REPEAT):
+        min_count, max_count, body = arg
+        inner = _render_sequence(body)
+        if len(body) != 1 or body[0][0] is BRANCH or (body[0][0] is LITERAL and len(inner) > 1 and inner[0] != '\\'):
+            inner = '(?:' + inner + ')'
+        if (min_count, max_count) == (0, MAXREPEAT):
+            suffix = '*'
+        elif (min_count, max_count) == (1, MAXREPEAT):
+            suffix = '+'
+        elif (min_count, max_count) == (0, 1):
+            suffix = '?'
+        elif max_count == MAXREPEAT:
+            suffix = '{%d,}' % min_count
+        elif min_count == max_count:
+            suffix = '{%d}' % min_count
+        else:
+            suffix = '{%d,%d}' % (min_count, max_count)
+        if op is MIN_REPEAT:
+            suffix += '?'
+        elif op is POSSESSIVE_REPEAT:
+            suffix += '+'
+        return inner + suffix
+    if op is GROUPREF:
+        return '\\%d' % arg
+    if op in (ASSERT, ASSERT_NOT):
+        direction, body = arg
+        prefix = ('(?=' if op is ASSERT else '(?!') if direction == 1 else ('(?<=' if op is ASSERT else '(?<!')
+        return prefix + _render_sequence(body) + ')'
+    return ''
+
+def _probe_chars(items: List[Tuple[Any, Any]], probes: Set[str]) -> None:
+    """Collect characters worth testing: every literal and a sample of each class"""
+    for op, arg in items:
+        if op in (LITERAL, NOT_LITERAL):
+            probes.add(chr(arg))
+        elif op is IN:
+            for item_op, item_arg in arg:
+                if item_op is LITERAL:
+                    probes.add(chr(item_arg))
+                elif item_op is RANGE:
+                    probes.add(chr(item_arg[0]))
+                    probes.add(chr(item_arg[1]))
+        elif op is SUBPATTERN:
+            _probe_chars(arg[-1], probes)
+        elif op is ATOMIC_GROUP:
+            _probe_chars(arg, probes)
+        elif op is BRANCH:
+            for branch in arg[1]:
+                _probe_chars(branch, probes)
+        elif op in (MAX_REPEAT, MIN_REPEAT) or (POSSESSIVE_REPEAT is not None and op is POSSESSIVE_REPEAT):
+            _probe_chars(arg[2], probes)
+        elif op in (ASSERT, ASSERT_NOT):
+            _probe_chars(arg[1], probes)
+
+def _flatten(items: List[Tuple[Any, Any]]) -> List[Tuple[Any, Any]]:
+    """Inline plain groups so adjacent quantifiers across groups line up"""
+    flat = []
+    for op, arg in items:
+        if op is SUBPATTERN and not any(o is BRANCH for o, _ in arg[-1]):
+            flat.extend(_flatten(arg[-1]))
+        else:
+            flat.append((op, arg))
+    return flat
+
+class _Analyzer:
+    def __init__(self, probes: List[str]):
+        self.probes = probes
+        self.findings: List[RegexFinding] = []
+        self._seen: Set[str] = set()
+
+    def _report(self, kind: str, complexity: str, fragment: str, probe: str, shape: str = NESTED) -> None:
+        if fragment not in self._seen:
+            self._seen.add(fragment)
+            self.findings.append(RegexFinding(kind, complexity, fragment, probe, shape))
+
+    def _ambiguous_probe(self, body: List[Tuple[Any, Any]]) -> Optional[str]:
+        """A character whose runs the repeated body can split in several ways"""
+        for c in self.probes:
+            lengths = _sequence_lengths(body, c)
+            positive = [length for length in lengths if length > 0]
+            if len(positive) > 1 or any(lengths[length] > 1 for length in positive):
+                return c
+        return None
+
+    def _check_sequence(self, items: List[Tuple[Any, Any]]) -> None:
+        """Find chains of large quantifiers that overlap on one character"""
+        flat = _flatten(items)
+        best: Tuple[int, int, int, str] = (1, -1, -1, '')
+        for c in self.probes:
+            chain_start = -1
+            chain_length = 0
+            for index, (op, arg) in enumerate(flat):
+                lengths = _node_lengths(op, arg, c)
+                if not lengths:
+                    chain_start, chain_length = -1, 0
+                    continue
+                is_quantifier = op in (MAX_REPEAT, MIN_REPEAT) and _is_large(arg[1])
+                if is_quantifier and max(lengths) > 0:
+                    if chain_start < 0:
+                        chain_start = index
+                    chain_length += 1
+                    if chain_length > best[0]:
+                        best = (chain_length, chain_start, index, c)
+        chain_length, start, end, probe = best
+        if chain_length > 1:
+            self._report(POLYNOMIAL, 'O(n^%d)' % chain_length, _render_sequence(flat[start:end + 1]), probe, ADJACENT)
+
+    def visit(self, items: List[Tuple[Any, Any]]) -> None:
+        self._check_sequence(items)
+        for op, arg in items:
+            if op in (MAX_REPEAT, MIN_REPEAT):
+                min_count, max_count, body = arg
+                if _is_large(max_count):
+                    probe = self._ambiguous_probe(body)
+                    if probe is not None:
+                        # A bounded outer count k caps the blow-up at O(n^k)
+                        if max_count == MAXREPEAT:
+                            self._report(EXPONENTIAL, 'O(2^n)', _render(op, arg), probe)
+                        else:
+                            self._report(POLYNOMIAL, 'O(n^%d)' % max_count, _render(op, arg), probe)
+                self.visit(body)
+            elif op is SUBPATTERN:
+                self.visit(arg[-1])
+            elif op is BRANCH:
+                for branch in arg[1]:
+                    self.visit(branch)
+            elif op in (ASSERT, ASSERT_NOT):
+                self.visit(arg[1])
+            # Possessive quantifiers and atomic groups never backtrack
+
+def analyze_pattern(pattern: str) -> List[RegexFinding]:
+    """Return the super-linear constructs in a regex; raises re.error if invalid"""
+    parsed = sre_parse.parse(pattern)
+    items = list(parsed)
+    probes: Set[str] = set(_BASE_PROBES)
+    _probe_chars(items, probes)
+    analyzer = _Analyzer(sorted(probes))
+    analyzer.visit(items)
+    # Report the worst construct first
+    return sorted(analyzer.findings, key=lambda finding: finding.kind != EXPONENTIAL)
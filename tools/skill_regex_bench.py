@@ -0,0 +1,199 @@
+"""
+Empirical latency benchmark for skill validation regexes
+
+Backs `skill-lint.py --bench-regex`. For every prompt `validation` pattern in
+the catalog it full-matches (as `String.matches` does on device) synthetic
+inputs generated from the prompt type at growing lengths, plus near-miss
+strings that fail on the last character and runs of the characters the static
+ReDoS analysis flagged. It reports median/p99 match time per length, the
+growth exponent of the slowest input, and fails when a pattern goes over the
+latency budget.
+"""
+
+import math
+import re
+import statistics
+import time
+from typing import Dict, List, Any, Optional, Tuple
+
+from skill_catalog import find_skill_files, load_skill
+from skill_redos import analyze_pattern
+
+DEFAULT_BUDGET_MS = 1.0
+DEFAULT_MAX_LENGTH = 4096
+
+# Seed text per prompt type; inputs are built by repeating and truncating it
+TYPE_SEEDS = {
+    'name': "Maria Garcia-Lopez O'Neil ",
+    'phone': "(555) 123-4567 ",
+    'ssn': "123-45-6789 ",
+    'address': "1234 Main Street Apt 5, Springfield, FL 32801 ",
+    'email': "maria.garcia-lopez.",
+    'date': "01/15/1990 ",
+    'number': "1234567890",
+    'currency': "$12,345.67 ",
+    'select': "Married Filing Jointly ",
+    'textarea': "I have had a mild headache and some dizziness since last Tuesday, ",
+    'text': "Please fill this field with the value I said earlier ",
+}
+
+# Collect samples until a measurement has this much work in it
+_MIN_SAMPLE_NS = 2_000_000
+_MIN_REPEATS = 5
+_MAX_REPEATS = 200
+
+def _lengths(max_length: int) -> List[int]:
+    lengths = []
+    length = 8
+    while length < max_length:
+        lengths.append(length)
+        length *= 2
+    lengths.append(max_length)
+    return lengths
+
+def _build(seed: str, length: int) -> str:
+    return (seed * (length // len(seed) + 1))[:length]
+
+def synthetic_inputs(field_type: str, pattern: str, length: int) -> Dict[str, str]:
+    """Inputs for one length: typed dictation, its near miss and ReDoS probes"""
+    seed = TYPE_SEEDS.get(field_type, TYPE_SEEDS['text'])
+    if field_type == 'email':
+        value = _build(seed, max(1, length - len('@example.com'))) + '@example.com'
+    else:
+        value = _build(seed, length)
+
+    inputs = {
+        'typed': value,
+        # Failing on the final character forces the engine to exhaust every split
+        'near_miss': value[:-1] + '!',
+    }
+    for finding in analyze_pattern(pattern):
+        inputs[f'run_of_{finding.probe!r}'] = finding.probe * (length - 1) + '!'
+    return inputs
+
+def time_match(compiled: 're.Pattern', text: str) -> Tuple[float, float]:
+    """Median and p99 seconds for one full match"""
+    samples = []
+    total = 0
+    while len(samples) < _MAX_REPEATS and (len(samples) < _MIN_REPEATS or total < _MIN_SAMPLE_NS):
+        start = time.perf_counter_ns()
+        compiled.fullmatch(text)
+        elapsed = time.perf_counter_ns() - start
+        samples.append(elapsed)
+        total += elapsed
+    samples.sort()
+    p99 = samples[min(len(samples) - 1, math.ceil(len(samples) * 0.99) - 1)]
+    return statistics.median(samples) / 1e9, p99 / 1e9
+
+def growth_exponent(curve: List[Dict[str, Any]]) -> Optional[float]:
+    """Log-log slope of p99 time over input length between the curve ends"""
+    points = [(point['length'], point['p99_ms']) for point in curve if point['p99_ms'] > 0]
+    if len(points) < 2:
+        return None
+    (l0, t0), (l1, t1) = points[0], points[-1]
+    if l1 == l0:
+        return None
+    return math.log(t1 / t0) / math.log(l1 / l0)
+
+def bench_pattern(pattern: str, field_type: str, budget_ms: float, max_length: int) -> Dict[str, Any]:
+    """Measure one pattern over growing lengths, stopping once it blows the budget"""
+    compiled = re.compile(pattern)
+    curves: Dict[str, List[Dict[str, Any]]] = {}
+    over_budget = None
+
+    for length in _lengths(max_length):
+        for name, text in synthetic_inputs(field_type, pattern, length).items():
+            curve = curves.setdefault(name, [])
+            if curve and curve[-1].get('stopped'):
+                continue
+            # Extrapolate before running, so exponential patterns cannot hang the bench
+            if len(curve) >= 2:
+                exponent = growth_exponent(curve) or 1.0
+                projected = curve[-1]['p99_ms'] * (length / curve[-1]['length']) ** max(exponent, 1.0)
+                if projected > budget_ms * 50:
+                    curve[-1]['stopped'] = True
+                    over_budget = over_budget or {'input': name, 'length': length, 'projected_ms': round(projected, 3)}
+                    continue
+            median, p99 = time_match(compiled, text)
+            point = {'length': length, 'median_ms': round(median * 1000, 4), 'p99_ms': round(p99 * 1000, 4)}
+            curve.append(point)
+            if point['p99_ms'] > budget_ms:
+                point['stopped'] = True
+                over_budget = over_budget or {'input': name, 'length': length, 'p99_ms': point['p99_ms']}
+
+    worst_name = max(curves, key=lambda name: max(point['p99_ms'] for point in curves[name]))
+    worst = curves[worst_name]
+    exponent = growth_exponent(worst)
+    return {
+        'pattern': pattern,
+        'type': field_type,
+        'worst_input': worst_name,
+        'curve': [{key: point[key] for key in ('length', 'median_ms', 'p99_ms')} for point in worst],
+        'growth_exponent': None if exponent is None else round(exponent, 2),
+        'over_budget': over_budget,
+    }
+
+def bench_catalog(paths: List[str], budget_ms: float = DEFAULT_BUDGET_MS,
+                  max_length: int = DEFAULT_MAX_LENGTH) -> Dict[str, Any]:
+    """Benchmark every validation pattern of every skill under paths"""
+    results = {
+        'budget_ms': budget_ms,
+        'max_length': max_length,
+        'patterns': 0,
+        'over_budget': 0,
+        'skipped_files': [],
+        'details': [],
+    }
+    measured: Dict[Tuple[str, str], Dict[str, Any]] = {}
+
+    for file_path in find_skill_files(paths):
+        try:
+            skill = load_skill(file_path)
+        except Exception as e:
+            results['skipped_files'].append({'file': file_path, 'reason': str(e).splitlines()[0]})
+            continue
+
+        for prompt in skill['prompts']:
+            pattern = prompt['validation']
+            if not isinstance(pattern, str):
+                continue
+            try:
+                re.compile(pattern)
+            except re.error:
+                continue  # reported by the validator itself
+
+            # Catalogs repeat the same pattern and type many times; measure it once
+            key = (pattern, prompt['type'])
+            if key not in measured:
+                measured[key] = bench_pattern(pattern, prompt['type'], budget_ms, max_length)
+            bench = measured[key]
+
+            results['patterns'] += 1
+            if bench['over_budget']:
+                results['over_budget'] += 1
+            results['details'].append(dict(bench, skill=skill['id'], field=prompt['field'], file=file_path))
+
+    return results
+
+def print_report(results: Dict[str, Any]) -> None:
+    print(f"⏱️  Regex latency benchmark (budget {results['budget_ms']} ms per match, "
+          f"inputs up to {results['max_length']} chars)")
+    print(f"━" * 50)
+    for detail in results['details']:
+        status = "❌" if detail['over_budget'] else "✅"
+        exponent = detail['growth_exponent']
+        growth = "n/a" if exponent is None else f"n^{exponent:.2f}"
+        print(f"{status} {detail['skill']}.{detail['field']}  {detail['pattern']}")
+        last = detail['curve'][-1]
+        print(f"   worst input: {detail['worst_input']}, growth {growth}, "
+              f"{last['length']} chars: median {last['median_ms']:.4f} ms, p99 {last['p99_ms']:.4f} ms")
+        if detail['over_budget']:
+            over = detail['over_budget']
+            measured = over.get('p99_ms', over.get('projected_ms'))
+            kind = "measured" if 'p99_ms' in over else "projected"
+            print(f"   ❌ {over['input']} at {over['length']} chars: {measured} ms ({kind}) exceeds budget")
+    for skipped in results['skipped_files']:
+        print(f"⚠️  Skipped {skipped['file']}: {skipped['reason']}")
+    print()
+    print(f"Patterns benchmarked: {results['patterns']}")
+    print(f"❌ Over budget: {results['over_budget']}")
@@ -0,0 +1,351 @@
+"""
+Offline transcript replay with fuzzy voice command matching
+
+Backs `skill-replay.py`. Speech recognition rarely returns a trigger
+verbatim: words are misspelled ("fil"), split ("in take") or padded with
+fillers ("fill the medical intake please"). `SkillEngine.findSkillByCommand`
+only checks `contains` in both directions, so any of those is a miss.
+
+FuzzyTriggerIndex resolves an utterance in three steps:
+
+- exact: the token Aho-Corasick automaton from skill_triggers finds every
+  trigger contained verbatim; the longest one wins
+- candidates: every utterance token, and every pair of adjacent tokens
+  joined, is corrected against the trigger vocabulary with a BK-tree within
+  a small edit distance; triggers are then looked up by the corrected
+  unigrams and bigrams and the ones sharing the most n-grams are kept
+- alignment: each candidate trigger is aligned to the best window of the
+  utterance word by word. A misspelled word costs its edit distance over
+  its length, a missing trigger word costs 1 and an extra word inside the
+  window costs FILLER_COST; two utterance words may merge into one trigger
+  word. The lowest cost per trigger word wins if it is within `threshold`,
+  which lets a three-word trigger lose one word ("medical intake") but not
+  have one replaced ("fill dental form" is not "fill tax form").
+
+replay() runs a corpus of transcripts through the index, and through the
+app's current `contains` matching for comparison, and reports recall,
+false matches, confusion between skills and per-utterance latency.
+"""
+
+import json
+import math
+import re
+import time
+from collections import Counter
+from typing import Dict, List, Any, Iterable, Optional, Tuple
+
+from skill_executor import clean_text
+from skill_triggers import FIELD_ACTIONS, TriggerIndex
+
+DEFAULT_THRESHOLD = 0.34
+DEFAULT_CANDIDATES = 16
+
+# Entries kept in each of the index's word caches before they are cleared
+CACHE_LIMIT = 65536
+
+# Cost of an utterance word inside the matched window that is not in the trigger
+FILLER_COST = 0.25
+
+_WORD = re.compile(r"[^\W_]+(?:'[^\W_]+)*")
+
+def words(text: str) -> List[str]:
+    """Lowercase words without punctuation"""
+    return _WORD.findall(text.lower())
+
+def max_distance(word: str) -> int:
+    """Edit distance tolerated for a word: none up to 2 letters, 2 from 7 letters"""
+    if len(word) <= 3:
+        return 0 if len(word) <= 2 else 1
+    return 1 if len(word) < 7 else 2
+
+def edit_distance(a: str, b: str, bound: int) -> int:
+    """Levenshtein distance, or bound + 1 as soon as it must exceed bound
+
+    Only the diagonal band |i - j| <= bound of the table is computed, since
+    any cell outside it already costs more than bound.
+    """
+    over = bound + 1
+    if abs(len(a) - len(b)) > bound:
+        return over
+    if len(a) > len(b):
+        a, b = b, a
+    previous = [j if j <= bound else over for j in range(len(b) + 1)]
+    for i, char in enumerate(a, 1):
+        current = [over] * (len(b) + 1)
+        current[0] = i if i <= bound else over
+        lowest = current[0]
+        for j in range(max(1, i - bound), min(len(b), i + bound) + 1):
+            value = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (char != b[j - 1]))
+            if value > over:
+                value = over
+            current[j] = value
+            if value < lowest:
+                lowest = value
+        if lowest > bound:
+            return over
+        previous = current
+    return previous[-1]
+
+class BKTree:
+    """Burkhard-Keller tree over words for bounded edit-distance lookups"""
+
+    def __init__(self, items: Iterable[str] = ()):
+        # Per node: word and {distance: child node}
+        self.words: List[str] = []
+        self.children: List[Dict[int, int]] = []
+        for item in items:
+            self.add(item)
+
+    def add(self, word: str) -> None:
+        if not self.words:
+            self.words.append(word)
+            self.children.append({})
+            return
+        node = 0
+        while True:
+            distance = edit_distance(word, self.words[node], len(word) + len(self.words[node]))
+            if distance == 0:
+                return
+            child = self.children[node].get(distance)
+            if child is None:
+                self.children[node][distance] = len(self.words)
+                self.words.append(word)
+                self.children.append({})
+                return
+            node = child
+
+    def search(self, word: str, bound: int) -> List[Tuple[str, int]]:
+        """(word, distance) for every word within bound"""
+        found = []
+        stack = [0] if self.words else []
+        while stack:
+            node = stack.pop()
+            children = self.children[node]
+            # Past the longest edge plus the bound no child can qualify, so the
+            # distance only has to be exact up to there
+            distance = edit_distance(word, self.words[node], bound + max(children, default=0))
+            if distance <= bound:
+                found.append((self.words[node], distance))
+            for edge, child in children.items():
+                if distance - bound <= edge <= distance + bound:
+                    stack.append(child)
+        return found
+
+class FuzzyTriggerIndex:
+    """Exact, n-gram and edit-distance matching of utterances against skill triggers"""
+
+    def __init__(self, skills: Iterable[Dict[str, Any]], threshold: float = DEFAULT_THRESHOLD,
+                 candidates: int = DEFAULT_CANDIDATES):
+        self.threshold = threshold
+        self.candidates = candidates
+        self.triggers: List[Dict[str, Any]] = []
+        self.unigrams: Dict[str, List[int]] = {}
+        self.bigrams: Dict[Tuple[str, str], List[int]] = {}
+        skills = list(skills)
+        self.exact = TriggerIndex.from_skills(skills)
+        for skill in skills:
+            for command in skill['commands']:
+                if command['action'] in FIELD_ACTIONS:
+                    continue
+                trigger_words = words(command['trigger'])
+                if not trigger_words:
+                    continue
+                trigger_id = len(self.triggers)
+                self.triggers.append({'trigger': ' '.join(trigger_words), 'words': trigger_words,
+                                      'skill': command['skill'] or skill['id'], 'language': skill['language']})
+                for word in set(trigger_words):
+                    self.unigrams.setdefault(word, []).append(trigger_id)
+                for bigram in set(zip(trigger_words, trigger_words[1:])):
+                    self.bigrams.setdefault(bigram, []).append(trigger_id)
+        self.vocabulary = BKTree(sorted(self.unigrams))
+        # Corrections and word costs only depend on the vocabulary, and
+        # transcripts keep repeating the same words
+        self._corrections: Dict[str, frozenset] = {}
+        self._costs: Dict[Tuple[str, str], float] = {}
+
+    def corrections(self, word: str) -> frozenset:
+        """Vocabulary words within max_distance of a heard word"""
+        found = self._corrections.get(word)
+        if found is None:
+            if len(self._corrections) >= CACHE_LIMIT:
+                self._corrections.clear()
+            found = self._corrections[word] = frozenset(
+                match for match, _ in self.vocabulary.search(word, max_distance(word)))
+        return found
+
+    def _candidates(self, tokens: List[str]) -> List[int]:
+        """Triggers sharing the most corrected unigrams and bigrams with the utterance"""
+        options = [self.corrections(token) for token in tokens]
+        # Adjacent tokens joined ("in take" -> "intake") correct to one vocabulary word
+        merged = [self.corrections(a + b) for a, b in zip(tokens, tokens[1:])]
+        scores: Counter = Counter()
+        for position, choices in enumerate(options):
+            for word in choices | (merged[position] if position < len(merged) else set()):
+                scores.update(self.unigrams.get(word, ()))
+            if position + 1 < len(options):
+                for first in choices:
+                    for second in options[position + 1]:
+                        for trigger_id in self.bigrams.get((first, second), ()):
+                            scores[trigger_id] += 2
+        return [trigger_id for trigger_id, _ in scores.most_common(self.candidates)]
+
+    def _cost(self, heard: str, word: str) -> float:
+        """Edit distance over the trigger word's length; beyond its tolerance the
+        word can only be aligned as missing plus a filler"""
+        cost = self._costs.get((heard, word))
+        if cost is None:
+            if len(self._costs) >= CACHE_LIMIT:
+                self._costs.clear()
+            bound = max_distance(word)
+            distance = edit_distance(heard, word, bound)
+            cost = self._costs[(heard, word)] = distance / len(word) if distance <= bound else math.inf
+        return cost
+
+    def _align(self, trigger_words: List[str], tokens: List[str]) -> float:
+        """Lowest cost of the trigger against any window of the utterance"""
+        n = len(tokens)
+        infinity = float('inf')
+        previous = [0.0] * (n + 1)  # the window may start anywhere
+        for i, word in enumerate(trigger_words, 1):
+            current = [previous[0] + 1] + [infinity] * n
+            for j in range(1, n + 1):
+                best = min(previous[j] + 1,  # trigger word not heard
+                           previous[j - 1] + self._cost(tokens[j - 1], word),
+                           current[j - 1] + FILLER_COST)  # extra word inside the window
+                if j >= 2:
+                    best = min(best, previous[j - 2] + self._cost(tokens[j - 2] + tokens[j - 1], word))
+                current[j] = best
+            previous = current
+        return min(previous) / len(trigger_words)
+
+    def match(self, utterance: str) -> Optional[Dict[str, Any]]:
+        """Best trigger for the utterance with its method and score, or None"""
+        exact = self.exact.match(utterance)
+        if exact:
+            best = exact[0]
+            return {'skill': best['skill'], 'trigger': best['trigger'], 'method': 'exact', 'score': 0.0}
+
+        tokens = words(utterance)
+        if not tokens:
+            return None
+        best = None
+        for trigger_id in self._candidates(tokens):
+            trigger = self.triggers[trigger_id]
+            score = self._align(trigger['words'], tokens)
+            key = (score, -len(trigger['words']))
+            if score <= self.threshold and (best is None or key < best[0]):
+                best = (key, trigger)
+        if best is None:
+            return None
+        (score, _), trigger = best
+        return {'skill': trigger['skill'], 'trigger': trigger['trigger'], 'method': 'fuzzy', 'score': round(score, 3)}
+
+class ContainsMatcher:
+    """The app's findSkillByCommand: first skill with a trigger contained in the utterance or containing it"""
+
+    def __init__(self, skills: Iterable[Dict[str, Any]]):
+        self.skills = [
+            (skill['id'], [command['trigger'].lower() for command in skill['commands']
+                           if command['action'] not in FIELD_ACTIONS])
+            for skill in skills
+        ]
+
+    def match(self, utterance: str) -> Optional[Dict[str, Any]]:
+        command = clean_text(utterance).lower()
+        for skill_id, triggers in self.skills:
+            for trigger in triggers:
+                if trigger in command or command in trigger:
+                    return {'skill': skill_id, 'trigger': trigger, 'method': 'contains', 'score': 0.0}
+        return None
+
+def load_corpus(path: str) -> List[Dict[str, Any]]:
+    """Transcripts from JSONL: {"text": ..., "expected": skill id or null}, optional "id" """
+    corpus = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError as e:
+                raise ValueError(f"{path}:{number}: {e}")
+            text = record.get('text', record.get('transcript')) if isinstance(record, dict) else None
+            if not isinstance(text, str):
+                raise ValueError(f"{path}:{number}: record has no 'text'")
+            corpus.append({'id': record.get('id', number), 'text': text,
+                           'expected': record.get('expected', record.get('skill'))})
+    return corpus
+
+def percentile(sorted_values: List[float], share: float) -> float:
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(len(sorted_values) * share))
+    return sorted_values[rank - 1]
+
+def replay(matcher, corpus: List[Dict[str, Any]], repeat: int = 1) -> Dict[str, Any]:
+    """Match every transcript; accuracy counts, confusion and latency in microseconds
+
+    With repeat > 1 each transcript is matched that many times and its
+    fastest run is kept, which takes scheduler noise out of the percentiles.
+    """
+    latencies = []
+    outcomes = []
+    started = time.perf_counter()
+    for record in corpus:
+        samples = []
+        for _ in range(repeat):
+            start = time.perf_counter_ns()
+            found = matcher.match(record['text'])
+            samples.append(time.perf_counter_ns() - start)
+        latencies.append(min(samples) / 1000)
+        outcomes.append((record, found))
+    elapsed = time.perf_counter() - started
+
+    counts = Counter()
+    confusion: Dict[str, Counter] = {}
+    methods = Counter()
+    misses = []
+    for record, found in outcomes:
+        expected = record['expected']
+        predicted = found['skill'] if found else None
+        if found:
+            methods[found['method']] += 1
+        if expected is None:
+            counts['negatives'] += 1
+            if predicted is not None:
+                counts['false_matches'] += 1
+        else:
+            counts['positives'] += 1
+            counts['correct' if predicted == expected else 'wrong' if predicted else 'missed'] += 1
+        confusion.setdefault(str(expected), Counter())[str(predicted)] += 1
+        if predicted != expected:
+            misses.append({'id': record['id'], 'text': record['text'], 'expected': expected,
+                           'predicted': predicted, 'trigger': found['trigger'] if found else None,
+                           'score': found['score'] if found else None})
+
+    ordered = sorted(latencies)
+    positives = counts['positives']
+    matched = counts['correct'] + counts['wrong'] + counts['false_matches']
+    return {
+        'utterances': len(corpus),
+        'positives': positives,
+        'negatives': counts['negatives'],
+        'correct': counts['correct'],
+        'wrong_skill': counts['wrong'],
+        'missed': counts['missed'],
+        'false_matches': counts['false_matches'],
+        'recall': round(counts['correct'] / positives, 4) if positives else None,
+        'precision': round(counts['correct'] / matched, 4) if matched else None,
+        'methods': dict(methods),
+        'latency_us': {
+            'p50': round(percentile(ordered, 0.50), 1),
+            'p90': round(percentile(ordered, 0.90), 1),
+            'p99': round(percentile(ordered, 0.99), 1),
+            'max': round(ordered[-1], 1) if ordered else 0.0,
+            'mean': round(sum(ordered) / len(ordered), 1) if ordered else 0.0,
+        },
+        'throughput_per_s': round(len(corpus) * repeat / elapsed, 1) if elapsed else None,
+        'confusion': {expected: dict(predicted) for expected, predicted in sorted(confusion.items())},
+        'misses': misses,
+    }
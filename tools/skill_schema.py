@@ -0,0 +1,625 @@
+"""
+Declarative schemas for VoiceBridge skill templates
+
+Both template formats are described as data: which keys a mapping requires or
+allows and with which type, which keys hold nested lists or dicts of
+mappings, and the value rules attached to keys (allowed values, patterns,
+length limits, uniqueness, references to other fields and regex safety).
+`compile_schema` turns a schema into a `CompiledSchema` once, generating a
+straight-line check function per mapping; validating a document is then a
+single traversal that collects every message.
+
+Messages are tagged with a phase and reported phase by phase. That keeps them
+in the order the hand-written SkillValidator checks always produced, even
+though every node is only visited once.
+"""
+
+import functools
+import re
+from collections import defaultdict
+from collections.abc import Hashable
+from typing import Callable, Dict, List, Any, Iterable, Optional, Tuple
+
+from skill_catalog import is_asset_schema
+from skill_redos import analyze_pattern
+
+# Message phases, in reporting order
+STRUCTURE, SEMANTIC, UNIQUE, REFERENCES, LENGTHS, PATTERNS = range(6)
+PHASES = 6
+
+ERROR = 'error'
+WARNING = 'warning'
+
+class Item:
+    """Validation state of one list or dict entry (a prompt, a field mapping, ...)"""
+
+    __slots__ = ('index', 'key', 'owner', 'parent')
+
+    def __init__(self, index: Optional[int], key: Optional[str], owner: Any, parent: Optional['Item']):
+        self.index = index
+        self.key = key
+        # Value of the entry's owner key, e.g. the prompt's field name
+        self.owner = owner
+        self.parent = parent
+
+ROOT = Item(None, None, None, None)
+
+# Value types len() is defined for among YAML scalars and collections
+_SIZED = (str, bytes, list, dict, set)
+_UNHASHABLE = (list, dict, set)
+
+class _Run:
+    """Messages and symbol tables of one validation"""
+
+    __slots__ = ('strict', 'errors', 'warnings', 'symbols', 'pending')
+
+    def __init__(self, strict: bool):
+        self.strict = strict
+        self.errors: List[List[str]] = [[] for _ in range(PHASES)]
+        self.warnings: List[List[str]] = [[] for _ in range(PHASES)]
+        self.symbols: Dict[str, set] = defaultdict(set)
+        self.pending: List[Tuple['RefersTo', Any, str, Item]] = []
+
+    def emit(self, phase: int, severity: str, message: str) -> None:
+        (self.errors if severity == ERROR else self.warnings)[phase].append(message)
+
+class Rule:
+    """A check on the value of one key"""
+
+    phase = SEMANTIC
+
+    def __init__(self, message: str, severity: str = ERROR, phase: Optional[int] = None):
+        self.message = message
+        self.severity = severity
+        if phase is not None:
+            self.phase = phase
+
+    def report(self, run: _Run, value: Any, key: str, item: Item, **extra) -> None:
+        run.emit(self.phase, self.severity, self.message.format(value=value, key=key, item=item, **extra))
+
+    def apply(self, run: _Run, value: Any, key: str, item: Item) -> None:
+        raise NotImplementedError
+
+    def inline(self, value: str, name: str) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """Failure condition as source over variable `value`, plus the names it uses
+
+        Rules that fit in one expression return one so the compiled check
+        evaluates them without a call; the rest return None and are called
+        through apply.
+        """
+        return None
+
+    def skip(self, value: str, name: str) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """Source for a cheap condition under which apply has nothing to report, plus the names it uses"""
+        return None
+
+class OneOf(Rule):
+    def __init__(self, values: Iterable[Any], message: str, severity: str = ERROR, phase: Optional[int] = None):
+        super().__init__(message, severity, phase)
+        self.values = values
+
+    def apply(self, run, value, key, item):
+        try:
+            if value in self.values:
+                return
+        except TypeError:
+            return  # unhashable, already reported as a type error
+        self.report(run, value, key, item)
+
+    def inline(self, value, name):
+        return (f"type({value}) not in UNHASHABLE and {value} not in {name}_values",
+                {f'{name}_values': self.values})
+
+class Matches(Rule):
+    def __init__(self, pattern: str, message: str, severity: str = ERROR, phase: Optional[int] = None):
+        super().__init__(message, severity, phase)
+        self.pattern = re.compile(pattern)
+
+    def apply(self, run, value, key, item):
+        if isinstance(value, str) and not self.pattern.match(value):
+            self.report(run, value, key, item)
+
+    def inline(self, value, name):
+        return f"isinstance({value}, str) and not {name}_match({value})", {f'{name}_match': self.pattern.match}
+
+class MaxLength(Rule):
+    phase = LENGTHS
+
+    def __init__(self, limit: int, message: str, severity: str = WARNING, phase: Optional[int] = None):
+        super().__init__(message, severity, phase)
+        self.limit = limit
+
+    def apply(self, run, value, key, item):
+        if isinstance(value, _SIZED) and len(value) > self.limit:
+            self.report(run, value, key, item)
+
+    def inline(self, value, name):
+        return f"isinstance({value}, SIZED) and len({value}) > {self.limit!r}", {}
+
+class NotEmpty(Rule):
+    phase = STRUCTURE
+
+    def apply(self, run, value, key, item):
+        if isinstance(value, _SIZED) and len(value) == 0:
+            self.report(run, value, key, item)
+
+    def inline(self, value, name):
+        return f"isinstance({value}, SIZED) and len({value}) == 0", {}
+
+class Unique(Rule):
+    """Defines a symbol (e.g. a field name) and reports repeats"""
+
+    phase = UNIQUE
+
+    def __init__(self, symbol: str, message: str, severity: str = ERROR, phase: Optional[int] = None):
+        super().__init__(message, severity, phase)
+        self.symbol = symbol
+
+    def apply(self, run, value, key, item):
+        seen = run.symbols[self.symbol]
+        try:
+            if value in seen:
+                self.report(run, value, key, item)
+            seen.add(value)
+        except TypeError:
+            pass
+
+    def inline(self, value, name):
+        # Records the value as a side effect: add() returns None, so only a repeat fails
+        seen = f"symbols[{self.symbol!r}]"
+        return f"type({value}) not in UNHASHABLE and ({value} in {seen} or {seen}.add({value}))", {}
+
+class RefersTo(Rule):
+    """Value must name a symbol defined anywhere in the document; resolved after the traversal"""
+
+    phase = REFERENCES
+
+    def __init__(self, symbol: str, message: str, severity: str = ERROR,
+                 extract: Optional[Callable[[Any], Iterable[Any]]] = None):
+        super().__init__(message, severity)
+        self.symbol = symbol
+        self.extract = extract
+
+    def apply(self, run, value, key, item):
+        for name in (self.extract(value) if self.extract else (value,)):
+            if isinstance(name, Hashable):
+                run.pending.append((self, name, key, item))
+
+    def resolve(self, run: _Run, name: Any, key: str, item: Item) -> None:
+        if name not in run.symbols.get(self.symbol, ()):
+            self.report(run, name, key, item)
+
+class SafeRegex(Rule):
+    """Regex must compile and must not risk catastrophic backtracking
+
+    The app full-matches every spoken or OCR'd value against these patterns,
+    so super-linear backtracking can stall the UI thread. Backtracking risks
+    are warnings, or errors in strict mode.
+    """
+
+    phase = PATTERNS
+
+    def __init__(self, invalid: str, risky: str):
+        super().__init__(invalid)
+        self.risky = risky
+
+    def apply(self, run, value, key, item):
+        if not isinstance(value, str):
+            return
+        error, findings = _regex_report(value)
+        if error is not None:
+            self.report(run, value, key, item, error=error)
+            return
+        if not findings and len(_SAFE_PATTERNS) < _SAFE_PATTERNS_LIMIT:
+            _SAFE_PATTERNS.add(value)
+        for finding in findings:
+            run.emit(self.phase, ERROR if run.strict else WARNING,
+                     self.risky.format(value=value, key=key, item=item, finding=finding))
+
+    def skip(self, value, name):
+        return f"type({value}) is not str or {value} in SAFE_PATTERNS", {}
+
+# Patterns that compiled with no backtracking findings; compiled checks skip them without a call
+_SAFE_PATTERNS = set()
+_SAFE_PATTERNS_LIMIT = 4096
+
+@functools.lru_cache(maxsize=4096)
+def _regex_report(pattern: str) -> Tuple[Optional[str], Tuple[str, ...]]:
+    """Compile error or backtracking findings of a pattern
+
+    The ReDoS analysis is most of the cost of validating a template and
+    catalogs repeat the same patterns (phone, ZIP, SSN) across skills, so
+    each pattern is analyzed once per process.
+    """
+    try:
+        re.compile(pattern)
+    except re.error as e:
+        return str(e), ()
+    return None, tuple(finding.describe() for finding in analyze_pattern(pattern))
+
+class Each(Rule):
+    """Apply a rule to every element of a list value"""
+
+    def __init__(self, rule: Rule):
+        super().__init__(rule.message, rule.severity, rule.phase)
+        self.rule = rule
+
+    def apply(self, run, value, key, item):
+        if isinstance(value, list):
+            for element in value:
+                self.rule.apply(run, element, key, item)
+
+class Mapping:
+    """Keys of a mapping: required and optional types, value rules and nested containers"""
+
+    def __init__(self, required: Optional[Dict[str, type]] = None, optional: Optional[Dict[str, type]] = None,
+                 rules: Optional[Dict[str, List[Rule]]] = None, children: Optional[Dict[str, Any]] = None,
+                 missing: str = "Missing required field: {key}",
+                 wrong_type: str = "Field '{key}' must be of type {type}",
+                 owner: Optional[str] = None):
+        self.required = required or {}
+        self.optional = optional or {}
+        self.rules = rules or {}
+        self.children = children or {}
+        self.missing = missing
+        self.wrong_type = wrong_type
+        self.owner = owner
+
+class ListOf:
+    """A list whose entries must be mappings (or nested containers)"""
+
+    def __init__(self, item: Any, not_mapping: str):
+        self.item = item
+        self.not_mapping = not_mapping
+
+class DictOf:
+    """A dict of named entries; key_rules check the entry names"""
+
+    def __init__(self, item: Any, not_mapping: str, key_rules: Optional[List[Rule]] = None):
+        self.item = item
+        self.not_mapping = not_mapping
+        self.key_rules = key_rules or []
+
+_MISSING = object()
+
+class _CompiledMapping:
+    """A mapping spec turned into one generated check function
+
+    The function reads each declared key once and runs, in declaration
+    order, the required checks, the type checks and the value rules, so
+    there is no per-key interpretation left at validation time.
+    """
+
+    __slots__ = ('check', 'children', 'owner')
+
+    def __init__(self, spec: Mapping):
+        namespace = {'MISSING': _MISSING, 'STRUCTURE': STRUCTURE, 'ERROR': ERROR,
+                     'SIZED': _SIZED, 'UNHASHABLE': _UNHASHABLE, 'SAFE_PATTERNS': _SAFE_PATTERNS}
+        keys = list(dict.fromkeys(list(spec.required) + list(spec.optional) + list(spec.rules)))
+        slot = {key: f'v{i}' for i, key in enumerate(keys)}
+        lines = ['def check(run, data, item):', '    emit = run.emit', '    symbols = run.symbols']
+        for key in keys:
+            # A containment test is cheaper than a call to get, and most keys are absent
+            lines.append(f'    {slot[key]} = data[{key!r}] if {key!r} in data else MISSING')
+
+        for kind, types in (('required', spec.required), ('optional', spec.optional)):
+            for key, expected in types.items():
+                value = slot[key]
+                namespace[f't_{value}'] = expected
+                wrong = (f'emit(STRUCTURE, ERROR, {spec.wrong_type!r}.format(key={key!r}, item=item, '
+                         f'type={expected.__name__!r}))')
+                if kind == 'required':
+                    lines.append(f'    if {value} is MISSING:')
+                    lines.append(f'        emit(STRUCTURE, ERROR, {spec.missing!r}.format(key={key!r}, item=item))')
+                    lines.append(f'    elif not isinstance({value}, t_{value}):')
+                else:
+                    lines.append(f'    if {value} is not MISSING and not isinstance({value}, t_{value}):')
+                lines.append(f'        {wrong}')
+
+        rule_number = 0
+        for key, rules in spec.rules.items():
+            for rule in rules:
+                name = f'r{rule_number}'
+                value = slot[key]
+                inlined = rule.inline(value, name)
+                skipped = rule.skip(value, name) if inlined is None else None
+                if skipped is not None:
+                    condition, names = skipped
+                    namespace.update(names)
+                    namespace[name] = rule.apply
+                    lines.append(f'    if {value} is not MISSING and not ({condition}):')
+                    lines.append(f'        {name}(run, {value}, {key!r}, item)')
+                elif inlined is None:
+                    namespace[name] = rule.apply
+                    lines.append(f'    if {value} is not MISSING:')
+                    lines.append(f'        {name}(run, {value}, {key!r}, item)')
+                else:
+                    condition, names = inlined
+                    namespace.update(names)
+                    namespace[name] = rule.report
+                    lines.append(f'    if {value} is not MISSING and {condition}:')
+                    lines.append(f'        {name}(run, {value}, {key!r}, item)')
+                rule_number += 1
+
+        exec(compile('\n'.join(lines), f'<skill schema {id(spec):x}>', 'exec'), namespace)
+        self.check = namespace['check']
+        self.children = tuple((key, _compile(child)) for key, child in spec.children.items())
+        self.owner = spec.owner
+
+class _CompiledContainer:
+    __slots__ = ('is_list', 'item', 'not_mapping', 'key_rules', 'flat')
+
+    def __init__(self, spec):
+        self.is_list = isinstance(spec, ListOf)
+        self.item = _compile(spec.item)
+        self.not_mapping = spec.not_mapping
+        self.key_rules = tuple(getattr(spec, 'key_rules', ()))
+        # A list of mappings without nested containers, like prompts
+        self.flat = self.is_list and isinstance(self.item, _CompiledMapping) and not self.item.children
+
+def _compile(spec):
+    return _CompiledMapping(spec) if isinstance(spec, Mapping) else _CompiledContainer(spec)
+
+class CompiledSchema:
+    """A schema compiled into generated per-mapping check functions"""
+
+    def __init__(self, spec: Mapping):
+        self.root = _compile(spec)
+
+    def validate(self, data: Dict[str, Any], strict: bool = False) -> Tuple[List[str], List[str]]:
+        run = _Run(strict)
+        self._mapping(run, self.root, data, ROOT)
+        for rule, name, key, item in run.pending:
+            rule.resolve(run, name, key, item)
+        return ([message for phase in run.errors for message in phase],
+                [message for phase in run.warnings for message in phase])
+
+    def _mapping(self, run: _Run, node: _CompiledMapping, data: Dict[str, Any], item: Item) -> None:
+        node.check(run, data, item)
+        for key, child in node.children:
+            value = data.get(key, _MISSING)
+            if value is not _MISSING:
+                self._value(run, child, value, item)
+
+    def _value(self, run: _Run, node, value: Any, parent: Item) -> None:
+        if isinstance(node, _CompiledMapping):
+            if isinstance(value, dict):
+                self._mapping(run, node, value, parent)
+            return
+        if node.is_list:
+            if not isinstance(value, list):
+                return
+            if node.flat:
+                self._flat_list(run, node, value, parent)
+                return
+            entries = enumerate(value)
+        else:
+            if not isinstance(value, dict):
+                return
+            entries = ((None, key) for key in value)
+
+        child = node.item
+        is_mapping = isinstance(child, _CompiledMapping)
+        owner_key = child.owner if is_mapping else None
+        expected = dict if is_mapping or not child.is_list else list
+        key_rules = node.key_rules
+        for index, key in entries:
+            if index is None:
+                entry = value[key]
+            else:
+                entry, key = key, None
+            owner = entry.get(owner_key) if owner_key and isinstance(entry, dict) else None
+            item = Item(index, key, owner, parent)
+            for rule in key_rules:
+                rule.apply(run, key, key, item)
+            if not isinstance(entry, expected):
+                run.emit(STRUCTURE, ERROR, node.not_mapping.format(item=item))
+            elif is_mapping:
+                self._mapping(run, child, entry, item)
+            else:
+                self._value(run, child, entry, item)
+
+    def _flat_list(self, run: _Run, node: _CompiledContainer, value: List[Any], parent: Item) -> None:
+        """_value for the lists that make up most of a template (prompts), in one tight loop"""
+        check = node.item.check
+        owner_key = node.item.owner
+        for index, entry in enumerate(value):
+            if isinstance(entry, dict):
+                check(run, entry, Item(index, None, entry.get(owner_key) if owner_key else None, parent))
+            else:
+                run.emit(STRUCTURE, ERROR, node.not_mapping.format(item=Item(index, None, None, parent)))
+
+def compile_schema(spec: Mapping) -> CompiledSchema:
+    return CompiledSchema(spec)
+
+SUPPORTED_LANGUAGES = {
+    'en', 'es', 'pt', 'fr', 'de', 'it', 'zh', 'ja', 'ko', 'ru', 'ar', 'hi'
+}
+
+VALID_FIELD_TYPES = {
+    'name', 'email', 'phone', 'address', 'date', 'ssn',
+    'text', 'number', 'currency', 'select', 'textarea'
+}
+
+_LANGUAGE = OneOf(SUPPORTED_LANGUAGES, f"Language '{{value}}' may not be fully supported. Supported: {', '.join(SUPPORTED_LANGUAGES)}", WARNING)
+_VERSION = Matches(r'^\d+\.\d+(\.\d+)?$', "Version should follow semantic versioning (e.g., '1.0.0')", WARNING)
+_NAME_LENGTH = MaxLength(50, "Name is very long (>50 chars) - may cause UI issues")
+_DESCRIPTION_LENGTH = MaxLength(200, "Description is very long (>200 chars) - may cause UI issues")
+
+# Form templates (skills/forms/*.yaml)
+
+FORM_REQUIRED = {
+    'id': str,
+    'language': str,
+    'name': str,
+    'description': str,
+    'version': str,
+    'prompts': list
+}
+
+FORM_OPTIONAL = {
+    'category': str,
+    'postprocess': list,
+    'accessibility': dict,
+    'commands': list,
+    'variant_of': str
+}
+
+PROMPT_REQUIRED = {
+    'field': str,
+    'ask': str,
+    'type': str
+}
+
+PROMPT_OPTIONAL = {
+    'hint': str,
+    'required': bool,
+    'validation': str,
+    'format': str,
+    'options': list,
+    'min': int,
+    'max': int,
+    'default': str,
+    'depends_on': str,
+    'show_when': str
+}
+
+PROMPT_SCHEMA = Mapping(
+    required=PROMPT_REQUIRED,
+    optional=PROMPT_OPTIONAL,
+    missing="Prompt {item.index} missing required field: {key}",
+    wrong_type="Prompt {item.index} field '{key}' must be of type {type}",
+    owner='field',
+    rules={
+        'type': [OneOf(VALID_FIELD_TYPES, f"Prompt {{item.index}} has invalid type '{{value}}'. Valid types: {', '.join(VALID_FIELD_TYPES)}", phase=STRUCTURE)],
+        'field': [Unique('fields', "Duplicate field name: {value}")],
+        'depends_on': [RefersTo('fields', "Field '{item.owner}' depends on non-existent field '{value}'")],
+        'ask': [MaxLength(100, "Prompt {item.index} question is very long (>100 chars) - may cause UI issues")],
+        'hint': [MaxLength(150, "Prompt {item.index} hint is very long (>150 chars) - may cause UI issues")],
+        'validation': [SafeRegex("Prompt {item.index} has invalid regex pattern: {error}",
+                                 "Prompt {item.index} validation regex {finding}")],
+    },
+)
+
+FORM_SCHEMA = Mapping(
+    required=FORM_REQUIRED,
+    optional=FORM_OPTIONAL,
+    rules={
+        'language': [_LANGUAGE],
+        'id': [Matches(r'^[a-z][a-z0-9_]*$', "ID must start with lowercase letter and contain only lowercase letters, numbers, and underscores")],
+        'version': [_VERSION],
+        'name': [_NAME_LENGTH],
+        'description': [_DESCRIPTION_LENGTH],
+        'variant_of': [Matches(r'^[a-z][a-z0-9_]*$', "variant_of must name a skill id (lowercase letters, numbers and underscores)")],
+    },
+    children={
+        'prompts': ListOf(PROMPT_SCHEMA, "Prompt {item.index} must be a dictionary"),
+    },
+)
+
+# Asset templates (android/app/src/main/assets/skills/*_skill.yaml)
+
+_PLACEHOLDER = re.compile(r'\{(\w+)\}')
+
+def _placeholders(value: Any) -> List[str]:
+    return _PLACEHOLDER.findall(value) if isinstance(value, str) else []
+
+_FIELD_PATH = "{item.parent.key}.{item.key}"
+
+FIELD_MAPPING_SCHEMA = Mapping(
+    optional={
+        'aliases': list,
+        'patterns': list,
+        'validation': str,
+        'format': str,
+        'required': bool,
+        'options': list,
+        'multiline': bool,
+        'sensitive': bool,
+        'default': str,
+        'auto_fill': str,
+    },
+    wrong_type=f"Field mapping '{_FIELD_PATH}' key '{{key}}' must be of type {{type}}",
+    rules={
+        'validation': [SafeRegex(f"Field mapping '{_FIELD_PATH}' has invalid regex pattern: {{error}}",
+                                 f"Field mapping '{_FIELD_PATH}' validation regex {{finding}}")],
+    },
+)
+
+VOICE_PATTERN_SCHEMA = Mapping(
+    required={'pattern': str},
+    optional={'fields': list},
+    missing="Voice command {item.index} missing required field: {key}",
+    wrong_type="Voice command {item.index} field '{key}' must be of type {type}",
+    rules={
+        'pattern': [RefersTo('fields', "Voice command {item.index} pattern uses unknown placeholder '{{{value}}}'",
+                             extract=_placeholders)],
+    },
+    children={
+        'fields': ListOf(Mapping(
+            required={'field': str},
+            optional={'value': str},
+            missing="Voice command {item.parent.index} field {item.index} missing required field: {key}",
+            wrong_type="Voice command {item.parent.index} field {item.index} key '{key}' must be of type {type}",
+            rules={'field': [RefersTo('fields', "Voice command {item.parent.index} sets unknown field '{value}'")]},
+        ), "Voice command {item.parent.index} field {item.index} must be a dictionary"),
+    },
+)
+
+ASSET_SCHEMA = Mapping(
+    required={
+        'name': str,
+        'version': str,
+        'description': str,
+        'field_mappings': dict,
+    },
+    optional={
+        'category': str,
+        'languages': list,
+        'metadata': dict,
+        'voice_commands': dict,
+        'validation': dict,
+        'error_handling': dict,
+        'i18n': dict,
+        'security': dict,
+    },
+    rules={
+        'languages': [Each(_LANGUAGE)],
+        'version': [_VERSION],
+        'name': [_NAME_LENGTH],
+        'description': [_DESCRIPTION_LENGTH],
+        'field_mappings': [NotEmpty("Asset template defines no field_mappings")],
+    },
+    children={
+        'field_mappings': DictOf(
+            DictOf(FIELD_MAPPING_SCHEMA, f"Field mapping '{_FIELD_PATH}' must be a dictionary",
+                   key_rules=[Unique('fields', "Duplicate field name: {value}")]),
+            "Field group '{item.key}' must be a dictionary"),
+        'voice_commands': Mapping(
+            optional={'patterns': list, 'navigation_commands': list},
+            wrong_type="Field 'voice_commands.{key}' must be of type {type}",
+            children={'patterns': ListOf(VOICE_PATTERN_SCHEMA, "Voice command {item.index} must be a dictionary")},
+        ),
+        'validation': Mapping(
+            optional={'pre_submit_checks': list},
+            wrong_type="Field 'validation.{key}' must be of type {type}",
+            children={'pre_submit_checks': ListOf(Mapping(
+                optional={'check': str, 'message': str, 'fields': list},
+                wrong_type="Pre-submit check {item.index} field '{key}' must be of type {type}",
+                rules={'fields': [Each(RefersTo('fields', "Pre-submit check {item.index} refers to unknown field '{value}'"))]},
+            ), "Pre-submit check {item.index} must be a dictionary")},
+        ),
+        'security': Mapping(
+            optional={'sensitive_fields': list},
+            wrong_type="Field 'security.{key}' must be of type {type}",
+            rules={'sensitive_fields': [Each(RefersTo('fields', "Sensitive field '{value}' is not defined in field_mappings", WARNING))]},
+        ),
+    },
+)
+
+FORM_VALIDATOR = compile_schema(FORM_SCHEMA)
+ASSET_VALIDATOR = compile_schema(ASSET_SCHEMA)
+
+def validator_for(data: Dict[str, Any]) -> CompiledSchema:
+    """Compiled schema matching the template format of a document"""
+    return ASSET_VALIDATOR if is_asset_schema(data) else FORM_VALIDATOR
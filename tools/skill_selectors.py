@@ -0,0 +1,331 @@
+"""
+Form selector evaluation against saved HTML fixtures
+
+Skills describe the form they fill with CSS-ish selectors in
+`accessibility.form_selectors`, for example
+`input[name*='firstName'], input[id*='first']`. This module parses a
+directory of saved HTML forms once into an element index (by tag, by
+attribute value and by attribute value trigrams) and evaluates every selector
+through that index, so the cost of a selector depends on the elements it can
+match rather than on the size of the corpus.
+
+Supported selector syntax: comma-separated compound selectors made of an
+optional tag, `#id`, `.class` and `[attr]`, `[attr=v]`, `[attr*=v]`,
+`[attr^=v]`, `[attr$=v]`, `[attr~=v]`. Combinators are not supported; the
+app matches single nodes.
+"""
+
+import math
+import re
+import time
+from html.parser import HTMLParser
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Set, Tuple
+
+FIXTURE_EXTENSIONS = ('.html', '.htm')
+
+SUBMIT_FIELD = 'submit_button'
+
+# Share of a skill's fields a fixture must hit to count as that skill's form
+DEFAULT_MIN_COVERAGE = 0.5
+
+Condition = Tuple[str, str, str]
+
+class SelectorError(ValueError):
+    """Selector uses syntax the evaluator (and the app) does not support"""
+
+_COMPOUND = re.compile(r'''
+    \s*(?P<tag>[a-zA-Z][\w-]*|\*)?
+    (?P<parts>(?:\#[\w-]+|\.[\w-]+|\[\s*[\w-]+\s*(?:[*^$~|]?=\s*(?:'[^']*'|"[^"]*"|[^\]\s]+)\s*)?\])*)
+    \s*$
+''', re.VERBOSE)
+
+_PART = re.compile(r'''
+    \#(?P<id>[\w-]+)
+    | \.(?P<cls>[\w-]+)
+    | \[\s*(?P<attr>[\w-]+)\s*(?:(?P<op>[*^$~|]?=)\s*(?P<value>'[^']*'|"[^"]*"|[^\]\s]+)\s*)?\]
+''', re.VERBOSE)
+
+def split_selector_list(selector: str) -> List[str]:
+    """Split on top-level commas, leaving commas inside quotes alone"""
+    parts = []
+    current = []
+    quote = None
+    for char in selector:
+        if quote:
+            if char == quote:
+                quote = None
+        elif char in '\'"':
+            quote = char
+        elif char == ',':
+            parts.append(''.join(current).strip())
+            current = []
+            continue
+        current.append(char)
+    parts.append(''.join(current).strip())
+    return [part for part in parts if part]
+
+def parse_compound(selector: str) -> Tuple[Optional[str], List[Condition]]:
+    """Parse one compound selector into (tag or None, [(attr, op, value)])"""
+    match = _COMPOUND.match(selector)
+    if not match or not (match.group('tag') or match.group('parts')):
+        raise SelectorError(f"Unsupported selector '{selector}'")
+    tag = match.group('tag')
+    conditions = []
+    for part in _PART.finditer(match.group('parts')):
+        if part.group('id') is not None:
+            conditions.append(('id', '=', part.group('id')))
+        elif part.group('cls') is not None:
+            conditions.append(('class', '~=', part.group('cls')))
+        else:
+            value = part.group('value')
+            if value is not None and value[:1] in '\'"':
+                value = value[1:-1]
+            conditions.append((part.group('attr').lower(), part.group('op') or '', value or ''))
+    return (tag.lower() if tag and tag != '*' else None), conditions
+
+def parse_selector(selector: str) -> List[Tuple[Optional[str], List[Condition]]]:
+    compounds = [parse_compound(part) for part in split_selector_list(selector)]
+    if not compounds:
+        raise SelectorError("Selector is empty")
+    return compounds
+
+def _trigrams(text: str) -> Set[str]:
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+def _value_matches(op: str, value: str, query: str) -> bool:
+    if op == '=':
+        return value == query
+    if op == '*=':
+        return bool(query) and query in value
+    if op == '^=':
+        return bool(query) and value.startswith(query)
+    if op == '$=':
+        return bool(query) and value.endswith(query)
+    if op == '~=':
+        return query in value.split()
+    if op == '|=':
+        return value == query or value.startswith(query + '-')
+    return True
+
+class _FixtureParser(HTMLParser):
+    def __init__(self, index: 'FixtureIndex', fixture_id: int):
+        super().__init__(convert_charrefs=True)
+        self.index = index
+        self.fixture_id = fixture_id
+
+    def handle_starttag(self, tag, attrs):
+        values = {}
+        for name, value in attrs:
+            # Duplicate attributes: the first one wins, as in browsers
+            values.setdefault(name, value or '')
+        self.index.add_element(self.fixture_id, tag, values, self.getpos()[0])
+
+    handle_startendtag = handle_starttag
+
+class FixtureIndex:
+    """Element index over every fixture in a corpus"""
+
+    def __init__(self):
+        self.fixtures: List[str] = []
+        self.element_fixture: List[int] = []
+        self.element_tag: List[str] = []
+        self.element_attrs: List[Dict[str, str]] = []
+        self.element_line: List[int] = []
+        self.by_tag: Dict[str, Set[int]] = {}
+        self.with_attr: Dict[str, Set[int]] = {}
+        # attr -> value -> element ids, and attr -> trigram -> distinct values
+        self.by_value: Dict[str, Dict[str, List[int]]] = {}
+        self.value_grams: Dict[str, Dict[str, Set[str]]] = {}
+        self.parse_errors: List[Dict[str, str]] = []
+
+    @classmethod
+    def from_directory(cls, directory: str) -> 'FixtureIndex':
+        index = cls()
+        for file_path in sorted(str(p) for p in Path(directory).rglob('*')
+                                if p.suffix.lower() in FIXTURE_EXTENSIONS and p.is_file()):
+            index.add_fixture(file_path)
+        return index
+
+    def add_fixture(self, file_path: str) -> None:
+        fixture_id = len(self.fixtures)
+        self.fixtures.append(file_path)
+        try:
+            with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
+                parser = _FixtureParser(self, fixture_id)
+                parser.feed(f.read())
+                parser.close()
+        except OSError as e:
+            self.parse_errors.append({'file': file_path, 'reason': str(e)})
+
+    def add_element(self, fixture_id: int, tag: str, attrs: Dict[str, str], line: int) -> None:
+        element_id = len(self.element_tag)
+        self.element_fixture.append(fixture_id)
+        self.element_tag.append(tag)
+        self.element_attrs.append(attrs)
+        self.element_line.append(line)
+        self.by_tag.setdefault(tag, set()).add(element_id)
+        for name, value in attrs.items():
+            self.with_attr.setdefault(name, set()).add(element_id)
+            values = self.by_value.setdefault(name, {})
+            if value not in values:
+                values[value] = []
+                grams = self.value_grams.setdefault(name, {})
+                for gram in _trigrams(value):
+                    grams.setdefault(gram, set()).add(value)
+            values[value].append(element_id)
+
+    def _candidate_values(self, attr: str, query: str) -> List[str]:
+        """Distinct attribute values that can contain query, narrowed by trigrams"""
+        values = self.by_value.get(attr, {})
+        grams = _trigrams(query)
+        if not grams:
+            return list(values)
+        index = self.value_grams.get(attr, {})
+        candidates = None
+        for gram in sorted(grams, key=lambda g: len(index.get(g, ()))):
+            found = index.get(gram)
+            if not found:
+                return []
+            candidates = set(found) if candidates is None else candidates & found
+            if not candidates:
+                return []
+        return list(candidates)
+
+    def match_condition(self, condition: Condition) -> Set[int]:
+        attr, op, query = condition
+        if not op:
+            return self.with_attr.get(attr, set())
+        values = self.by_value.get(attr, {})
+        if op == '=':
+            return set(values.get(query, ()))
+        if op == '~=':
+            candidates = self._candidate_values(attr, query) if len(query) >= 3 else list(values)
+        else:
+            candidates = self._candidate_values(attr, query)
+        matched = set()
+        for value in candidates:
+            if _value_matches(op, value, query):
+                matched.update(values[value])
+        return matched
+
+    def match_compound(self, tag: Optional[str], conditions: List[Condition]) -> Set[int]:
+        sets = [self.match_condition(condition) for condition in conditions]
+        if tag is not None:
+            sets.append(self.by_tag.get(tag, set()))
+        if not sets:
+            return set(range(len(self.element_tag)))
+        sets.sort(key=len)
+        result = set(sets[0])
+        for other in sets[1:]:
+            if not result:
+                break
+            result &= other
+        return result
+
+    def select(self, selector: str) -> Set[int]:
+        """Element ids matched by a selector list across every fixture"""
+        matched = set()
+        for tag, conditions in parse_selector(selector):
+            matched |= self.match_compound(tag, conditions)
+        return matched
+
+    def describe_element(self, element_id: int) -> str:
+        attrs = self.element_attrs[element_id]
+        shown = ''.join(f' {name}="{attrs[name]}"' for name in ('name', 'id', 'type') if name in attrs)
+        fixture = self.fixtures[self.element_fixture[element_id]]
+        return f"<{self.element_tag[element_id]}{shown}> at {fixture}:{self.element_line[element_id]}"
+
+def skill_selectors(skill: Dict[str, Any]) -> Dict[str, str]:
+    """Field -> selector for a normalized skill, including its submit button"""
+    selectors = {field: selector for field, selector in skill['selectors'].items() if isinstance(selector, str)}
+    if isinstance(skill['submit_button'], str):
+        selectors[SUBMIT_FIELD] = skill['submit_button']
+    return selectors
+
+def evaluate_skill(index: FixtureIndex, skill: Dict[str, Any],
+                   min_coverage: float = DEFAULT_MIN_COVERAGE,
+                   memo: Optional[Dict[str, Tuple[Set[int], float]]] = None) -> Dict[str, Any]:
+    """Hits, misses, overlaps and timings for one skill's selectors"""
+    memo = {} if memo is None else memo
+    fields = []
+    field_fixtures: Dict[str, Set[int]] = {}
+    field_elements: Dict[str, Set[int]] = {}
+
+    for field, selector in skill_selectors(skill).items():
+        entry = {'field': field, 'selector': selector}
+        if selector not in memo:
+            start = time.perf_counter()
+            try:
+                elements = index.select(selector)
+            except SelectorError as e:
+                entry['error'] = str(e)
+                fields.append(entry)
+                continue
+            memo[selector] = (elements, time.perf_counter() - start)
+        elements, elapsed = memo[selector]
+        field_elements[field] = elements
+        field_fixtures[field] = {index.element_fixture[e] for e in elements}
+        entry['elements'] = len(elements)
+        entry['time_ms'] = round(elapsed * 1000, 4)
+        fields.append(entry)
+
+    # A fixture belongs to this skill when it hits enough of the skill's form fields
+    form_fields = [field for field in field_fixtures if field != SUBMIT_FIELD]
+    needed = max(1, math.ceil(len(form_fields) * min_coverage))
+    hits_per_fixture: Dict[int, int] = {}
+    for field in form_fields:
+        for fixture_id in field_fixtures[field]:
+            hits_per_fixture[fixture_id] = hits_per_fixture.get(fixture_id, 0) + 1
+    relevant = sorted(f for f, hits in hits_per_fixture.items() if hits >= needed)
+    relevant_set = set(relevant)
+
+    for entry in fields:
+        if 'error' in entry:
+            continue
+        hit = field_fixtures[entry['field']] & relevant_set
+        entry['hits'] = len(hit)
+        entry['misses'] = [index.fixtures[f] for f in relevant if f not in hit]
+
+    # Elements claimed by more than one field on the skill's own fixtures
+    claimed: Dict[int, List[str]] = {}
+    for field, elements in field_elements.items():
+        for element_id in elements:
+            if index.element_fixture[element_id] in relevant_set:
+                claimed.setdefault(element_id, []).append(field)
+    overlaps: Dict[Tuple[str, ...], Dict[str, Any]] = {}
+    for element_id, owners in sorted(claimed.items()):
+        if len(owners) > 1:
+            key = tuple(sorted(owners))
+            overlap = overlaps.setdefault(key, {'fields': list(key), 'elements': 0, 'example': index.describe_element(element_id)})
+            overlap['elements'] += 1
+
+    return {
+        'skill': skill['id'],
+        'source': skill['source'],
+        'fixtures': [index.fixtures[f] for f in relevant],
+        'fields': fields,
+        'overlaps': list(overlaps.values()),
+        'time_ms': round(sum(entry.get('time_ms', 0) for entry in fields), 4),
+    }
+
+def evaluate_catalog(fixtures_dir: str, skills: List[Dict[str, Any]],
+                     min_coverage: float = DEFAULT_MIN_COVERAGE) -> Dict[str, Any]:
+    """Index the fixtures once and evaluate every skill's selectors against them"""
+    start = time.perf_counter()
+    index = FixtureIndex.from_directory(fixtures_dir)
+    index_time = time.perf_counter() - start
+
+    memo: Dict[str, Tuple[Set[int], float]] = {}
+    start = time.perf_counter()
+    reports = [evaluate_skill(index, skill, min_coverage, memo) for skill in skills if skill_selectors(skill)]
+    eval_time = time.perf_counter() - start
+
+    return {
+        'fixtures': len(index.fixtures),
+        'elements': len(index.element_tag),
+        'index_ms': round(index_time * 1000, 3),
+        'eval_ms': round(eval_time * 1000, 3),
+        'parse_errors': index.parse_errors,
+        'skills': reports,
+    }
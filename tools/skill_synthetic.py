@@ -0,0 +1,145 @@
+"""
+Synthetic skill catalogs for benchmarking the tooling
+
+The repo ships five form templates, which is too few to see how the tooling
+scales. This module builds catalogs of any size out of the real ones: every
+prompt in skills/forms (with its validation regex, options and format), its
+form selector and its postprocess actions goes into a pool per language, and
+each synthetic template draws from that pool.
+
+- prompt counts follow the real templates (12 to 22 prompts)
+- languages follow the real mix, so Spanish templates get Spanish prompts
+- every template gets the selectors and postprocess actions of the fields it
+  drew (plus any field a drawn prompt depends on), a submit button, and two
+  or three voice command triggers that are unique across the catalog, none
+  a prefix of another (the real catalog has no collisions either)
+
+Templates are a pure function of (seed, index), so template i is the same in
+every catalog size and the smaller catalogs can be hard links into the
+largest one.
+"""
+
+import os
+import random
+from pathlib import Path
+from typing import Dict, List, Any, Iterable
+
+import yaml
+
+from skill_catalog import SKILLS_DIR, find_skill_files
+
+FORMS_DIR = SKILLS_DIR / 'forms'
+
+DEFAULT_SEED = 1729
+
+_Dumper = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+
+# Words for template names and triggers; index digits are spelled out so
+# triggers stay speakable phrases rather than numbers
+_TOPICS = ['benefits', 'housing', 'insurance', 'enrollment', 'permit', 'clinic', 'school', 'utility',
+           'pharmacy', 'vehicle', 'pension', 'childcare', 'rental', 'voter', 'license', 'grant']
+_DIGITS = ['zero', 'one', 'two', 'three', 'four', 'five', 'six', 'seven', 'eight', 'nine']
+_VERBS = ['fill', 'complete', 'start']
+
+class TemplatePool:
+    """Prompts, selectors and postprocess actions collected from real templates"""
+
+    def __init__(self, paths: Iterable[str] = (str(FORMS_DIR),)):
+        self.prompts: Dict[str, List[Dict[str, Any]]] = {}
+        self.selectors: Dict[str, str] = {}
+        self.postprocess: Dict[str, List[Dict[str, Any]]] = {}
+        self.prompt_counts: List[int] = []
+        self.languages: List[str] = []
+        self.categories: List[str] = []
+        self.submit_buttons: List[str] = []
+
+        for file_path in find_skill_files(paths):
+            with open(file_path, 'r', encoding='utf-8') as f:
+                data = yaml.safe_load(f)
+            if not isinstance(data, dict) or not isinstance(data.get('prompts'), list):
+                continue
+            language = data.get('language', 'en')
+            self.languages.append(language)
+            self.prompt_counts.append(len(data['prompts']))
+            self.categories.append(data.get('category', 'government'))
+
+            seen = {prompt['field'] for prompt in self.prompts.get(language, [])}
+            for prompt in data['prompts']:
+                if isinstance(prompt, dict) and prompt.get('field') not in seen:
+                    seen.add(prompt['field'])
+                    self.prompts.setdefault(language, []).append(prompt)
+
+            for action in data.get('postprocess') or []:
+                self.postprocess.setdefault(action.get('field'), []).append(action)
+            accessibility = data.get('accessibility') or {}
+            for field, selector in (accessibility.get('form_selectors') or {}).items():
+                self.selectors.setdefault(field, selector)
+            if accessibility.get('submit_button'):
+                self.submit_buttons.append(accessibility['submit_button'])
+
+        if not self.prompts:
+            raise ValueError(f"No form templates with prompts in {', '.join(paths)}")
+
+    def template(self, index: int, seed: int = DEFAULT_SEED) -> Dict[str, Any]:
+        """Synthetic template number `index`"""
+        rng = random.Random(seed * 1_000_003 + index)
+        language = rng.choice(self.languages)
+        pool = self.prompts.get(language) or next(iter(self.prompts.values()))
+        count = min(len(pool), rng.choice(self.prompt_counts))
+        chosen = set(rng.sample(range(len(pool)), count))
+        # Keep the fields a drawn prompt depends on, and the shipped order
+        positions = {prompt['field']: position for position, prompt in enumerate(pool)}
+        for position in list(chosen):
+            depends_on = pool[position].get('depends_on')
+            if depends_on in positions:
+                chosen.add(positions[depends_on])
+        prompts = [pool[position] for position in sorted(chosen)]
+        fields = [prompt['field'] for prompt in prompts]
+
+        topic = rng.choice(_TOPICS)
+        skill_id = f"synthetic_{topic}_{index:06d}"
+        spoken = ' '.join(_DIGITS[int(digit)] for digit in str(index))
+        verbs = rng.sample(_VERBS, rng.choice((2, 3)))
+
+        return {
+            'id': skill_id,
+            'language': language,
+            'name': f"Synthetic {topic.title()} Form {index}",
+            'description': f"Synthetic {topic} form built from the shipped templates for benchmarking",
+            'version': '1.0',
+            'category': rng.choice(self.categories),
+            'prompts': [dict(prompt) for prompt in prompts],
+            'postprocess': [dict(action) for field in fields for action in self.postprocess.get(field, [])],
+            'accessibility': {
+                'form_selectors': {field: self.selectors[field] for field in fields if field in self.selectors},
+                'submit_button': rng.choice(self.submit_buttons) if self.submit_buttons else "button[type='submit']",
+            },
+            'commands': [
+                {'trigger': f"{verb} form {spoken} for {topic}", 'action': 'execute_skill', 'skill': skill_id}
+                for verb in verbs
+            ],
+        }
+
+def template_yaml(template: Dict[str, Any]) -> str:
+    return yaml.dump(template, Dumper=_Dumper, sort_keys=False, allow_unicode=True, width=1000)
+
+def write_catalog(pool: TemplatePool, directory, size: int, seed: int = DEFAULT_SEED,
+                  source_dir=None) -> List[str]:
+    """Write templates 0..size-1 into directory; files already in source_dir are hard-linked"""
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    files = []
+    for index in range(size):
+        name = f"synthetic_{index:06d}.yaml"
+        path = directory / name
+        files.append(str(path))
+        if path.exists():
+            continue
+        if source_dir is not None and (Path(source_dir) / name).exists():
+            try:
+                os.link(Path(source_dir) / name, path)
+                continue
+            except OSError:
+                pass
+        path.write_text(template_yaml(pool.template(index, seed)), encoding='utf-8')
+    return files
@@ -0,0 +1,188 @@
+"""
+Cross-skill voice command trigger index
+
+Builds one Aho-Corasick automaton over the normalized, tokenized command
+triggers of every skill in every language. The app can load the exported
+index and find every trigger contained in an utterance in a single pass over
+its tokens, instead of scanning each skill's commands with `contains` the way
+`findSkillByCommand` does today. The linter runs the same automaton over the
+triggers themselves to report collisions between skills:
+
+- duplicate: two skills share the same trigger
+- prefix: a trigger is the start of another skill's trigger
+- substring: a trigger appears inside another skill's trigger
+
+Matching is by whole tokens, so "fill tax form" does not fire inside
+"fill tax formulary".
+"""
+
+from collections import deque
+from typing import Dict, List, Any, Iterable, Tuple
+
+from skill_catalog import normalize_trigger
+
+INDEX_FORMAT = 'voicebridge-trigger-index'
+INDEX_VERSION = 1
+
+# In-form phrases from asset templates; they never select a skill
+FIELD_ACTIONS = {'fill_fields', 'navigate'}
+
+DUPLICATE = 'duplicate'
+PREFIX = 'prefix'
+SUBSTRING = 'substring'
+
+def tokenize(text: str) -> List[str]:
+    return normalize_trigger(text).split(' ') if text.strip() else []
+
+class TriggerIndex:
+    """Token-level Aho-Corasick automaton over skill triggers"""
+
+    def __init__(self):
+        self.tokens: Dict[str, int] = {}
+        self.triggers: List[Dict[str, Any]] = []
+        # Per node: child edges by token id, failure link, trigger ids ending here
+        self.children: List[Dict[int, int]] = [{}]
+        self.fail: List[int] = [0]
+        self.outputs: List[List[int]] = [[]]
+        self._built = False
+
+    @classmethod
+    def from_skills(cls, skills: Iterable[Dict[str, Any]]) -> 'TriggerIndex':
+        index = cls()
+        for skill in skills:
+            for command in skill['commands']:
+                if command['action'] not in FIELD_ACTIONS:
+                    index.add(command['trigger'], command['skill'] or skill['id'], skill['language'], skill['source'])
+        index.build()
+        return index
+
+    def add(self, trigger: str, skill_id: str, language: str, source: str = '') -> None:
+        words = tokenize(trigger)
+        if not words:
+            return
+        node = 0
+        for word in words:
+            token = self.tokens.setdefault(word, len(self.tokens))
+            child = self.children[node].get(token)
+            if child is None:
+                child = len(self.children)
+                self.children[node][token] = child
+                self.children.append({})
+                self.fail.append(0)
+                self.outputs.append([])
+            node = child
+        self.outputs[node].append(len(self.triggers))
+        self.triggers.append({
+            'trigger': ' '.join(words),
+            'length': len(words),
+            'skill': skill_id,
+            'language': language,
+            'source': source,
+            'node': node,
+        })
+        self._built = False
+
+    def build(self) -> None:
+        """Compute failure links breadth-first and merge suffix outputs"""
+        queue = deque()
+        for child in self.children[0].values():
+            self.fail[child] = 0
+            queue.append(child)
+        while queue:
+            node = queue.popleft()
+            for token, child in self.children[node].items():
+                fallback = self.fail[node]
+                while fallback and token not in self.children[fallback]:
+                    fallback = self.fail[fallback]
+                target = self.children[fallback].get(token, 0)
+                self.fail[child] = target if target != child else 0
+                self.outputs[child] = self.outputs[child] + self.outputs[self.fail[child]]
+                queue.append(child)
+        self._built = True
+
+    def _scan(self, words: List[str]) -> Iterable[Tuple[int, int]]:
+        """Yield (end position, trigger id) for every trigger found in words"""
+        if not self._built:
+            self.build()
+        node = 0
+        for position, word in enumerate(words):
+            token = self.tokens.get(word)
+            if token is None:
+                node = 0
+                continue
+            while node and token not in self.children[node]:
+                node = self.fail[node]
+            node = self.children[node].get(token, 0)
+            for trigger_id in self.outputs[node]:
+                yield position, trigger_id
+
+    def find(self, words: List[str]) -> List[Tuple[int, int, int]]:
+        """(first position, last position, trigger id) of every trigger in a token list"""
+        return [(end - self.triggers[trigger_id]['length'] + 1, end, trigger_id)
+                for end, trigger_id in self._scan(words)]
+
+    def match(self, utterance: str) -> List[Dict[str, Any]]:
+        """Every trigger contained in the utterance, longest first"""
+        found = {}
+        for _, trigger_id in self._scan(tokenize(utterance)):
+            found[trigger_id] = self.triggers[trigger_id]
+        return sorted(found.values(), key=lambda trigger: -trigger['length'])
+
+    def collisions(self) -> List[Dict[str, Any]]:
+        """Duplicate, prefix and substring overlaps between different skills"""
+        found = []
+        seen = set()
+        for owner_id, owner in enumerate(self.triggers):
+            words = owner['trigger'].split(' ')
+            for end, other_id in self._scan(words):
+                other = self.triggers[other_id]
+                if other_id == owner_id or other['skill'] == owner['skill']:
+                    continue
+                if other['length'] == owner['length']:
+                    kind = DUPLICATE
+                    key = (kind,) + tuple(sorted((owner_id, other_id)))
+                elif end - other['length'] + 1 == 0:
+                    kind = PREFIX
+                    key = (kind, other_id, owner_id)
+                else:
+                    kind = SUBSTRING
+                    key = (kind, other_id, owner_id)
+                if key in seen:
+                    continue
+                seen.add(key)
+                found.append({
+                    'kind': kind,
+                    'trigger': other['trigger'],
+                    'skill': other['skill'],
+                    'source': other['source'],
+                    'shadows': owner['trigger'],
+                    'shadowed_skill': owner['skill'],
+                    'shadowed_source': owner['source'],
+                })
+        return found
+
+    def export(self) -> Dict[str, Any]:
+        """Serializable form of the automaton for the app"""
+        if not self._built:
+            self.build()
+        vocabulary = sorted(self.tokens, key=self.tokens.get)
+        return {
+            'format': INDEX_FORMAT,
+            'version': INDEX_VERSION,
+            'tokens': vocabulary,
+            'triggers': [[t['trigger'], t['skill'], t['language']] for t in self.triggers],
+            # [failure link, {token id: child}, [trigger ids]] per node; node 0 is the root
+            'nodes': [
+                [self.fail[node], {str(token): child for token, child in self.children[node].items()}, self.outputs[node]]
+                for node in range(len(self.children))
+            ],
+        }
+
+def describe_collision(collision: Dict[str, Any]) -> str:
+    if collision['kind'] == DUPLICATE:
+        return (f"Trigger '{collision['trigger']}' duplicates the same trigger in skill "
+                f"'{collision['shadowed_skill']}' ({collision['shadowed_source']})")
+    where = "starts" if collision['kind'] == PREFIX else "appears inside"
+    return (f"Trigger '{collision['trigger']}' {where} trigger '{collision['shadows']}' of skill "
+            f"'{collision['shadowed_skill']}' ({collision['shadowed_source']}), so saying the longer "
+            f"command also matches this skill")
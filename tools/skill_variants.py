@@ -0,0 +1,160 @@
+"""
+Cross-language variant families
+
+The same form ships once per language (florida_snap_renewal in English,
+florida_snap_renovation_es in Spanish). Variants of one form make a family:
+a skill joins the family named by its `variant_of` key, or else the family of
+its id with a trailing language suffix removed (`intake_es` -> `intake`).
+
+Every variant is reduced to its language-independent structure: the ordered
+field list and, per field, type, required flag, validation regex, format,
+min/max, option count, depends_on, whether it has a show_when, postprocess
+actions and form selector, plus the submit button and target app. Prompts,
+hints and option labels are translated, so they are left out.
+
+A family is checked in one pass over its variants: variants are bucketed by
+structure hash, and when they disagree each field's majority signature (ties
+go to the English variant) becomes the reference. The cost is linear in the
+total number of fields, however many languages a family has.
+"""
+
+import hashlib
+from collections import Counter
+from typing import Dict, List, Any, Iterable, Tuple
+
+REFERENCE_LANGUAGE = 'en'
+
+# Per-field signature layout; names are used to say what diverged
+SIGNATURE_KEYS = ('type', 'required', 'validation', 'format', 'min', 'max', 'options',
+                  'depends_on', 'show_when', 'postprocess', 'selector')
+
+def family_key(skill: Dict[str, Any]) -> str:
+    if skill.get('variant_of'):
+        return skill['variant_of']
+    skill_id = skill['id']
+    suffix = f"_{skill['language']}"
+    if skill['language'] != REFERENCE_LANGUAGE and skill_id.endswith(suffix):
+        return skill_id[:-len(suffix)]
+    return skill_id
+
+def field_signatures(skill: Dict[str, Any]) -> Tuple[List[str], Dict[str, Tuple[Any, ...]]]:
+    """Ordered field names and their language-independent signatures"""
+    postprocess: Dict[str, List[Tuple[Any, ...]]] = {}
+    for action in skill['postprocess']:
+        postprocess.setdefault(action['field'], []).append((action['action'], action['format'], action['pattern']))
+
+    order = []
+    signatures = {}
+    for prompt in skill['prompts']:
+        field = prompt['field']
+        if field in signatures:
+            continue  # duplicate fields are reported by the validator
+        order.append(field)
+        signatures[field] = (
+            prompt['type'], prompt['required'], prompt['validation'], prompt['format'],
+            prompt['min'], prompt['max'], len(prompt['options']), prompt['depends_on'],
+            prompt['show_when'] is not None, tuple(postprocess.get(field, ())),
+            skill['selectors'].get(field),
+        )
+    return order, signatures
+
+class Variant:
+    __slots__ = ('skill', 'order', 'signatures', 'digest')
+
+    def __init__(self, skill: Dict[str, Any]):
+        self.skill = skill
+        self.order, self.signatures = field_signatures(skill)
+        structure = (tuple(self.order), tuple(self.signatures[field] for field in self.order),
+                     skill['submit_button'], skill['target_app'])
+        self.digest = hashlib.blake2b(repr(structure).encode('utf-8'), digest_size=8).hexdigest()
+
+def check_family(name: str, skills: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Compare every variant of one family against the family's majority structure"""
+    variants = [Variant(skill) for skill in skills]
+    report = {
+        'family': name,
+        'languages': [variant.skill['language'] for variant in variants],
+        'consistent': len({variant.digest for variant in variants}) == 1,
+        'duplicate_languages': sorted(language for language, count
+                                      in Counter(v.skill['language'] for v in variants).items() if count > 1),
+        'variants': [],
+    }
+    if report['consistent']:
+        report['variants'] = [{'skill': v.skill['id'], 'language': v.skill['language'], 'source': v.skill['source'],
+                               'hash': v.digest, 'missing': [], 'diverged': [], 'order_differs': False}
+                              for v in variants]
+        return report
+
+    reference = next((v for v in variants if v.skill['language'] == REFERENCE_LANGUAGE), variants[0])
+
+    # One pass: which variants have each field, and the most common signature
+    union: Dict[str, List[Variant]] = {}
+    counts: Dict[str, Counter] = {}
+    for variant in variants:
+        for field in variant.order:
+            union.setdefault(field, []).append(variant)
+            counts.setdefault(field, Counter())[variant.signatures[field]] += 1
+
+    majority = {}
+    for field, counter in counts.items():
+        best = max(counter.values())
+        preferred = reference.signatures.get(field)
+        majority[field] = preferred if counter.get(preferred) == best else counter.most_common(1)[0][0]
+
+    reference_order = [field for field in union if field in reference.signatures] or list(union)
+    for variant in variants:
+        missing = [
+            {'field': field, 'present_in': [owner.skill['language'] for owner in owners]}
+            for field, owners in union.items() if field not in variant.signatures
+        ]
+        diverged = []
+        for field in variant.order:
+            signature = variant.signatures[field]
+            if signature != majority[field]:
+                attributes = [key for key, own, expected in zip(SIGNATURE_KEYS, signature, majority[field])
+                              if own != expected]
+                diverged.append({'field': field, 'attributes': attributes})
+        common = [field for field in variant.order if field in reference.signatures]
+        expected = [field for field in reference_order if field in variant.signatures]
+        report['variants'].append({
+            'skill': variant.skill['id'],
+            'language': variant.skill['language'],
+            'source': variant.skill['source'],
+            'hash': variant.digest,
+            'missing': missing,
+            'diverged': diverged,
+            'order_differs': variant is not reference and common != expected,
+        })
+    return report
+
+def check_variants(skills: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Group skills into families and check every family with more than one variant"""
+    families: Dict[str, List[Dict[str, Any]]] = {}
+    for skill in skills:
+        if skill['schema'] == 'form':
+            families.setdefault(family_key(skill), []).append(skill)
+    return [check_family(name, members) for name, members in sorted(families.items()) if len(members) > 1]
+
+def describe_variant(family: str, variant: Dict[str, Any]) -> List[str]:
+    """Lint messages for one variant of a family"""
+    messages = []
+    for entry in variant['missing']:
+        messages.append(f"Variant of '{family}' is missing field '{entry['field']}' "
+                        f"(present in {', '.join(entry['present_in'])})")
+    for entry in variant['diverged']:
+        messages.append(f"Field '{entry['field']}' diverges from the other '{family}' variants on "
+                        f"{', '.join(entry['attributes'])}")
+    if variant['order_differs']:
+        messages.append(f"Prompt order differs from the other '{family}' variants")
+    return messages
+
+def variant_messages(skills: Iterable[Dict[str, Any]], strict: bool = False) -> Dict[str, Tuple[List[str], List[str]]]:
+    """Variant drift as lint messages keyed by skill source; warnings unless strict"""
+    messages: Dict[str, Tuple[List[str], List[str]]] = {}
+    for report in check_variants(skills):
+        for variant in report['variants']:
+            found = describe_variant(report['family'], variant)
+            if found:
+                errors, warnings = messages.setdefault(variant['source'], ([], []))
+                (errors if strict else warnings).extend(found)
+    return messages
@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+VoiceBridge Tooling Benchmark (tooling-bench)
+
+Device-free counterpart of scripts/benchmark.sh: times the Python tooling
+instead of the app. Skill validation runs on synthetic catalogs (see
+skill_synthetic.py) from 10 to 50,000 templates, so the numbers show how
+the lint scales rather than how fast five files are:
+
+- SkillValidator.validate_file per file, median over a sample of the catalog
+- validate_directory over the whole catalog: plain, with the trigger
+  collision check, and with the incremental cache (filling it, then replaying)
+- the launcher icons: master render, then every density, and PNG encoding
+- every store graphic
+
+Results are JSON files in benchmark-results/<YYYYmmdd-HHMMSS>/, the layout
+benchmark.sh uses for the device numbers; pass --date to write into the same
+run as benchmark.sh (it does so for `benchmark.sh --tooling`).
+
+Usage:
+    python tooling-bench.py
+    python tooling-bench.py --sizes 10,100,1000 --skip-assets
+    python tooling-bench.py --date 20250101-120000 --jobs 4
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import platform
+import tempfile
+import statistics
+import subprocess
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Any, Callable
+
+import yaml
+
+from skill_catalog import TOOLS_DIR, REPO_ROOT, load_skill_lint
+from skill_synthetic import DEFAULT_SEED, TemplatePool, write_catalog
+
+RESULTS_DIR = REPO_ROOT / 'benchmark-results'
+DATE_FORMAT = '%Y%m%d-%H%M%S'  # benchmark.sh's $BENCHMARK_DATE
+
+DEFAULT_SIZES = [10, 100, 1000, 10000, 50000]
+
+def median_ms(run: Callable[[], Any], repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1000
+
+def timed(run: Callable[[], Any]):
+    """Result of one call and its duration in seconds"""
+    start = time.perf_counter()
+    result = run()
+    return result, time.perf_counter() - start
+
+def tooling_info(date: str) -> Dict[str, Any]:
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=REPO_ROOT,
+                                capture_output=True, text=True, timeout=10).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        commit = None
+    info = {
+        'benchmark_date': date,
+        'commit': commit,
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'cpu_count': os.cpu_count(),
+        'pyyaml': yaml.__version__,
+        'libyaml': hasattr(yaml, 'CSafeLoader'),
+    }
+    for key, module in (('pillow', 'PIL'), ('numpy', 'numpy')):
+        try:
+            info[key] = __import__(module).__version__
+        except ImportError:
+            info[key] = None
+    return info
+
+def bench_validation(sizes: List[int], work_dir: Path, sample: int, repeat: int, jobs: int,
+                     seed: int) -> Dict[str, Any]:
+    lint = load_skill_lint()
+    pool = TemplatePool()
+    validator = lint.SkillValidator()
+    results = {'seed': seed, 'sample': sample, 'repeat': repeat, 'jobs': jobs, 'catalogs': []}
+
+    # The largest catalog is written first; the smaller ones hard-link into it
+    largest = work_dir / f"catalog-{max(sizes)}"
+    for size in sorted(sizes, reverse=True):
+        directory = work_dir / f"catalog-{size}"
+        files, generate_s = timed(lambda: write_catalog(pool, directory, size, seed,
+                                                        None if directory == largest else largest))
+        catalog_bytes = sum(os.path.getsize(file_path) for file_path in files)
+        print(f"📁 {size:>6} templates ({catalog_bytes / 1024 / 1024:.1f} MB) generated in {generate_s:.1f}s")
+
+        sampled = files[:sample]
+        per_file_ms = median_ms(lambda: [validator.validate_file(file_path) for file_path in sampled], repeat)
+        per_file_us = per_file_ms * 1000 / len(sampled)
+
+        report, directory_s = timed(lambda: lint.validate_directory(str(directory)))
+        _, triggers_s = timed(lambda: lint.validate_directory(str(directory), check_triggers=True))
+        cache_path = str(work_dir / f"lint-cache-{size}.json")
+        _, cache_fill_s = timed(lambda: lint.validate_directory(str(directory), cache=lint.ValidationCache(cache_path)))
+        _, cached_s = timed(lambda: lint.validate_directory(str(directory), cache=lint.ValidationCache(cache_path)))
+        catalog = {
+            'templates': size,
+            'bytes': catalog_bytes,
+            'generate_s': round(generate_s, 3),
+            'validate_file_us': round(per_file_us, 1),
+            'validate_directory_s': round(directory_s, 3),
+            'validate_directory_per_file_us': round(directory_s / size * 1e6, 1),
+            'check_triggers_s': round(triggers_s, 3),
+            'cache_fill_s': round(cache_fill_s, 3),
+            'cached_s': round(cached_s, 3),
+            'valid_files': report['valid_files'],
+            'files_with_errors': report['files_with_errors'],
+            'files_with_warnings': report['files_with_warnings'],
+        }
+        if jobs > 1:
+            _, parallel_s = timed(lambda: lint.validate_directory(str(directory), jobs=jobs))
+            catalog['validate_directory_parallel_s'] = round(parallel_s, 3)
+        results['catalogs'].append(catalog)
+
+        status = "✅" if report['files_with_errors'] == 0 else "❌"
+        print(f"{status} validate_file {per_file_us:8.1f} µs   validate_directory {directory_s:8.2f}s "
+              f"(triggers {triggers_s:.2f}s, cached {cached_s:.2f}s)")
+
+    results['catalogs'].sort(key=lambda catalog: catalog['templates'])
+    return results
+
+def bench_icons(repeat: int) -> Dict[str, Any]:
+    sys.path.insert(0, str(TOOLS_DIR / 'icon-generator'))
+    import logo_scene
+    import generate_icons
+    from asset_cache import png_bytes
+
+    master_ms = []
+    render_ms: Dict[str, List[float]] = {density: [] for density in generate_icons.ICON_SIZES}
+    for _ in range(repeat):
+        # Every pass starts from a cold master, as a generate_icons.py run does
+        logo_scene.chain.cache_clear()
+        _, seconds = timed(lambda: logo_scene.chain('logo'))
+        master_ms.append(seconds * 1000)
+        for density, size in generate_icons.ICON_SIZES.items():
+            _, seconds = timed(lambda: generate_icons.render_voice_bridge_icon(size))
+            render_ms[density].append(seconds * 1000)
+
+    densities = {}
+    for density, size in generate_icons.ICON_SIZES.items():
+        icon = generate_icons.render_voice_bridge_icon(size)
+        densities[density] = {
+            'size': size,
+            'render_ms': round(statistics.median(render_ms[density]), 3),
+            'encode_ms': round(median_ms(lambda: png_bytes(icon), repeat), 3),
+        }
+    total = statistics.median(master_ms) + sum(entry['render_ms'] for entry in densities.values())
+    results = {'repeat': repeat, 'master_size': logo_scene.MASTER_SIZE,
+               'master_ms': round(statistics.median(master_ms), 3), 'densities': densities,
+               'total_ms': round(total, 3)}
+    print(f"🎨 Launcher icons: master {results['master_ms']:.1f} ms, all densities {total:.1f} ms")
+    return results
+
+def bench_store_graphics(repeat: int) -> Dict[str, Any]:
+    sys.path.insert(0, str(TOOLS_DIR / 'graphics-generator'))
+    import generate_store_graphics
+
+    graphics = []
+    for name, function, params in generate_store_graphics.GRAPHICS:
+        image = function(**params)  # warm fonts and the logo mark
+        graphics.append({
+            'file': name,
+            'size': list(image.size),
+            'render_ms': round(median_ms(lambda: function(**params), repeat), 3),
+        })
+        print(f"🖼️  {name:<26} {graphics[-1]['render_ms']:8.1f} ms")
+    return {'repeat': repeat, 'backend': generate_store_graphics.BACKEND, 'graphics': graphics,
+            'total_ms': round(sum(graphic['render_ms'] for graphic in graphics), 3)}
+
+def write_result(directory: Path, name: str, data: Dict[str, Any]) -> None:
+    with open(directory / name, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2)
+        f.write('\n')
+
+def parse_sizes(text: str) -> List[int]:
+    try:
+        sizes = sorted({int(size) for size in text.split(',') if size.strip()})
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid catalog sizes '{text}'")
+    if not sizes or sizes[0] < 1:
+        raise argparse.ArgumentTypeError("catalog sizes must be positive")
+    return sizes
+
+def main():
+    parser = argparse.ArgumentParser(description='VoiceBridge Tooling Benchmark')
+    parser.add_argument('--sizes', type=parse_sizes, default=DEFAULT_SIZES,
+                        help='Comma-separated synthetic catalog sizes (default 10,100,1000,10000,50000)')
+    parser.add_argument('--sample', type=int, default=100, help='Templates timed with validate_file per catalog')
+    parser.add_argument('--repeat', type=int, default=5, help='Timed passes for the per-file and rendering medians')
+    parser.add_argument('--jobs', '-j', type=int, default=1, help='Also time validate_directory with N worker processes')
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED, help='Seed of the synthetic catalogs')
+    parser.add_argument('--results-dir', default=str(RESULTS_DIR), help='Directory holding the dated result runs')
+    parser.add_argument('--date', default=datetime.now().strftime(DATE_FORMAT),
+                        help="Run directory name, e.g. benchmark.sh's $BENCHMARK_DATE")
+    parser.add_argument('--work-dir', help='Where to write the synthetic catalogs (default: a temporary directory)')
+    parser.add_argument('--keep', action='store_true', help='Keep the temporary synthetic catalogs after the run')
+    parser.add_argument('--skip-validation', action='store_true', help='Skip the skill validation benchmark')
+    parser.add_argument('--skip-assets', action='store_true', help='Skip icon and store graphic rendering')
+
+    args = parser.parse_args()
+
+    output_dir = Path(args.results_dir) / args.date
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    print(f"⏱️  VoiceBridge tooling benchmark {args.date}")
+    print(f"━" * 50)
+    write_result(output_dir, 'tooling_info.json', tooling_info(args.date))
+
+    if not args.skip_validation:
+        work_dir = Path(args.work_dir) if args.work_dir else Path(tempfile.mkdtemp(prefix='voicebridge-bench-'))
+        try:
+            results = bench_validation(args.sizes, work_dir, max(1, args.sample), max(1, args.repeat),
+                                       args.jobs, args.seed)
+        finally:
+            # Only the temporary directory is ours to remove
+            if not args.work_dir and not args.keep:
+                shutil.rmtree(work_dir, ignore_errors=True)
+        write_result(output_dir, 'skill_validation.json', results)
+
+    if not args.skip_assets:
+        write_result(output_dir, 'icon_rendering.json', bench_icons(max(1, args.repeat)))
+        write_result(output_dir, 'store_graphics.json', bench_store_graphics(max(1, args.repeat)))
+
+    print(f"━" * 50)
+    print(f"📊 Results in {output_dir}")
+
+if __name__ == '__main__':
+    main()